@@ -1,5 +1,6 @@
 """Entry point for AutoGodPack."""
 
+import atexit
 import sys
 import signal
 from pathlib import Path
@@ -34,9 +35,13 @@ def main() -> None:
     # Initialize bot
     bot = BattleBot(settings, project_root)
 
+    # Close the persistent ADB shell on any exit path
+    atexit.register(bot.shutdown)
+
     # Setup signal handlers for graceful shutdown
     def signal_handler(sig, frame):
         print("\nReceived interrupt signal, shutting down...")
+        bot.shutdown()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
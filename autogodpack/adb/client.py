@@ -1,14 +1,33 @@
 """ADB client wrapper for device communication."""
 
+import os
+import re
+import select
+import socket
 import subprocess
+import time
+import threading
 import logging
-from typing import Optional, List
+from contextlib import contextmanager
+from typing import Iterator, Optional, List, Tuple
 
 from ..utils.exceptions import ADBError
 from ..config.settings import ADBConfig
 
 logger = logging.getLogger(__name__)
 
+# Sentinel printed after every command sent to the persistent shell: \x1e<rc>\x1e
+_SENTINEL_RE = re.compile(rb"\x1e(\d+)\x1e")
+_SENTINEL_SUFFIX = "; printf '\\036%d\\036\\n' $?\n"
+_SENTINEL_MARK = b"\x1e"
+# select.poll() does not exist on Windows; fall back to readline() there
+_HAS_POLL = hasattr(select, "poll")
+_READ_CHUNK = 4096
+
+# Local adb server (smart socket) used to reach device services without forking adb
+_ADB_SERVER_HOST = "127.0.0.1"
+_ADB_SERVER_PORT = int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037"))
+
 
 class ADBClient:
     """ADB client for executing commands on Android devices."""
@@ -23,14 +42,25 @@ class ADBClient:
         self.config = config
         self.serial = config.serial
         self.timeout = config.command_timeout
+        # Long-lived `adb shell` used for input commands (created lazily)
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_lock = threading.Lock()
+        self._poll = None
+        self._rxbuf = bytearray()
+        # Commands sent with execute_shell_async() whose completion is not yet read
+        self._pending = 0
 
-    def execute(self, args: List[str], capture_output: bool = True) -> subprocess.CompletedProcess:
+    def execute(
+        self, args: List[str], capture_output: bool = True, discard_output: bool = False
+    ) -> subprocess.CompletedProcess:
         """
         Execute an ADB command.
 
         Args:
             args: ADB command arguments (without 'adb' prefix).
             capture_output: Whether to capture stdout/stderr.
+            discard_output: Send stdout/stderr to DEVNULL when only the
+                return code is needed (no pipes are allocated).
 
         Returns:
             CompletedProcess object with command result.
@@ -40,11 +70,17 @@ class ADBClient:
         """
         cmd = ["adb", "-s", self.serial] + args
 
+        if discard_output:
+            stdout = stderr = subprocess.DEVNULL
+        else:
+            stdout = subprocess.PIPE if capture_output else None
+            stderr = subprocess.PIPE
+
         try:
             result = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE if capture_output else None,
-                stderr=subprocess.PIPE,
+                stdout=stdout,
+                stderr=stderr,
                 timeout=self.timeout,
             )
             return result
@@ -53,6 +89,399 @@ class ADBClient:
         except Exception as e:
             raise ADBError(f"Failed to execute ADB command: {' '.join(cmd)}") from e
 
+    def _spawn_shell(self) -> subprocess.Popen:
+        """Start the persistent `adb shell` process."""
+        cmd = ["adb", "-s", self.serial, "shell"]
+        try:
+            shell = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        except Exception as e:
+            raise ADBError(f"Failed to start ADB shell: {' '.join(cmd)}") from e
+
+        self._rxbuf = bytearray()
+        if _HAS_POLL:
+            self._poll = select.poll()
+            self._poll.register(shell.stdout.fileno(), select.POLLIN)
+        return shell
+
+    def _kill_shell(self) -> None:
+        """Terminate the persistent shell without waiting for pending output."""
+        shell = self._shell
+        self._shell = None
+        self._poll = None
+        self._rxbuf = bytearray()
+        self._pending = 0
+        if shell is None:
+            return
+        try:
+            shell.kill()
+            shell.wait(timeout=2)
+        except Exception:
+            pass
+
+    def _take_completion(self) -> Optional[Tuple[int, str]]:
+        """Pop the first completed command from the receive buffer, if any."""
+        buf = self._rxbuf
+        pos = buf.find(_SENTINEL_MARK)
+        while pos != -1:
+            match = _SENTINEL_RE.match(buf, pos)
+            if match:
+                end = match.end()
+                if buf[end:end + 1] == b"\n":
+                    end += 1
+                returncode = int(match.group(1))
+                output = bytes(buf[:pos])
+                del buf[:end]
+                return returncode, output.decode("utf-8", errors="ignore")
+            pos = buf.find(_SENTINEL_MARK, pos + 1)
+        return None
+
+    def _poll_until_sentinel(
+        self, shell: subprocess.Popen, cmdline: str, timeout: float
+    ) -> Tuple[int, str]:
+        """Reap shell output with poll()/os.read() until the sentinel is seen."""
+        fd = shell.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        while True:
+            completion = self._take_completion()
+            if completion is not None:
+                return completion
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._poll.poll(remaining * 1000):
+                raise ADBError(f"ADB shell command timed out after {timeout}s: {cmdline}")
+            chunk = os.read(fd, _READ_CHUNK)
+            if not chunk:
+                raise ADBError(f"ADB shell closed unexpectedly (device={self.serial})")
+            self._rxbuf += chunk
+
+    def _read_until_sentinel(self, shell: subprocess.Popen) -> Tuple[int, str]:
+        """Read shell output until the return-code sentinel is seen."""
+        output = b""
+        while True:
+            line = shell.stdout.readline()
+            if not line:
+                raise ADBError(f"ADB shell closed unexpectedly (device={self.serial})")
+            match = _SENTINEL_RE.search(line)
+            if match:
+                output += line[: match.start()]
+                return int(match.group(1)), output.decode("utf-8", errors="ignore")
+            output += line
+
+    def _ensure_shell(self) -> subprocess.Popen:
+        """Return the persistent shell, (re)starting it if needed. Caller holds the lock."""
+        if self._shell is None or self._shell.poll() is not None:
+            self._kill_shell()
+            self._shell = self._spawn_shell()
+        return self._shell
+
+    def _await_completion(
+        self, shell: subprocess.Popen, cmdline: str, timeout: Optional[float] = None
+    ) -> Tuple[int, str]:
+        """
+        Wait for the next command completion on the shell. Caller holds the lock.
+
+        The shell is killed if the read fails or times out.
+
+        Raises:
+            ADBError: If the shell closes or the command times out.
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        if self._poll is not None:
+            try:
+                return self._poll_until_sentinel(shell, cmdline, timeout)
+            except (ADBError, OSError) as e:
+                self._kill_shell()
+                if isinstance(e, ADBError):
+                    raise
+                raise ADBError(f"ADB shell read failed (device={self.serial})") from e
+
+        # Kill the shell if the device stops answering, which unblocks the read
+        watchdog = threading.Timer(timeout, shell.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            return self._read_until_sentinel(shell)
+        except ADBError:
+            self._kill_shell()
+            if watchdog.finished.is_set():
+                raise ADBError(f"ADB shell command timed out after {timeout}s: {cmdline}")
+            raise
+        finally:
+            watchdog.cancel()
+
+    def _drain_pending(self, shell: subprocess.Popen) -> None:
+        """Reap completions of commands sent with execute_shell_async(). Caller holds the lock."""
+        while self._pending:
+            self._await_completion(shell, "<pending async command>")
+            self._pending -= 1
+
+    def execute_shell(self, cmdline: str, timeout: Optional[float] = None) -> Tuple[int, str]:
+        """
+        Run a command line on the persistent `adb shell` session.
+
+        Avoids spawning a new adb process per command. The shell is started
+        on first use and respawned if it has died.
+
+        Args:
+            cmdline: Shell command line (e.g. "input tap 100 200").
+            timeout: Seconds to wait for completion (default: command_timeout).
+
+        Returns:
+            Tuple of (return code, combined stdout/stderr output).
+
+        Raises:
+            ADBError: If the shell cannot be started or the command times out.
+        """
+        payload = (cmdline + _SENTINEL_SUFFIX).encode("utf-8")
+
+        with self._shell_lock:
+            for attempt in range(2):
+                shell = self._ensure_shell()
+
+                if self._pending:
+                    try:
+                        self._drain_pending(shell)
+                    except ADBError as e:
+                        # A fire-and-forget command hung; start over on a fresh shell
+                        logger.debug("Dropping pending async commands: %s", e)
+                        shell = self._ensure_shell()
+
+                try:
+                    shell.stdin.write(payload)
+                    shell.stdin.flush()
+                except (BrokenPipeError, OSError) as e:
+                    self._kill_shell()
+                    if attempt == 0:
+                        continue
+                    raise ADBError(f"ADB shell pipe broken (device={self.serial})") from e
+
+                return self._await_completion(shell, cmdline, timeout)
+
+        raise ADBError(f"Failed to execute ADB shell command: {cmdline}")
+
+    def execute_shell_async(self, cmdline: str) -> None:
+        """
+        Send a command line to the persistent shell without waiting for it.
+
+        The completion is reaped lazily by the next execute_shell() or
+        flush() call, so its return code is never reported.
+
+        Args:
+            cmdline: Shell command line (e.g. "input tap 100 200").
+
+        Raises:
+            ADBError: If the shell cannot be started or written to.
+        """
+        payload = (cmdline + _SENTINEL_SUFFIX).encode("utf-8")
+
+        with self._shell_lock:
+            for attempt in range(2):
+                shell = self._ensure_shell()
+                try:
+                    shell.stdin.write(payload)
+                    shell.stdin.flush()
+                except (BrokenPipeError, OSError) as e:
+                    self._kill_shell()
+                    if attempt == 0:
+                        continue
+                    raise ADBError(f"ADB shell pipe broken (device={self.serial})") from e
+                self._pending += 1
+                return
+
+    def flush(self) -> bool:
+        """
+        Wait until every command sent with execute_shell_async() has finished.
+
+        Call before reading device state (e.g. a screenshot) after async taps.
+
+        Returns:
+            True if all pending commands completed, False if the shell had to be reset.
+        """
+        with self._shell_lock:
+            if not self._pending or self._shell is None:
+                return True
+            try:
+                self._drain_pending(self._shell)
+                return True
+            except ADBError as e:
+                logger.debug("Dropping pending async commands: %s", e)
+                return False
+
+    def run_sequence(self, lines: List[str]) -> int:
+        """
+        Run several shell commands in a single round-trip.
+
+        Commands are chained with '&&', so the sequence stops at the first
+        failing command and its return code is reported.
+
+        Args:
+            lines: Shell command lines, e.g. ["input swipe ...", "sleep 0.3"].
+
+        Returns:
+            Return code of the sequence (0 if empty).
+
+        Raises:
+            ADBError: If the shell command fails to execute.
+        """
+        if not lines:
+            return 0
+        returncode, _ = self.execute_shell(" && ".join(lines))
+        return returncode
+
+    @contextmanager
+    def batch(self) -> Iterator["ADBBatch"]:
+        """
+        Collect actions and submit them as one sequence on exit.
+
+        Example:
+            with client.batch() as b:
+                b.tap(100, 200)
+                b.swipe(540, 1300, 540, 600, 500)
+
+        Nothing is sent if the block raises. The sequence return code is
+        stored in ``b.returncode`` after the block exits.
+        """
+        pending = ADBBatch()
+        yield pending
+        pending.returncode = self.run_sequence(pending.lines)
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> bytes:
+        """Read exactly size bytes from the adb server socket."""
+        data = bytearray()
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ADBError("ADB server closed the connection")
+            data += chunk
+        return bytes(data)
+
+    def _send_service_request(self, sock: socket.socket, request: str) -> None:
+        """Send one smart-socket request and check the server's OKAY/FAIL reply."""
+        payload = request.encode("utf-8")
+        sock.sendall(b"%04x" % len(payload) + payload)
+        status = self._recv_exact(sock, 4)
+        if status != b"OKAY":
+            try:
+                length = int(self._recv_exact(sock, 4), 16)
+                message = self._recv_exact(sock, length).decode("utf-8", errors="ignore")
+            except (ADBError, ValueError, OSError):
+                message = status.decode("utf-8", errors="ignore")
+            raise ADBError(f"ADB server rejected '{request}' (device={self.serial}): {message}")
+
+    def _run_service(self, service: str) -> bytes:
+        """
+        Run a device service through the adb server socket and return its output.
+
+        Each service needs its own connection (the server closes it when the
+        service ends), but no adb process is forked.
+
+        Raises:
+            ADBError: If the server is unreachable, rejects the request or times out.
+        """
+        try:
+            with socket.create_connection(
+                (_ADB_SERVER_HOST, _ADB_SERVER_PORT), timeout=self.timeout
+            ) as sock:
+                self._send_service_request(sock, f"host:transport:{self.serial}")
+                self._send_service_request(sock, service)
+                chunks = []
+                while True:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        return b"".join(chunks)
+                    chunks.append(chunk)
+        except socket.timeout as e:
+            raise ADBError(f"ADB service timed out after {self.timeout}s: {service}") from e
+        except OSError as e:
+            raise ADBError(f"ADB server connection failed ({service}): {e}") from e
+
+    def exec_out(self, command: str) -> bytes:
+        """
+        Run a command on the device and return its raw stdout (like `adb exec-out`).
+
+        Args:
+            command: Command line, e.g. "screencap".
+
+        Returns:
+            Raw command output.
+
+        Raises:
+            ADBError: If the adb server cannot run the command.
+        """
+        return self._run_service(f"exec:{command}")
+
+    def shell(self, command: str) -> bytes:
+        """
+        Run a shell command on the device through the adb server socket.
+
+        Args:
+            command: Shell command line.
+
+        Returns:
+            Command output.
+
+        Raises:
+            ADBError: If the adb server cannot run the command.
+        """
+        return self._run_service(f"shell:{command}")
+
+    def close(self) -> None:
+        """Terminate the persistent shell session, if any."""
+        with self._shell_lock:
+            shell = self._shell
+            self._shell = None
+            self._poll = None
+            self._rxbuf = bytearray()
+            self._pending = 0
+            if shell is None:
+                return
+            try:
+                shell.stdin.write(b"exit\n")
+                shell.stdin.flush()
+            except Exception:
+                pass
+            try:
+                shell.wait(timeout=1)
+            except Exception:
+                try:
+                    shell.kill()
+                except Exception:
+                    pass
+
+    def ping(self, timeout: float = 2.0) -> Optional[bool]:
+        """
+        Probe the device with a no-op on the persistent shell.
+
+        Much cheaper than test_connection() once the shell is running,
+        since no adb process is spawned. Never starts a shell itself.
+
+        Args:
+            timeout: Seconds to wait for the reply.
+
+        Returns:
+            True if the device answered, False if it didn't, None if there
+            is no live shell session to probe.
+        """
+        shell = self._shell
+        if shell is None or shell.poll() is not None:
+            return None
+        if self._shell_lock.locked():
+            # A command is in flight on a live session; don't queue behind it
+            return True
+        try:
+            returncode, _ = self.execute_shell(":", timeout=timeout)
+            return returncode == 0
+        except ADBError as e:
+            logger.debug("ADB ping failed (device=%s): %s", self.serial, e)
+            return False
+
     def test_connection(self) -> bool:
         """
         Test ADB connection to device.
@@ -68,6 +497,39 @@ class ADBClient:
             return False
 
 
+class ADBBatch:
+    """Accumulates input commands for ADBClient.batch()."""
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.lines: List[str] = []
+        self.returncode: Optional[int] = None
+
+    def tap(self, x: float, y: float, delay: float = 0.0) -> None:
+        """Queue a tap, optionally followed by a device-side delay in seconds."""
+        self.lines.append(f"input tap {int(x)} {int(y)}")
+        self.sleep(delay)
+
+    def swipe(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        duration_ms: int = 500,
+        delay: float = 0.0,
+    ) -> None:
+        """Queue a swipe, optionally followed by a device-side delay in seconds."""
+        self.lines.append(
+            f"input swipe {int(x1)} {int(y1)} {int(x2)} {int(y2)} {int(duration_ms)}"
+        )
+        self.sleep(delay)
+
+    def sleep(self, delay: float) -> None:
+        """Queue a device-side delay in seconds."""
+        if delay > 0:
+            self.lines.append(f"sleep {delay:.3f}")
+
 
 
 
@@ -2,13 +2,18 @@
 
 import time
 import logging
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from .client import ADBClient
 from ..utils.exceptions import ADBError, ScreenshotError
 
 logger = logging.getLogger(__name__)
 
+# Logging in this module stays off the nominal tap/swipe path: nothing is
+# logged on success, failures go to logger.debug() with %-style arguments
+# (formatted only if DEBUG is enabled), and debug-only diagnostics must be
+# guarded with logger.isEnabledFor().
+
 
 class ADBCommands:
     """High-level ADB commands for device interaction."""
@@ -21,8 +26,64 @@ class ADBCommands:
             client: ADB client instance.
         """
         self.client = client
+        # Bound format methods, built once, for the per-action command lines
+        self._tap_fmt = "input tap {} {}".format
+        self._swipe_fmt = "input swipe {} {} {} {} {}".format
+        # Earliest time.monotonic() at which the next action may be sent
+        # (only used for host-side delays, see device_delay=False)
+        self._next_ok = 0.0
+
+    def _pace(self) -> float:
+        """Wait out the previous action's host-side delay and return the current time."""
+        now = time.monotonic()
+        if now < self._next_ok:
+            time.sleep(self._next_ok - now)
+            now = time.monotonic()
+        return now
+
+    def tap_command(self, x: float, y: float) -> str:
+        """Shell command line for a tap, for use with batch_shell()."""
+        return self._tap_fmt(int(x), int(y))
+
+    def batch_shell(self, commands: List[str]) -> bool:
+        """
+        Run several shell commands on the device in a single round-trip.
 
-    def tap(self, x: float, y: float, delay: float = 0.3) -> bool:
+        Commands are chained with '&&', so e.g. a follow-up 'sleep' only
+        runs if the preceding tap succeeded.
+
+        Args:
+            commands: Shell command lines, e.g. [self.tap_command(x, y), "sleep 2"].
+
+        Returns:
+            True if every command succeeded, False otherwise.
+        """
+        self._pace()
+        try:
+            returncode = self.client.run_sequence(commands)
+        except ADBError as e:
+            logger.debug("Batch %s failed: %s", commands, e)
+            return False
+        if returncode != 0:
+            logger.debug("Batch %s failed with exit code %s", commands, returncode)
+        return returncode == 0
+
+    @staticmethod
+    def _append_device_sleep(cmdline: str, delay: float, device_delay: bool) -> str:
+        """Append a device-side sleep so action and delay share one round-trip."""
+        if device_delay and delay > 0:
+            # '&&' keeps the return code of the input command on failure
+            return f"{cmdline} && sleep {delay:.3f}"
+        return cmdline
+
+    def tap(
+        self,
+        x: float,
+        y: float,
+        delay: float = 0.3,
+        device_delay: bool = True,
+        wait: bool = True,
+    ) -> bool:
         """
         Execute a tap at the specified coordinates.
 
@@ -30,29 +91,38 @@ class ADBCommands:
             x: X coordinate.
             y: Y coordinate.
             delay: Delay after tap in seconds.
+            device_delay: If True, the delay runs on the device as part of the same
+                shell command. If False, the delay is counted from dispatch and
+                only holds back the next tap/swipe, overlapping the ADB round-trip.
+            wait: If False, send the tap without waiting for it to finish. The
+                result is not checked; the next screenshot verifies the state.
 
         Returns:
-            True if successful, False otherwise.
+            True if successful (or sent, when wait is False), False otherwise.
         """
-        x_int = int(x)
-        y_int = int(y)
         # Removed verbose logging - too noisy
+        cmdline = self._append_device_sleep(self._tap_fmt(int(x), int(y)), delay, device_delay)
+        dispatched_at = self._pace()
 
         try:
-            result = self.client.execute(
-                ["shell", "input", "tap", str(x_int), str(y_int)],
-                capture_output=True,
-            )
+            if not wait:
+                self.client.execute_shell_async(cmdline)
+                if not device_delay:
+                    self._next_ok = dispatched_at + delay
+                return True
 
-            if result.returncode == 0:
+            returncode, _ = self.client.execute_shell(cmdline)
+
+            if returncode == 0:
                 # Removed verbose logging - too noisy
-                time.sleep(delay)
+                if not device_delay:
+                    self._next_ok = dispatched_at + delay
                 return True
             else:
-                # Only log critical errors
+                logger.debug("Tap (%s, %s) failed with exit code %s", x, y, returncode)
                 return False
         except ADBError as e:
-            # Only log critical errors
+            logger.debug("Tap (%s, %s) failed: %s", x, y, e)
             return False
 
     def swipe(
@@ -63,6 +133,7 @@ class ADBCommands:
         y2: float,
         duration_ms: int = 500,
         delay: float = 0.3,
+        device_delay: bool = True,
     ) -> bool:
         """
         Execute a swipe gesture.
@@ -74,45 +145,46 @@ class ADBCommands:
             y2: End Y coordinate.
             duration_ms: Swipe duration in milliseconds.
             delay: Delay after swipe in seconds.
+            device_delay: If True, the delay runs on the device as part of the same
+                shell command. If False, the delay is counted from dispatch and
+                only holds back the next tap/swipe, overlapping the ADB round-trip.
 
         Returns:
             True if successful, False otherwise.
         """
-        x1_int = int(x1)
-        y1_int = int(y1)
-        x2_int = int(x2)
-        y2_int = int(y2)
-
         # Removed verbose logging - too noisy
+        dispatched_at = self._pace()
 
         try:
-            result = self.client.execute(
-                [
-                    "shell",
-                    "input",
-                    "swipe",
-                    str(x1_int),
-                    str(y1_int),
-                    str(x2_int),
-                    str(y2_int),
-                    str(duration_ms),
-                ],
-                capture_output=True,
+            returncode, _ = self.client.execute_shell(
+                self._append_device_sleep(
+                    self._swipe_fmt(int(x1), int(y1), int(x2), int(y2), int(duration_ms)),
+                    delay,
+                    device_delay,
+                )
             )
 
-            if result.returncode == 0:
+            if returncode == 0:
                 # Removed verbose logging - too noisy
-                time.sleep(delay)
+                if not device_delay:
+                    self._next_ok = dispatched_at + delay
                 return True
             else:
-                # Only log critical errors
+                logger.debug(
+                    "Swipe (%s, %s) -> (%s, %s) failed with exit code %s", x1, y1, x2, y2, returncode
+                )
                 return False
         except ADBError as e:
-            # Only log critical errors
+            logger.debug("Swipe (%s, %s) -> (%s, %s) failed: %s", x1, y1, x2, y2, e)
             return False
 
     def scroll_down(
-        self, slow_mode: bool = False, screen_height: int = 1920, screen_width: int = 1080
+        self,
+        slow_mode: bool = False,
+        screen_height: int = 1920,
+        screen_width: int = 1080,
+        count: int = 1,
+        delay: float = 0.3,
     ) -> bool:
         """
         Scroll screen down by swiping.
@@ -121,6 +193,8 @@ class ADBCommands:
             slow_mode: If True, use slower scroll (useful for expansions).
             screen_height: Screen height in pixels (default 1920).
             screen_width: Screen width in pixels (default 1080).
+            count: Number of consecutive scrolls, sent to the device in one round-trip.
+            delay: Delay after each scroll in seconds.
 
         Returns:
             True if successful, False otherwise.
@@ -133,9 +207,21 @@ class ADBCommands:
         # Use longer duration for slower scroll in slow mode
         duration_ms = 1000 if slow_mode else 500
 
-        logger.info(
-            f"Scrolling screen down: from ({center_x}, {start_y}) to ({center_x}, {end_y}) "
-            f"(duration: {duration_ms}ms)"
-        )
-        return self.swipe(center_x, start_y, center_x, end_y, duration_ms=duration_ms)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Scrolling screen down: from (%d, %d) to (%d, %d) (duration: %dms, count: %d)",
+                center_x, start_y, center_x, end_y, duration_ms, count,
+            )
+
+        self._pace()
+        try:
+            with self.client.batch() as batch:
+                for _ in range(count):
+                    batch.swipe(center_x, start_y, center_x, end_y, duration_ms, delay=delay)
+            if batch.returncode != 0:
+                logger.debug("Scroll failed with exit code %s", batch.returncode)
+            return batch.returncode == 0
+        except ADBError as e:
+            logger.debug("Scroll failed: %s", e)
+            return False
 
@@ -1,48 +1,95 @@
 """ADB device management."""
 
+import os
+import re
 import subprocess
 import logging
-from typing import List, Dict, Optional
+import time
+from typing import List, Dict, Optional, Set, Tuple
 
+from .client import ADBClient
 from ..utils.exceptions import ADBError
 
 logger = logging.getLogger(__name__)
 
+# On POSIX, skip the per-spawn close_fds scan of every open descriptor: Python
+# creates descriptors non-inheritable, so adb gets nothing extra either way.
+# Elsewhere (Windows) keep the default, so adb and any adb server it starts
+# don't inherit handles such as other threads' pipe ends.
+_CLOSE_FDS = os.name != "posix"
+
+# One "<serial>\t<state>" entry per line of `adb devices` output
+_DEV_RE = re.compile(rb"^(\S+)\t(\S+)", re.M)
+
+# Short-lived caches so repeated calls within one cycle do not re-run adb
+# (timestamp from time.monotonic(), cached value)
+_DEVICE_CACHE: Optional[Tuple[float, List[Dict[str, str]]]] = None
+_CONNECTION_CACHE: Dict[str, Tuple[float, bool]] = {}
+
 
 class DeviceManager:
     """Manages ADB device connections."""
 
     @staticmethod
-    def list_devices() -> List[Dict[str, str]]:
+    def _parse_devices(output: bytes) -> List[Dict[str, str]]:
+        """Parse raw `adb devices` output into device dictionaries."""
+        # Skip the "List of devices attached" header
+        _, _, tail = output.partition(b"\n")
+        return [
+            {"serial": m.group(1).decode(), "state": m.group(2).decode()}
+            for m in _DEV_RE.finditer(tail)
+        ]
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop cached device lists and connection probe results."""
+        global _DEVICE_CACHE
+        _DEVICE_CACHE = None
+        _CONNECTION_CACHE.clear()
+
+    @staticmethod
+    def _store_devices(devices: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Cache a device list and return a copy of it."""
+        global _DEVICE_CACHE
+        _DEVICE_CACHE = (time.monotonic(), devices)
+        return [dict(device) for device in devices]
+
+    @staticmethod
+    def _store_connection(serial: str, reachable: bool) -> bool:
+        """Cache a connection probe result and return it."""
+        _CONNECTION_CACHE[serial] = (time.monotonic(), reachable)
+        return reachable
+
+    @staticmethod
+    def list_devices(ttl: float = 1.0) -> List[Dict[str, str]]:
         """
         List all connected ADB devices.
 
+        Args:
+            ttl: Reuse a previous result younger than this many seconds (0 disables).
+
         Returns:
             List of device dictionaries with 'serial' and 'state' keys.
         """
+        cached = _DEVICE_CACHE
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return [dict(device) for device in cached[1]]
+
         try:
             result = subprocess.run(
                 ["adb", "devices"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 timeout=10,
+                close_fds=_CLOSE_FDS,
             )
 
             if result.returncode != 0:
-                logger.error(f"Failed to list devices: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", errors="ignore")
+                logger.error(f"Failed to list devices: {stderr}")
                 return []
 
-            devices = []
-            lines = result.stdout.strip().split("\n")[1:]  # Skip header
-
-            for line in lines:
-                if line.strip():
-                    parts = line.split("\t")
-                    if len(parts) >= 2:
-                        devices.append({"serial": parts[0], "state": parts[1]})
-
-            return devices
+            return DeviceManager._store_devices(DeviceManager._parse_devices(result.stdout))
 
         except subprocess.TimeoutExpired:
             logger.error("Timeout listing devices")
@@ -51,6 +98,23 @@ class DeviceManager:
             logger.error(f"Error listing devices: {e}")
             return []
 
+    @staticmethod
+    def get_connected_serials(ttl: float = 1.0) -> Set[str]:
+        """
+        Get the serials of all devices ready for use, from one `adb devices`.
+
+        Args:
+            ttl: Reuse a previous device list younger than this many seconds.
+
+        Returns:
+            Set of serials whose state is "device".
+        """
+        return {
+            device["serial"]
+            for device in DeviceManager.list_devices(ttl)
+            if device["state"] == "device"
+        }
+
     @staticmethod
     def connect_device(serial: str) -> bool:
         """
@@ -62,6 +126,8 @@ class DeviceManager:
         Returns:
             True if connection successful.
         """
+        DeviceManager.invalidate_cache()
+
         try:
             result = subprocess.run(
                 ["adb", "connect", serial],
@@ -69,6 +135,7 @@ class DeviceManager:
                 stderr=subprocess.PIPE,
                 text=True,
                 timeout=10,
+                close_fds=_CLOSE_FDS,
             )
 
             if result.returncode == 0:
@@ -98,6 +165,8 @@ class DeviceManager:
         Returns:
             True if disconnection successful.
         """
+        DeviceManager.invalidate_cache()
+
         try:
             result = subprocess.run(
                 ["adb", "disconnect", serial],
@@ -105,6 +174,7 @@ class DeviceManager:
                 stderr=subprocess.PIPE,
                 text=True,
                 timeout=10,
+                close_fds=_CLOSE_FDS,
             )
 
             if result.returncode == 0:
@@ -122,24 +192,49 @@ class DeviceManager:
             return False
 
     @staticmethod
-    def test_connection(serial: str, retries: int = 2) -> bool:
+    def test_connection(
+        serial: str,
+        retries: int = 2,
+        cache_ttl: float = 0.25,
+        client: Optional[ADBClient] = None,
+    ) -> bool:
         """
         Test connection to a device.
 
         Args:
             serial: Device serial or IP:port.
             retries: Number of retry attempts for network devices.
+            cache_ttl: Reuse a previous result younger than this many seconds (0 disables).
+            client: ADB client already bound to this serial. If given, the probe
+                is a no-op on its persistent shell instead of a new adb process.
 
         Returns:
             True if device is reachable.
         """
-        import time
+        cached = _CONNECTION_CACHE.get(serial)
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            return cached[1]
 
         # Network devices may need longer timeout and retries
         is_network_device = ":" in serial and not serial.startswith("emulator-")
         timeout = 5 if is_network_device else 2
         max_attempts = retries if is_network_device else 1
 
+        if client is not None and client.serial == serial:
+            for attempt in range(max_attempts):
+                alive = client.ping(timeout)
+                if alive is None:
+                    # No live shell session; probe below rather than start one
+                    break
+                if alive:
+                    return DeviceManager._store_connection(serial, True)
+                if attempt < max_attempts - 1:
+                    logger.debug(f"Connection ping failed for {serial}, retrying ({attempt + 1}/{max_attempts})...")
+                    time.sleep(0.5)
+            else:
+                return DeviceManager._store_connection(serial, False)
+
+        # No client, or its shell isn't running: probe with a one-off adb process
         for attempt in range(max_attempts):
             try:
                 result = subprocess.run(
@@ -147,10 +242,11 @@ class DeviceManager:
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     timeout=timeout,
+                    close_fds=_CLOSE_FDS,
                 )
 
                 if result.returncode == 0:
-                    return True
+                    return DeviceManager._store_connection(serial, True)
 
                 if attempt < max_attempts - 1:
                     logger.debug(f"Connection test failed for {serial}, retrying ({attempt + 1}/{max_attempts})...")
@@ -163,5 +259,4 @@ class DeviceManager:
             except Exception:
                 pass
 
-        return False
-
+        return DeviceManager._store_connection(serial, False)
@@ -1,9 +1,18 @@
 """Configuration loader from YAML file."""
 
+import functools
+import os
+
 import yaml
 from pathlib import Path
 from typing import Optional
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 from .settings import (
     Settings,
     ADBConfig,
@@ -36,22 +45,41 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
         project_root = Path(__file__).parent.parent.parent
         config_path = project_root / "config.yaml"
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    # Settings are immutable all the way down, so the cached instance is shared
+    return _load_cached(str(config_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(config_path: str, mtime_ns: int, size: int) -> Settings:
+    """
+    Parse a config file into Settings, memoized on its path, mtime and size.
 
+    Args:
+        config_path: Path to config file.
+        mtime_ns: File modification time in nanoseconds (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        Settings object with loaded configuration.
+    """
     with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f, Loader=_Loader)
 
     if config_data is None:
         config_data = {}
 
-    # Build Settings object from config data
-    settings = Settings()
+    # Build Settings object from config data (sections missing from the file keep defaults)
+    sections = {}
 
     # Load ADB config
     if "adb" in config_data:
         adb_data = config_data["adb"]
-        settings.adb = ADBConfig(
+        sections["adb"] = ADBConfig(
             serial=adb_data.get("serial", "127.0.0.1:5585"),
             command_timeout=adb_data.get("command_timeout", 10),
         )
@@ -59,7 +87,7 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
     # Load automation config
     if "automation" in config_data:
         auto_data = config_data["automation"]
-        settings.automation = AutomationConfig(
+        sections["automation"] = AutomationConfig(
             type=auto_data.get("type", "battle"),
             cycle_delay=auto_data.get("cycle_delay", 1.0),
             fast_mode=auto_data.get("fast_mode", False),
@@ -68,7 +96,7 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
     # Load matching config
     if "matching" in config_data:
         match_data = config_data["matching"]
-        settings.matching = MatchingConfig(
+        sections["matching"] = MatchingConfig(
             default_threshold=match_data.get("default_threshold", 0.75),
             verbose=match_data.get("verbose", True),
         )
@@ -76,7 +104,7 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
     # Load screen config
     if "screens" in config_data:
         screen_data = config_data["screens"]
-        settings.screens = ScreenConfig(
+        sections["screens"] = ScreenConfig(
             check_interval=screen_data.get("check_interval", 0.4),
             fast_check_interval=screen_data.get("fast_check_interval", 0.1),
             tap_delay=screen_data.get("tap_delay", 1.0),
@@ -88,7 +116,7 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
     # Load battle config
     if "battle" in config_data:
         battle_data = config_data["battle"]
-        settings.battle = BattleConfig(
+        sections["battle"] = BattleConfig(
             max_wait_time=battle_data.get("max_wait_time"),
             auto_toggle_verification=battle_data.get("auto_toggle_verification", True),
             battle_start_check_interval=battle_data.get("battle_start_check_interval", 2.0),
@@ -98,7 +126,7 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
     # Load expansion config
     if "expansions" in config_data:
         exp_data = config_data["expansions"]
-        settings.expansions = ExpansionConfig(
+        sections["expansions"] = ExpansionConfig(
             series_a=exp_data.get("series_a"),
             series_b=exp_data.get("series_b"),
             max_scrolls=exp_data.get("max_scrolls", 8),
@@ -109,7 +137,7 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
     # Load paths config
     if "paths" in config_data:
         paths_data = config_data["paths"]
-        settings.paths = PathsConfig(
+        sections["paths"] = PathsConfig(
             templates=paths_data.get("templates", "autogodpack/templates"),
             logs=paths_data.get("logs", "logs"),
             state=paths_data.get("state", "completed_expansions.json"),
@@ -119,14 +147,14 @@ def load_config(config_path: Optional[Path] = None) -> Settings:
     # Load logging config
     if "logging" in config_data:
         log_data = config_data["logging"]
-        settings.logging = LoggingConfig(
+        sections["logging"] = LoggingConfig(
             level=log_data.get("level", "INFO"),
             file=log_data.get("file", "logs/battle_bot.log"),
             console=log_data.get("console", True),
             format=log_data.get("format", "%(asctime)s %(levelname)s %(message)s"),
         )
 
-    return settings
+    return Settings(**sections)
 
 
 
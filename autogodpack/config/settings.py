@@ -1,18 +1,29 @@
 """Configuration settings dataclass."""
 
-from dataclasses import dataclass
-from typing import Optional, List
+import functools
+import sys
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 from pathlib import Path
 
+# Settings are read-only after loading; use replace() to derive modified copies.
+# __slots__ via dataclass(slots=True) needs Python 3.10+.
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
 
-@dataclass
+DEFAULT_SERIES_A = ("GA", "MI", "STS", "TL", "SR", "CG", "EC", "EG", "WSS", "SS", "DPex")
+DEFAULT_SERIES_B = ("CB", "MR")
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ADBConfig:
     """ADB configuration settings."""
     serial: str = "127.0.0.1:5585"
     command_timeout: int = 10
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AutomationConfig:
     """Automation settings."""
     type: str = "battle"
@@ -20,14 +31,14 @@ class AutomationConfig:
     fast_mode: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MatchingConfig:
     """Template matching configuration."""
     default_threshold: float = 0.75
     verbose: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ScreenConfig:
     """Screen detection and interaction settings."""
     check_interval: float = 0.4
@@ -38,7 +49,7 @@ class ScreenConfig:
     fast_retry_delay: float = 0.15
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BattleConfig:
     """Battle-specific settings."""
     max_wait_time: Optional[float] = None
@@ -47,24 +58,28 @@ class BattleConfig:
     battle_progress_check_interval: float = 0.5
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExpansionConfig:
     """Expansion selection settings."""
-    series_a: List[str] = None
-    series_b: List[str] = None
+    series_a: Optional[Tuple[str, ...]] = DEFAULT_SERIES_A
+    series_b: Optional[Tuple[str, ...]] = DEFAULT_SERIES_B
     max_scrolls: int = 8
     max_reset_attempts: int = 2
     max_attempts_per_expansion: int = 3
 
     def __post_init__(self):
-        """Initialize default expansion lists if not provided."""
-        if self.series_a is None:
-            self.series_a = ["GA", "MI", "STS", "TL", "SR", "CG", "EC", "EG", "WSS", "SS", "DPex"]
-        if self.series_b is None:
-            self.series_b = ["CB", "MR"]
-
-
-@dataclass
+        """Use the default expansion lists if passed as None, store as tuples."""
+        # Tuples keep the whole Settings immutable, so one loaded instance can
+        # be shared. Frozen dataclass, so assign through object.__setattr__.
+        object.__setattr__(
+            self, "series_a", DEFAULT_SERIES_A if self.series_a is None else tuple(self.series_a)
+        )
+        object.__setattr__(
+            self, "series_b", DEFAULT_SERIES_B if self.series_b is None else tuple(self.series_b)
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PathsConfig:
     """Path configuration."""
     templates: str = "autogodpack/templates"
@@ -74,22 +89,28 @@ class PathsConfig:
 
     def get_template_path(self, base_path: Path) -> Path:
         """Get absolute template path."""
-        return base_path / self.templates
+        return _join_path(base_path, self.templates)
 
     def get_log_path(self, base_path: Path) -> Path:
         """Get absolute log path."""
-        return base_path / self.logs
+        return _join_path(base_path, self.logs)
 
     def get_state_path(self, base_path: Path) -> Path:
         """Get absolute state file path."""
-        return base_path / self.state
+        return _join_path(base_path, self.state)
 
     def get_reset_flag_path(self, base_path: Path) -> Path:
         """Get absolute reset flag path."""
-        return base_path / self.reset_flag
+        return _join_path(base_path, self.reset_flag)
 
 
-@dataclass
+@functools.lru_cache(maxsize=64)
+def _join_path(base_path: Path, relative: str) -> Path:
+    """Join a configured relative path onto a base path (memoized)."""
+    return base_path / relative
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -98,37 +119,18 @@ class LoggingConfig:
     format: str = "%(asctime)s %(levelname)s %(message)s"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Settings:
     """Main settings container."""
 
-    adb: ADBConfig = None
-    automation: AutomationConfig = None
-    matching: MatchingConfig = None
-    screens: ScreenConfig = None
-    battle: BattleConfig = None
-    expansions: ExpansionConfig = None
-    paths: PathsConfig = None
-    logging: LoggingConfig = None
-
-    def __post_init__(self):
-        """Initialize default configs if not provided."""
-        if self.adb is None:
-            self.adb = ADBConfig()
-        if self.automation is None:
-            self.automation = AutomationConfig()
-        if self.matching is None:
-            self.matching = MatchingConfig()
-        if self.screens is None:
-            self.screens = ScreenConfig()
-        if self.battle is None:
-            self.battle = BattleConfig()
-        if self.expansions is None:
-            self.expansions = ExpansionConfig()
-        if self.paths is None:
-            self.paths = PathsConfig()
-        if self.logging is None:
-            self.logging = LoggingConfig()
+    adb: ADBConfig = field(default_factory=ADBConfig)
+    automation: AutomationConfig = field(default_factory=AutomationConfig)
+    matching: MatchingConfig = field(default_factory=MatchingConfig)
+    screens: ScreenConfig = field(default_factory=ScreenConfig)
+    battle: BattleConfig = field(default_factory=BattleConfig)
+    expansions: ExpansionConfig = field(default_factory=ExpansionConfig)
+    paths: PathsConfig = field(default_factory=PathsConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
 
 
 
@@ -1,5 +1,7 @@
 """Main bot orchestrator."""
 
+import functools
+import hashlib
 import logging
 import time
 import sys
@@ -14,6 +16,7 @@ from ..image.screenshot import ScreenshotCapture
 from ..image.matcher import TemplateMatcher
 from ..state.persistence import StatePersistence
 from ..config.settings import Settings
+from ..utils.exceptions import ScreenshotError, TemplateNotFoundError
 from .state_machine import StateMachine
 from . import stop_checker
 
@@ -24,53 +27,320 @@ logger = logging.getLogger(__name__)
 run_battle_cycle = None
 _battle_bot_module = None
 
-# Registry of active bot instances for per-bot stop checking
-_active_bot_instances = {}
-_active_bot_lock = threading.Lock()
+# Bot running on the current thread, for per-bot stop checking
+# (each thread only ever reads its own bot, so no lock is needed)
+_bot_tls = threading.local()
+
+
+# battle_bot replacements, installed once at import. The bot is resolved from
+# the calling thread, so every slot gets its own stop flag and ADB commands.
+_original_wait_for_battle_completion = None
+_original_wait_and_tap_template = None
+
+
+def _patched_wait_for_battle_completion(max_wait_time=None):
+    """Patched version that checks the current thread's bot stop flag."""
+    bot_instance = getattr(_bot_tls, 'bot', None)
+    if bot_instance is None:
+        # Not running under a BattleBot - keep the original behaviour
+        return _original_wait_for_battle_completion(max_wait_time)
+    commands = bot_instance.commands
+    matcher = bot_instance.matcher
+
+    # Import needed functions from battle_bot (must be at top)
+    from battle_bot import (
+        get_template_path, screenshot_bgr,
+        detect_current_battle_screen_from_bgr, RESULT_DIR, BATTLE_IN_PROGRESS_DIR,
+        BATTLE_SETUP_DIR, get_bot_prefix
+    )
+
+    start_time = time.time()
+    # Slot prefix is fixed for this thread; logging below is %-style so nothing
+    # is formatted for records the log level filters out
+    prefix = get_bot_prefix()
+
+    # Wrap the original function's loop logic
+    if max_wait_time:
+        logger.info("%sWaiting for battle completion (max %ss)...", prefix, max_wait_time)
+    else:
+        logger.info("%sWaiting for battle completion (no timeout)...", prefix)
+
+    tap_to_proceed_path = get_template_path("tap_to_proceed.png", RESULT_DIR)
+    if not os.path.exists(tap_to_proceed_path):
+        logger.error("%sTemplate tap_to_proceed.png not found", prefix)
+        return False
+
+    # Templates used by this loop, keyed by name. Templates don't appear or
+    # vanish mid-battle, so missing ones are dropped once here, not per poll.
+    templates = {
+        name: path
+        for name, path in (
+            ("tap_to_proceed", tap_to_proceed_path),
+            ("auto_setup", get_template_path("auto.png", BATTLE_SETUP_DIR)),
+            ("battle", get_template_path("battle.png", BATTLE_SETUP_DIR)),
+            ("opponent", get_template_path("opponent.png", BATTLE_IN_PROGRESS_DIR)),
+            ("put_basic", get_template_path("put_basic_pokemon.png", BATTLE_IN_PROGRESS_DIR)),
+            ("auto_off", get_template_path("auto_off.png", BATTLE_IN_PROGRESS_DIR)),
+        )
+        if os.path.exists(path)
+    }
+    # In-battle indicator used when the screen isn't detected as battle_in_progress:
+    # the first available of these, with the log text for the battle start
+    battle_indicator = next(
+        (
+            (name, message)
+            for name, message in (
+                ("opponent", "Opponent found"),
+                ("put_basic", "'Put Basic Pokémon' screen detected"),
+            )
+            if name in templates
+        ),
+        None,
+    )
+
+    check_interval_normal = 2.5  # Increased from 2.0 to reduce CPU usage
+    check_interval_battle = 0.4  # Unchanged frames skip matching, so polling is cheap
+    attempts = 0
+    battle_started = False
+    last_status_log = 0
+    prev_frame_hash = None
+    stop_requested = bot_instance._stop_event.is_set
+
+    while True:
+        # Check stop flag frequently
+        if stop_requested():
+            logger.info("%sStop requested during battle wait - aborting", prefix)
+            return False
+
+        # Check timeout
+        if max_wait_time and time.time() - start_time >= max_wait_time:
+            logger.error("%sTimeout: Battle not completed after %ss", prefix, max_wait_time)
+            return False
+
+        attempts += 1
+        elapsed = int(time.time() - start_time)
+
+        screen = screenshot_bgr()
+        if screen is None:
+            logger.warning("%sAttempt %d: Could not capture screenshot (elapsed: %ds)", prefix, attempts, elapsed)
+            if bot_instance._stop_event.wait(check_interval_normal):
+                logger.info("%sStop requested during sleep - aborting", prefix)
+                return False
+            continue
+
+        # Identical to the last matched frame (idle battle animation): the
+        # templates would match exactly as before, so skip straight to the sleep
+        frame_hash = hashlib.blake2b(screen.tobytes(), digest_size=8).digest()
+        if frame_hash == prev_frame_hash:
+            sleep_time = check_interval_battle if battle_started else check_interval_normal
+            if bot_instance._stop_event.wait(sleep_time):
+                logger.info("%sStop requested during sleep - aborting", prefix)
+                return False
+            continue
+        prev_frame_hash = frame_hash
+
+        # All of the loop's templates in one batch per frame: the screen is
+        # uploaded (OpenCL) or downscaled (CPU coarse pass) once, not per template
+        try:
+            matches = matcher.find_template_batch(screen, templates, threshold=0.75)
+        except TemplateNotFoundError as e:
+            logger.error("%sCould not load battle template: %s", prefix, e)
+            return False
+        match = matches.get
+
+        # Check for result screen
+        if match("tap_to_proceed"):
+            logger.info("%sResult screen found after %ds", prefix, elapsed)
+            return True
+
+        # Detect current screen on the frame we already have (no second screencap)
+        detected_screen = detect_current_battle_screen_from_bgr(screen, verbose=False)
+
+        # Check if still in battle setup
+        if detected_screen == "battle_setup":
+            if match("auto_setup"):
+                battle_pos = match("battle")
+                if battle_pos:
+                    logger.warning("%sStill in Battle Setup after %ds - clicking Battle again", prefix, elapsed)
+                    # Tap and settle (tap's 0.3s + 2s) in one adb round-trip
+                    commands.batch_shell([commands.tap_command(battle_pos[0], battle_pos[1]), "sleep 2.3"])
+                    prev_frame_hash = None  # Re-check the next frame even if the tap did nothing
+                    continue
+        elif detected_screen == "battle_selection":
+            logger.info("%sBattle completed! Returned to battle selection after %ds", prefix, elapsed)
+            return True
+
+        # Check if in battle (and what showed it, for the start log)
+        battle_evidence = None
+        if detected_screen == "battle_in_progress":
+            battle_evidence = "Detected battle_in_progress"
+        elif battle_indicator and match(battle_indicator[0]):
+            battle_evidence = battle_indicator[1]
+
+        # Check if Auto is OFF during battle
+        if battle_evidence:
+            auto_off_pos = match("auto_off")
+            if auto_off_pos:
+                logger.warning("%sAuto is OFF during battle after %ds! Turning Auto ON...", prefix, elapsed)
+                # Tap and settle (tap's 0.3s + 0.5s) in one adb round-trip
+                commands.batch_shell([commands.tap_command(auto_off_pos[0], auto_off_pos[1]), "sleep 0.8"])
+                prev_frame_hash = None  # Re-check the next frame even if the tap did nothing
+                continue
+
+        # Check if battle started
+        if not battle_started:
+            if battle_evidence:
+                battle_started = True
+                logger.info("%sBattle started! %s after %ds", prefix, battle_evidence, elapsed)
+        else:
+            if elapsed - last_status_log >= 60:
+                logger.info("%sBattle in progress... waiting for completion (%ds)", prefix, elapsed)
+                last_status_log = elapsed
+
+        # Use smaller interval when battle started
+        sleep_time = check_interval_battle if battle_started else check_interval_normal
+
+        # Interruptible sleep - returns early as soon as stop() is called
+        if bot_instance._stop_event.wait(sleep_time):
+            logger.info("%sStop requested during sleep - aborting", prefix)
+            return False
+
+
+def _patched_wait_and_tap_template(filename, timeout=10, threshold=0.75, screen_dir=None, fast_mode=False):
+    """Patched version that checks the current thread's bot stop flag."""
+    bot_instance = getattr(_bot_tls, 'bot', None)
+    if bot_instance is None:
+        # Not running under a BattleBot - keep the original behaviour
+        return _original_wait_and_tap_template(filename, timeout, threshold, screen_dir, fast_mode)
+    commands = bot_instance.commands
+
+    from battle_bot import get_template_path, screenshot_bgr, find_template, get_bot_prefix
+
+    path = get_template_path(filename, screen_dir)
+    prefix = get_bot_prefix()
+    end = time.time() + timeout
+    attempts = 0
+
+    check_interval = 0.2 if fast_mode else 0.5  # Increased to reduce CPU usage
+    tap_delay = 0.2 if fast_mode else 1.0
+    retry_delay = 0.15 if fast_mode else 0.5
+    stop_requested = bot_instance._stop_event.is_set
+
+    while time.time() < end:
+        # Check stop flag
+        if stop_requested():
+            logger.info("%sStop requested during wait_and_tap_template for %s - aborting", prefix, filename)
+            return False
+
+        attempts += 1
+        screen = screenshot_bgr()
+        if screen is None:
+            logger.warning("%sAttempt %d: Could not capture screen", prefix, attempts)
+            if bot_instance._stop_event.wait(0.3):  # Slightly longer wait on failure
+                return False
+            continue
+
+        pos = find_template(screen, path, threshold=threshold)
+        if pos:
+            logger.info("%sTemplate %s found at %s (attempt %d)", prefix, filename, pos, attempts)
+            # Tap and settle (tap's 0.3s + tap_delay) in one adb round-trip
+            if commands.batch_shell([commands.tap_command(pos[0], pos[1]), f"sleep {0.3 + tap_delay:.3f}"]):
+                return True
+            else:
+                logger.warning("%sTap failed, retrying...", prefix)
+                if bot_instance._stop_event.wait(retry_delay):
+                    return False
+                continue
+
+        # Interruptible sleep - returns early as soon as stop() is called
+        if bot_instance._stop_event.wait(check_interval):
+            logger.info("%sStop requested during sleep in wait_and_tap_template - aborting", prefix)
+            return False
+
+    logger.error("%sTemplate %s not found after %d attempts (timeout=%ss)", prefix, filename, attempts, timeout)
+    return False
+
 
 _src_path = Path(__file__).parent.parent.parent / "src"
-if _src_path.exists():
-    try:
-        # Add to path temporarily
-        if str(_src_path) not in sys.path:
-            sys.path.insert(0, str(_src_path))
+# battle_bot is imported on first BattleBot creation, not with this module, so
+# entry points that never start a bot don't pay for it
+_battle_bot_lock = threading.Lock()
+_battle_bot_load_attempted = False
+
+# battle_bot's thread-state setters, resolved once at load (None = not provided)
+_set_adb_serial = None
+_set_slot_id = None
+_set_screenshot_backend = None
+_set_stop_checker = None
+
+
+def _ensure_battle_bot_loaded() -> None:
+    """Import src/battle_bot.py and install the patches above (first call only)."""
+    global run_battle_cycle, _battle_bot_module, _battle_bot_load_attempted
+    global _original_wait_for_battle_completion, _original_wait_and_tap_template
+    global _set_adb_serial, _set_slot_id, _set_screenshot_backend, _set_stop_checker
+
+    if _battle_bot_load_attempted:
+        return
+    with _battle_bot_lock:
+        if _battle_bot_load_attempted:
+            return
+        _battle_bot_load_attempted = True
+
+        if not _src_path.exists():
+            logger.warning(f"src/ directory not found at {_src_path}")
+            run_battle_cycle = None
+            return
+
+        try:
+            # Add to path temporarily
+            if str(_src_path) not in sys.path:
+                sys.path.insert(0, str(_src_path))
         
-        import battle_bot as _battle_bot_module
-        if hasattr(_battle_bot_module, 'run_battle_cycle'):
-            run_battle_cycle = _battle_bot_module.run_battle_cycle
-            logger.info("Loaded battle_bot module from src/")
+            import battle_bot as _battle_bot_module
+            if hasattr(_battle_bot_module, 'run_battle_cycle'):
+                run_battle_cycle = _battle_bot_module.run_battle_cycle
+                logger.info("Loaded battle_bot module from src/")
             
-            # Patch check_stop_flag to check all active bots
-            _original_check_stop_flag = _battle_bot_module.check_stop_flag
+                # Patch check_stop_flag to check all active bots
+                _original_check_stop_flag = _battle_bot_module.check_stop_flag
             
-            def patched_check_stop_flag():
-                """Check stop flag for current thread's bot."""
-                import threading
-                current_thread = threading.current_thread()
-                thread_id = current_thread.ident
+                def patched_check_stop_flag():
+                    """Check stop flag for current thread's bot."""
+                    # Check if this thread has an associated bot
+                    bot_instance = getattr(_bot_tls, 'bot', None)
+                    if bot_instance is not None:
+                        return bot_instance._stop_event.is_set()
                 
-                # Check if this thread has an associated bot
-                with _active_bot_lock:
-                    bot_instance = _active_bot_instances.get(thread_id)
-                
-                if bot_instance:
-                    return hasattr(bot_instance, '_stop_flag') and bot_instance._stop_flag
-                
-                # Fallback to original if no bot registered
-                return _original_check_stop_flag()
+                    # Fallback to original if no bot registered
+                    return _original_check_stop_flag()
             
-            _battle_bot_module.check_stop_flag = patched_check_stop_flag
-        else:
-            logger.warning("battle_bot module found but run_battle_cycle not available")
-    except ImportError as e:
-        logger.warning(f"Could not import battle_bot: {e}")
-        run_battle_cycle = None
-    except Exception as e:
-        logger.error(f"Error loading battle_bot: {e}", exc_info=True)
-        run_battle_cycle = None
-else:
-    logger.warning(f"src/ directory not found at {_src_path}")
-    run_battle_cycle = None
+                _battle_bot_module.check_stop_flag = patched_check_stop_flag
+            
+                # Patch the wait loops once; they look up the running bot per thread
+                _original_wait_for_battle_completion = getattr(_battle_bot_module, 'wait_for_battle_completion', None)
+                if _original_wait_for_battle_completion:
+                    _battle_bot_module.wait_for_battle_completion = _patched_wait_for_battle_completion
+                _original_wait_and_tap_template = getattr(_battle_bot_module, 'wait_and_tap_template', None)
+                if _original_wait_and_tap_template:
+                    _battle_bot_module.wait_and_tap_template = _patched_wait_and_tap_template
+
+                # Resolve the thread-state setters BattleBot.run() calls
+                _set_adb_serial = getattr(_battle_bot_module, 'set_adb_serial', None)
+                if _set_adb_serial is None and hasattr(_battle_bot_module, 'ADB_SERIAL'):
+                    # Older battle_bot: fall back to the global for backward compatibility
+                    _set_adb_serial = functools.partial(setattr, _battle_bot_module, 'ADB_SERIAL')
+                _set_slot_id = getattr(_battle_bot_module, 'set_slot_id', None)
+                _set_screenshot_backend = getattr(_battle_bot_module, 'set_screenshot_backend', None)
+                _set_stop_checker = getattr(_battle_bot_module, 'set_stop_checker', None)
+            else:
+                logger.warning("battle_bot module found but run_battle_cycle not available")
+        except ImportError as e:
+            logger.warning(f"Could not import battle_bot: {e}")
+            run_battle_cycle = None
+        except Exception as e:
+            logger.error(f"Error loading battle_bot: {e}", exc_info=True)
+            run_battle_cycle = None
 
 
 class BattleBot:
@@ -89,10 +359,14 @@ class BattleBot:
         self.project_root = project_root
         self.slot_id = slot_id
 
+        # Legacy battle_bot runtime (imported and patched once, on first use)
+        _ensure_battle_bot_loaded()
+
         # Initialize components
         self.client = ADBClient(settings.adb)
         self.commands = ADBCommands(self.client)
-        self.screenshot = ScreenshotCapture(self.client)
+        # Frames are only used until the next capture, so decode into one buffer
+        self.screenshot = ScreenshotCapture(self.client, reuse_buffer=True)
         self.matcher = TemplateMatcher(
             default_threshold=settings.matching.default_threshold,
             verbose=settings.matching.verbose,
@@ -117,14 +391,20 @@ class BattleBot:
         reset_flag_file = settings.paths.get_reset_flag_path(project_root)
         self.state_persistence.check_reset_flag(reset_flag_file, slot_id=slot_id)
         
-        # Store reference to this bot instance for stop checking
-        self._stop_flag = False
-        
-        # Patch battle_bot functions if module is loaded
-        if _battle_bot_module is not None:
-            self._patch_battle_bot_functions(_battle_bot_module)
-            # Set per-bot stop checker using a closure that captures this instance
-            self._setup_battle_bot_stop_checker()
+        # Set by stop(); sleeps wait on it so a stop request wakes them immediately
+        self._stop_event = threading.Event()
+
+    @property
+    def _stop_flag(self) -> bool:
+        """Whether a stop was requested (kept for callers that read the old flag)."""
+        return self._stop_event.is_set()
+
+    @_stop_flag.setter
+    def _stop_flag(self, value: bool) -> None:
+        if value:
+            self._stop_event.set()
+        else:
+            self._stop_event.clear()
 
     def run_cycle(self) -> bool:
         """
@@ -134,49 +414,22 @@ class BattleBot:
             True if cycle completed successfully, False if stopped.
         """
         # Check stop flag before starting cycle
-        if hasattr(self, '_stop_flag') and self._stop_flag:
+        stop_requested = self._stop_event.is_set
+        if stop_requested():
             return False
             
         try:
             # Use original implementation for now (compatibility layer)
             if run_battle_cycle is not None:
-                # Set ADB_SERIAL in thread-local storage for this bot instance
-                try:
-                    if hasattr(_battle_bot_module, 'set_adb_serial'):
-                        _battle_bot_module.set_adb_serial(self.settings.adb.serial)
-                        # Removed debug logging - too verbose
-                    elif hasattr(_battle_bot_module, 'ADB_SERIAL'):
-                        # Fallback to global for backward compatibility
-                        _battle_bot_module.ADB_SERIAL = self.settings.adb.serial
-                        # Removed debug logging - too verbose
-                    
-                    # Set slot_id in thread-local storage for this bot instance
-                    if self.slot_id is not None and hasattr(_battle_bot_module, 'set_slot_id'):
-                        _battle_bot_module.set_slot_id(self.slot_id)
-                        # Removed debug logging - too verbose
-                    
-                    # Set slot_id in thread-local storage for this bot instance
-                    if self.slot_id is not None and hasattr(_battle_bot_module, 'set_slot_id'):
-                        _battle_bot_module.set_slot_id(self.slot_id)
-                        # Removed debug logging - too verbose
-                    
-                    # Inject stop flag checker into battle_bot module
-                    if hasattr(_battle_bot_module, 'set_stop_checker'):
-                        _battle_bot_module.set_stop_checker(
-                            lambda: hasattr(self, '_stop_flag') and self._stop_flag
-                        )
-                        # Removed debug logging - too verbose
-                except Exception as e:
-                    logger.warning(f"Could not configure battle_bot module: {e}")
-                
+                # Thread-local serial/slot/stop checker were set once in run()
                 # Check stop flag before running cycle
-                if hasattr(self, '_stop_flag') and self._stop_flag:
+                if stop_requested():
                     return False
                 
                 result = run_battle_cycle()
                 
                 # Check stop flag after cycle
-                if hasattr(self, '_stop_flag') and self._stop_flag:
+                if stop_requested():
                     return False
                     
                 return result
@@ -215,265 +468,69 @@ class BattleBot:
         logger.warning(f"Unknown screen: {current_screen}")
         return False
 
-    def _setup_battle_bot_stop_checker(self) -> None:
-        """Setup stop checker for this bot instance in battle_bot module."""
-        if _battle_bot_module is None:
-            return
-        
-        # Create a closure that captures this bot instance
-        bot_instance = self
-        def check_stop_for_this_bot():
-            return hasattr(bot_instance, '_stop_flag') and bot_instance._stop_flag
-        
-        # Store the checker function in a thread-local way
-        # Since battle_bot uses a global, we need to set it each time before use
-        # Instead, we'll patch check_stop_flag to check all active bots
-        _battle_bot_module.set_stop_checker(check_stop_for_this_bot)
-    
-    def _patch_battle_bot_functions(self, module) -> None:
-        """Patch battle_bot functions to check stop flag."""
-        import time
-        
-        # Capture self in a variable for closure
-        bot_instance = self
-        
-        # Store original functions
-        original_wait_for_battle_completion = getattr(module, 'wait_for_battle_completion', None)
-        original_wait_and_tap_template = getattr(module, 'wait_and_tap_template', None)
-        
-        if original_wait_for_battle_completion:
-            def patched_wait_for_battle_completion(max_wait_time=None):
-                """Patched version that checks stop flag."""
-                # Import needed functions from battle_bot (must be at top)
-                from battle_bot import (
-                    get_template_path, screenshot_bgr, find_template, tap,
-                    detect_current_battle_screen, RESULT_DIR, BATTLE_IN_PROGRESS_DIR,
-                    BATTLE_SETUP_DIR, get_bot_prefix
-                )
-                
-                start_time = time.time()
-                check_interval = 0.5  # Check stop flag every 0.5 seconds
-                
-                # Wrap the original function's loop logic
-                if max_wait_time:
-                    logger.info(f"{get_bot_prefix()}Waiting for battle completion (max {max_wait_time}s)...")
-                else:
-                    logger.info(f"{get_bot_prefix()}Waiting for battle completion (no timeout)...")
-                
-                tap_to_proceed_path = get_template_path("tap_to_proceed.png", RESULT_DIR)
-                opponent_path = get_template_path("opponent.png", BATTLE_IN_PROGRESS_DIR)
-                battle_path = get_template_path("battle.png", BATTLE_SETUP_DIR)
-                auto_off_path = get_template_path("auto_off.png", BATTLE_IN_PROGRESS_DIR)
-                put_basic_path = get_template_path("put_basic_pokemon.png", BATTLE_IN_PROGRESS_DIR)
-                
-                if not os.path.exists(tap_to_proceed_path):
-                    logger.error(f"Template tap_to_proceed.png not found")
-                    return False
-                
-                check_interval_normal = 2.5  # Increased from 2.0 to reduce CPU usage
-                check_interval_battle = 0.8  # Increased from 0.5 to reduce CPU usage
-                attempts = 0
-                battle_started = False
-                last_status_log = 0
-                
-                while True:
-                    # Check stop flag frequently
-                    if hasattr(bot_instance, '_stop_flag') and bot_instance._stop_flag:
-                        logger.info(f"{get_bot_prefix()}Stop requested during battle wait - aborting")
-                        return False
-                    
-                    # Check timeout
-                    if max_wait_time and time.time() - start_time >= max_wait_time:
-                        logger.error(f"{get_bot_prefix()}Timeout: Battle not completed after {max_wait_time}s")
-                        return False
-                    
-                    attempts += 1
-                    elapsed = int(time.time() - start_time)
-                    
-                    screen = screenshot_bgr()
-                    if screen is None:
-                        logger.warning(f"{get_bot_prefix()}Attempt {attempts}: Could not capture screenshot (elapsed: {elapsed}s)")
-                        time.sleep(check_interval_normal)
-                        continue
-                    
-                    # Check for result screen
-                    tap_result_pos = find_template(screen, tap_to_proceed_path, threshold=0.75, verbose=False)
-                    if tap_result_pos:
-                        logger.info(f"{get_bot_prefix()}Result screen found after {elapsed}s")
-                        return True
-                    
-                    # Detect current screen
-                    detected_screen = detect_current_battle_screen(verbose=False)
-                    
-                    # Check if still in battle setup
-                    if detected_screen == "battle_setup":
-                        auto_setup_path = get_template_path("auto.png", BATTLE_SETUP_DIR)
-                        if os.path.exists(auto_setup_path):
-                            auto_setup_pos = find_template(screen, auto_setup_path, threshold=0.75, verbose=False)
-                            if auto_setup_pos and os.path.exists(battle_path):
-                                battle_pos = find_template(screen, battle_path, threshold=0.75, verbose=False)
-                                if battle_pos:
-                                    logger.warning(f"{get_bot_prefix()}Still in Battle Setup after {elapsed}s - clicking Battle again")
-                                    if tap(battle_pos[0], battle_pos[1]):
-                                        time.sleep(2.0)
-                                    continue
-                    elif detected_screen == "battle_selection":
-                        logger.info(f"{get_bot_prefix()}Battle completed! Returned to battle selection after {elapsed}s")
-                        return True
-                    
-                    # Check if in battle
-                    is_in_battle = False
-                    if detected_screen == "battle_in_progress":
-                        is_in_battle = True
-                    elif os.path.exists(opponent_path):
-                        opponent_pos = find_template(screen, opponent_path, threshold=0.75, verbose=False)
-                        if opponent_pos:
-                            is_in_battle = True
-                    elif os.path.exists(put_basic_path):
-                        put_basic_pos = find_template(screen, put_basic_path, threshold=0.75, verbose=False)
-                        if put_basic_pos:
-                            is_in_battle = True
-                    
-                    # Check if Auto is OFF during battle
-                    if is_in_battle and os.path.exists(auto_off_path):
-                        auto_off_pos = find_template(screen, auto_off_path, threshold=0.75, verbose=False)
-                        if auto_off_pos:
-                            logger.warning(f"{get_bot_prefix()}Auto is OFF during battle after {elapsed}s! Turning Auto ON...")
-                            if tap(auto_off_pos[0], auto_off_pos[1]):
-                                time.sleep(0.5)
-                            continue
-                    
-                    # Check if battle started
-                    if not battle_started:
-                        if detected_screen == "battle_in_progress":
-                            battle_started = True
-                            logger.info(f"{get_bot_prefix()}Battle started! Detected battle_in_progress after {elapsed}s")
-                        elif os.path.exists(opponent_path):
-                            opponent_pos = find_template(screen, opponent_path, threshold=0.75, verbose=False)
-                            if opponent_pos:
-                                battle_started = True
-                                logger.info(f"{get_bot_prefix()}Battle started! Opponent found after {elapsed}s")
-                        elif os.path.exists(put_basic_path):
-                            put_basic_pos = find_template(screen, put_basic_path, threshold=0.75, verbose=False)
-                            if put_basic_pos:
-                                battle_started = True
-                                logger.info(f"{get_bot_prefix()}Battle started! 'Put Basic Pokémon' screen detected after {elapsed}s")
-                    else:
-                        if elapsed - last_status_log >= 60:
-                            logger.info(f"{get_bot_prefix()}Battle in progress... waiting for completion ({elapsed}s)")
-                            last_status_log = elapsed
-                    
-                    # Use smaller interval when battle started
-                    sleep_time = check_interval_battle if battle_started else check_interval_normal
-                    
-                    # Optimized interruptible sleep - check less frequently to reduce CPU overhead
-                    sleep_remaining = sleep_time
-                    check_interval_sleep = 0.3  # Increased from 0.1 to reduce overhead
-                    while sleep_remaining > 0:
-                        if hasattr(bot_instance, '_stop_flag') and bot_instance._stop_flag:
-                            logger.info(f"{get_bot_prefix()}Stop requested during sleep - aborting")
-                            return False
-                        actual_sleep = min(check_interval_sleep, sleep_remaining)
-                        time.sleep(actual_sleep)
-                        sleep_remaining -= actual_sleep
-            
-            # Replace the function in the module
-            module.wait_for_battle_completion = patched_wait_for_battle_completion
-        
-        if original_wait_and_tap_template:
-            def patched_wait_and_tap_template(filename, timeout=10, threshold=0.75, screen_dir=None, fast_mode=False):
-                """Patched version that checks stop flag."""
-                from battle_bot import get_template_path, screenshot_bgr, find_template, tap, get_bot_prefix
-                
-                path = get_template_path(filename, screen_dir)
-                end = time.time() + timeout
-                attempts = 0
-                
-                check_interval = 0.2 if fast_mode else 0.5  # Increased to reduce CPU usage
-                tap_delay = 0.2 if fast_mode else 1.0
-                retry_delay = 0.15 if fast_mode else 0.5
-                
-                while time.time() < end:
-                    # Check stop flag
-                    if hasattr(bot_instance, '_stop_flag') and bot_instance._stop_flag:
-                        logger.info(f"{get_bot_prefix()}Stop requested during wait_and_tap_template for {filename} - aborting")
-                        return False
-                    
-                    attempts += 1
-                    screen = screenshot_bgr()
-                    if screen is None:
-                        logger.warning(f"{get_bot_prefix()}Attempt {attempts}: Could not capture screen")
-                        time.sleep(0.3)  # Slightly longer wait on failure
-                        continue
-                    
-                    pos = find_template(screen, path, threshold=threshold)
-                    if pos:
-                        logger.info(f"{get_bot_prefix()}Template {filename} found at {pos} (attempt {attempts})")
-                        if tap(pos[0], pos[1]):
-                            time.sleep(tap_delay)
-                            return True
-                        else:
-                            logger.warning(f"{get_bot_prefix()}Tap failed, retrying...")
-                            time.sleep(retry_delay)
-                            continue
-                    
-                    # Optimized interruptible sleep - check less frequently
-                    sleep_remaining = check_interval
-                    check_interval_sleep = 0.2  # Increased from 0.05 to reduce overhead
-                    while sleep_remaining > 0:
-                        if hasattr(bot_instance, '_stop_flag') and bot_instance._stop_flag:
-                            logger.info(f"{get_bot_prefix()}Stop requested during sleep in wait_and_tap_template - aborting")
-                            return False
-                        actual_sleep = min(check_interval_sleep, sleep_remaining)
-                        time.sleep(actual_sleep)
-                        sleep_remaining -= actual_sleep
-                
-                logger.error(f"{get_bot_prefix()}Template {filename} not found after {attempts} attempts (timeout={timeout}s)")
-                return False
-            
-            # Replace the function in the module
-            module.wait_and_tap_template = patched_wait_and_tap_template
-    
+    def _capture_screen(self):
+        """Screenshot backend handed to battle_bot (BGR image or None)."""
+        try:
+            return self.screenshot.capture_bgr()
+        except ScreenshotError as e:
+            logger.error(f"Screenshot capture failed: {e}")
+            return None
+
     def stop(self) -> None:
         """Stop the bot."""
-        self._stop_flag = True
+        self._stop_event.set()
         logger.info("Stop flag set - bot will stop at next check point")
+
+    def shutdown(self) -> None:
+        """Stop the bot and release the persistent ADB shell (safe to call more than once)."""
+        self._stop_event.set()
+        try:
+            self.client.close()
+        except Exception as e:
+            logger.debug(f"Error closing ADB client: {e}")
         
     def run(self) -> None:
-        """Run bot in continuous loop."""
-        self._stop_flag = False
-        
+        """
+        Run bot in continuous loop.
+
+        A stop requested before run() is called is honoured: the stop event is
+        not cleared here, so create a new BattleBot for each run.
+        """
         # Register this bot instance with current thread for stop checking
-        current_thread = threading.current_thread()
-        thread_id = current_thread.ident
-        with _active_bot_lock:
-            _active_bot_instances[thread_id] = self
+        _bot_tls.bot = self
         
         try:
             # Set ADB_SERIAL in thread-local storage for this bot instance
             # This must be done at the start of run() to ensure it's set before any battle_bot functions are called
             if _battle_bot_module is not None:
                 try:
-                    if hasattr(_battle_bot_module, 'set_adb_serial'):
-                        _battle_bot_module.set_adb_serial(self.settings.adb.serial)
+                    if _set_adb_serial is not None:
+                        _set_adb_serial(self.settings.adb.serial)
                         logger.debug(f"Set thread-local ADB_SERIAL to {self.settings.adb.serial} at start of run()")
-                    elif hasattr(_battle_bot_module, 'ADB_SERIAL'):
-                        # Fallback to global for backward compatibility
-                        _battle_bot_module.ADB_SERIAL = self.settings.adb.serial
-                        logger.debug(f"Set global ADB_SERIAL to {self.settings.adb.serial} at start of run() (fallback)")
                     
                     # Set slot_id in thread-local storage for this bot instance
-                    if self.slot_id is not None and hasattr(_battle_bot_module, 'set_slot_id'):
-                        _battle_bot_module.set_slot_id(self.slot_id)
+                    if self.slot_id is not None and _set_slot_id is not None:
+                        _set_slot_id(self.slot_id)
                         logger.debug(f"Set thread-local slot_id to {self.slot_id} at start of run()")
+                    
+                    # Route battle_bot screenshots through this bot's capture (raw screencap)
+                    if _set_screenshot_backend is not None:
+                        _set_screenshot_backend(self._capture_screen)
+                    
+                    # Fallback stop checker for battle_bot code paths that read the global one
+                    if _set_stop_checker is not None:
+                        _set_stop_checker(self._stop_event.is_set)
                 except Exception as e:
                     logger.warning(f"Could not set ADB_SERIAL/slot_id at start of run(): {e}")
             
             # Setup stop checker for this bot instance (not global to avoid conflicts)
-            checker = stop_checker.StopChecker(lambda: hasattr(self, '_stop_flag') and self._stop_flag)
+            stop_requested = self._stop_event.is_set
+            checker = stop_checker.StopChecker(stop_event=self._stop_event)
+            # Visible to check_stop() on this thread only
+            stop_checker.set_global_stop_checker(checker)
             
             # The patched check_stop_flag in battle_bot will automatically find this bot instance
-            # via the thread registry (_active_bot_instances), so no need to set it explicitly
+            # via thread-local storage (_bot_tls), so no need to set it explicitly
             
             # Removed startup logs - too verbose
             # Bot identification and page info logged in battle_bot.py
@@ -491,7 +548,7 @@ class BattleBot:
             try:
                 while True:
                     # Check if bot should stop (for GUI control) - check frequently
-                    if hasattr(self, '_stop_flag') and self._stop_flag:
+                    if stop_requested():
                         break
                         
                     cycle_count += 1
@@ -499,13 +556,13 @@ class BattleBot:
 
                     try:
                         # Check stop flag before cycle
-                        if hasattr(self, '_stop_flag') and self._stop_flag:
+                        if stop_requested():
                             break
                             
                         success = self.run_cycle()
                         
                         # Check stop flag after cycle
-                        if hasattr(self, '_stop_flag') and self._stop_flag:
+                        if stop_requested():
                             break
 
                         # Removed cycle completion logs - too verbose
@@ -513,27 +570,17 @@ class BattleBot:
                     except Exception as cycle_error:
                         logger.error(f"Error in cycle #{cycle_count}: {cycle_error}", exc_info=True)
                         # Check stop flag even after error
-                        if hasattr(self, '_stop_flag') and self._stop_flag:
+                        if stop_requested():
                             break
                         # Continue to next cycle instead of crashing
                         # Removed warning log - too verbose
 
                     # Check stop flag before delay
-                    if hasattr(self, '_stop_flag') and self._stop_flag:
+                    if stop_requested():
                         break
                     
-                    # Delay before next cycle with optimized interruptible sleep
-                    delay_remaining = self.settings.automation.cycle_delay
-                    check_interval = 0.3  # Check every 300ms (reduced frequency for less CPU usage)
-                    while delay_remaining > 0:
-                        if hasattr(self, '_stop_flag') and self._stop_flag:
-                            break
-                        sleep_time = min(check_interval, delay_remaining)
-                        time.sleep(sleep_time)
-                        delay_remaining -= sleep_time
-                    
-                    # Final check before next iteration
-                    if hasattr(self, '_stop_flag') and self._stop_flag:
+                    # Delay before next cycle - wakes immediately on stop()
+                    if self._stop_event.wait(self.settings.automation.cycle_delay):
                         break
 
             except KeyboardInterrupt:
@@ -551,15 +598,16 @@ class BattleBot:
         finally:
             # Cleanup resources
             try:
-                # Unregister this bot instance from thread registry
-                current_thread = threading.current_thread()
-                thread_id = current_thread.ident
-                with _active_bot_lock:
-                    _active_bot_instances.pop(thread_id, None)
+                # Unregister this bot instance from the current thread
+                # (pooled threads are reused by the next bot)
+                _bot_tls.bot = None
+                stop_checker.set_global_stop_checker(None)
                 
-                # Clear stop checker for this bot instance
-                if _battle_bot_module is not None:
-                    _battle_bot_module.set_stop_checker(None)
+                # Clear stop checker and screenshot backend for this bot instance
+                if _set_stop_checker is not None:
+                    _set_stop_checker(None)
+                if _set_screenshot_backend is not None:
+                    _set_screenshot_backend(None)
                 # Removed debug logging - too verbose
             except Exception as cleanup_error:
                 logger.warning(f"Error during bot cleanup: {cleanup_error}")
@@ -1,20 +1,49 @@
 """Multi-bot manager for handling multiple battle bot instances."""
 
 import logging
-import threading
+import os
 import time
-from typing import Dict, Optional, List
+from dataclasses import replace
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Optional, List, Set, Tuple
 from pathlib import Path
 
 from ..config.settings import Settings, ADBConfig
 from ..adb.device_manager import DeviceManager
 from .bot import BattleBot
 
+logger = logging.getLogger(__name__)
+
+
+# Directories already found to exist. Only hits are remembered, so a missing
+# template directory is picked up as soon as it is created.
+_EXISTING_DIRS: Set[str] = set()
+
+
+def _dir_exists(path: str) -> bool:
+    """Check that a directory exists, hitting the filesystem until it does."""
+    if path in _EXISTING_DIRS:
+        return True
+    if os.path.isdir(path):
+        _EXISTING_DIRS.add(path)
+        return True
+    return False
+
 
 class BotInstance:
     """Represents a single bot instance with its state."""
     
-    def __init__(self, slot_id: int, device_serial: str, settings: Settings, project_root: Path):
+    # How long a connection check result is reused by get_status_info (seconds)
+    _CONN_TTL = 2.0
+    
+    def __init__(
+        self,
+        slot_id: int,
+        device_serial: str,
+        settings: Settings,
+        project_root: Path,
+        executor: ThreadPoolExecutor,
+    ):
         """
         Initialize bot instance.
         
@@ -23,145 +52,200 @@ class BotInstance:
             device_serial: Device serial/IP to connect to.
             settings: Base settings (will be cloned and modified).
             project_root: Project root directory.
+            executor: Manager's shared pool the bot loop runs on.
         """
         self.slot_id = slot_id
         self.device_serial = device_serial
         self.settings = self._create_settings_for_device(settings, device_serial)
         self.project_root = project_root
+        self.executor = executor
         
         self.bot: Optional[BattleBot] = None
-        self.bot_thread: Optional[threading.Thread] = None
+        self.bot_future: Optional[Future] = None
         self.is_running = False
         self.status = "Ready"
         self.error_message: Optional[str] = None
+        # (monotonic time, is_connected) of the last status connection check
+        self._conn_cache: Optional[Tuple[float, bool]] = None
+        # (fields, dict) of the last get_status_info result
+        self._status_snapshot: Optional[Tuple[tuple, Dict[str, any]]] = None
         
     def _create_settings_for_device(self, base_settings: Settings, serial: str) -> Settings:
         """Create a settings copy with device-specific ADB config."""
-        from copy import deepcopy
-        from ..config.settings import (
-            ADBConfig, AutomationConfig, MatchingConfig, ScreenConfig,
-            BattleConfig, ExpansionConfig, PathsConfig, LoggingConfig
-        )
-        
-        # Deep copy settings
-        new_settings = deepcopy(base_settings)
-        
-        # Override ADB config with device-specific serial
-        new_settings.adb = ADBConfig(
-            serial=serial,
-            command_timeout=base_settings.adb.command_timeout
+        # Settings are frozen, so the other sub-configs can be shared with the
+        # base settings; only the outer object and the ADB config are new
+        return replace(
+            base_settings,
+            adb=ADBConfig(
+                serial=serial,
+                command_timeout=base_settings.adb.command_timeout
+            ),
         )
-        
-        return new_settings
     
     def start(self) -> bool:
         """Start the bot instance."""
         if self.is_running:
-            logger.warning(f"Bot {self.slot_id} is already running")
-            return False
-
-        # For network devices (IP:port format), connect first
-        if ":" in self.device_serial and not self.device_serial.startswith("emulator-"):
-            logging.info(f"[Bot {self.slot_id + 1}] Connecting to network device {self.device_serial}")
-            if not DeviceManager.connect_device(self.device_serial):
-                self.status = "Connection Failed"
-                self.error_message = f"Cannot connect to device: {self.device_serial}"
-                logging.error(f"[Bot {self.slot_id + 1}] {self.error_message}")
-                return False
-            # Wait for connection to stabilize
-            time.sleep(1)
-
-        # Test device connection
-        if not DeviceManager.test_connection(self.device_serial):
-            self.status = "Connection Failed"
-            self.error_message = f"Cannot connect to device: {self.device_serial}"
-            logging.error(f"[Bot {self.slot_id + 1}] {self.error_message}")
+            logger.warning("Bot %s is already running", self.slot_id)
             return False
+        self._conn_cache = None
         
         # Verify templates exist
         template_dir = self.settings.paths.get_template_path(self.project_root) / "battle"
-        if not template_dir.exists():
+        if not _dir_exists(str(template_dir)):
             self.status = "Template Error"
             self.error_message = f"Template directory not found: {template_dir}"
-            logging.error(f"[Bot {self.slot_id + 1}] {self.error_message}")
+            logger.error("[Bot %s] %s", self.slot_id + 1, self.error_message)
             return False
         
         try:
             # Initialize bot
             self.status = "Initializing..."
             self.error_message = None
-            logging.info(f"[Bot {self.slot_id + 1}] Initializing with device {self.device_serial}")
+            logger.info("[Bot %s] Initializing with device %s", self.slot_id + 1, self.device_serial)
             
             self.bot = BattleBot(self.settings, self.project_root, slot_id=self.slot_id)
             
-            # Start bot in separate thread
+            # Start bot on a pooled worker thread; it reports "Running" once
+            # the device probe in _run_bot passes
             self.is_running = True
-            self.status = "Starting..."
+            self.status = "Connecting..."
             
-            self.bot_thread = threading.Thread(
-                target=self._run_bot,
-                daemon=True,
-                name=f"BotThread-{self.slot_id}"
-            )
-            self.bot_thread.start()
+            self.bot_future = self.executor.submit(self._run_bot)
             
-            logging.info(f"[Bot {self.slot_id + 1}] Started successfully")
+            logger.info("[Bot %s] Starting on %s", self.slot_id + 1, self.device_serial)
             return True
             
         except Exception as e:
             self.is_running = False
             self.status = "Initialization Failed"
             self.error_message = str(e)
-            logging.error(f"[Bot {self.slot_id + 1}] Failed to initialize: {e}", exc_info=True)
+            logger.error("[Bot %s] Failed to initialize: %s", self.slot_id + 1, e, exc_info=True)
             return False
     
+    def _connect(self) -> bool:
+        """
+        Connect to and probe the device (runs on the bot's worker thread).
+
+        Returns:
+            True if the device answered, False otherwise (status is set).
+        """
+        # For network devices (IP:port format), connect first
+        if ":" in self.device_serial and not self.device_serial.startswith("emulator-"):
+            logger.info("[Bot %s] Connecting to network device %s", self.slot_id + 1, self.device_serial)
+            if not DeviceManager.connect_device(self.device_serial):
+                self.status = "Connection Failed"
+                self.error_message = f"Cannot connect to device: {self.device_serial}"
+                logger.error("[Bot %s] %s", self.slot_id + 1, self.error_message)
+                return False
+            # Wait for connection to stabilize
+            time.sleep(1)
+
+        # Test device connection
+        if not DeviceManager.test_connection(self.device_serial):
+            self.status = "Connection Failed"
+            self.error_message = f"Cannot connect to device: {self.device_serial}"
+            logger.error("[Bot %s] %s", self.slot_id + 1, self.error_message)
+            return False
+        # Fresh result for the status poll that follows the start
+        self._conn_cache = (time.monotonic(), True)
+        return True
+
     def _run_bot(self) -> None:
         """Run bot in thread."""
+        # Probing here rather than in start() keeps the caller from blocking,
+        # and lets several bots probe their devices in parallel
+        if not self._connect():
+            self.is_running = False
+            return
+        if not self.is_running:
+            # Stopped while connecting
+            self.status = "Stopped"
+            return
         try:
             self.status = "Running"
-            logging.info(f"[Bot {self.slot_id + 1}] Running battle cycles on {self.device_serial}")
+            logger.info("[Bot %s] Running battle cycles on %s", self.slot_id + 1, self.device_serial)
             self.bot.run()
         except Exception as e:
             self.status = "Error"
             self.error_message = str(e)
-            logging.error(f"[Bot {self.slot_id + 1}] Error during execution: {e}", exc_info=True)
+            logger.error("[Bot %s] Error during execution: %s", self.slot_id + 1, e, exc_info=True)
         except KeyboardInterrupt:
-            logging.info(f"[Bot {self.slot_id + 1}] Interrupted by user")
+            logger.info("[Bot %s] Interrupted by user", self.slot_id + 1)
             self.status = "Stopped"
         finally:
             # Ensure we mark as stopped even if there was an error
             self.is_running = False
             if self.status != "Error":
                 self.status = "Stopped"
-            logging.info(f"[Bot {self.slot_id + 1}] Bot thread finished")
+            logger.info("[Bot %s] Bot thread finished", self.slot_id + 1)
     
     def stop(self) -> None:
         """Stop the bot instance."""
-        if not self.is_running and not (self.bot and hasattr(self.bot, '_stop_flag')):
+        if not self.is_running and self.bot is None:
             return
         
         self.status = "Stopping..."
         self.is_running = False
+        self._conn_cache = None
         
         if self.bot:
             try:
                 self.bot.stop()
-                logging.info(f"[Bot {self.slot_id + 1}] Stop requested")
+                logger.info("[Bot %s] Stop requested", self.slot_id + 1)
             except Exception as e:
-                logging.error(f"[Bot {self.slot_id + 1}] Error stopping bot: {e}", exc_info=True)
+                logger.error("[Bot %s] Error stopping bot: %s", self.slot_id + 1, e, exc_info=True)
                 # Still mark as stopped even if stop() failed
                 self.status = "Stopped"
     
-    def get_status_info(self) -> Dict[str, any]:
-        """Get current status information."""
-        return {
+    def get_status_info(self, connected_serials: Optional[Set[str]] = None) -> Dict[str, any]:
+        """
+        Get current status information.
+        
+        The returned dict is shared between calls while nothing changes and
+        must not be modified.
+        
+        Args:
+            connected_serials: Serials from one shared `adb devices` listing
+                (see DeviceManager.get_connected_serials). If given, the
+                connection state is looked up there instead of probed.
+        """
+        if connected_serials is not None:
+            is_connected = bool(self.device_serial) and self.device_serial in connected_serials
+        else:
+            is_connected = self._is_connected()
+        
+        # Unchanged since the last call: hand back the same snapshot, so callers
+        # can skip re-rendering with a cheap identity check
+        key = (self.is_running, self.status, self.error_message, is_connected)
+        if self._status_snapshot is not None and self._status_snapshot[0] == key:
+            return self._status_snapshot[1]
+        
+        info = {
             "slot_id": self.slot_id,
             "device_serial": self.device_serial,
             "is_running": self.is_running,
             "status": self.status,
             "error_message": self.error_message,
-            "is_connected": DeviceManager.test_connection(self.device_serial) if self.device_serial else False
+            "is_connected": is_connected,
         }
+        self._status_snapshot = (key, info)
+        return info
+    
+    def _is_connected(self) -> bool:
+        """Check the device connection, reusing results younger than _CONN_TTL."""
+        if not self.device_serial:
+            return False
+        
+        now = time.monotonic()
+        cached = self._conn_cache
+        if cached is not None and now - cached[0] < self._CONN_TTL:
+            return cached[1]
+        
+        is_connected = DeviceManager.test_connection(
+            self.device_serial, client=self.bot.client if self.bot else None
+        )
+        self._conn_cache = (now, is_connected)
+        return is_connected
 
 
 class MultiBotManager:
@@ -180,6 +264,16 @@ class MultiBotManager:
         self.base_settings = base_settings
         self.project_root = project_root
         self.bots: Dict[int, BotInstance] = {}
+        # Worker threads are reused across bot starts/restarts instead of
+        # creating a new thread each time. Headroom over MAX_BOTS lets a new
+        # bot start while a removed one is still winding down.
+        # A bot's whole run() must stay on one thread: battle_bot keeps the
+        # serial, slot and screenshot backend in thread-locals, so bots can't
+        # be split into steps scheduled on an event loop. Waits inside a run
+        # block on the bot's stop Event, which stop() sets for instant wakeup.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_BOTS * 2, thread_name_prefix="Bot"
+        )
         
     def create_bot(self, slot_id: int, device_serial: str) -> bool:
         """
@@ -193,28 +287,30 @@ class MultiBotManager:
             True if bot was created successfully.
         """
         if slot_id < 0 or slot_id >= self.MAX_BOTS:
-            logging.error(f"Invalid slot_id: {slot_id}. Must be 0-{self.MAX_BOTS-1}")
+            logger.error("Invalid slot_id: %s. Must be 0-%s", slot_id, self.MAX_BOTS - 1)
             return False
         
         if not device_serial or not device_serial.strip():
-            logging.error(f"Invalid device_serial for slot {slot_id}")
+            logger.error("Invalid device_serial for slot %s", slot_id)
             return False
         
         device_serial = device_serial.strip()
         
         # Check if slot is already occupied
         if slot_id in self.bots:
-            logging.warning(f"Slot {slot_id} already has a bot. Stopping existing bot first.")
+            logger.warning("Slot %s already has a bot. Stopping existing bot first.", slot_id)
             self.stop_bot(slot_id)
         
         # Create bot instance
         try:
-            bot_instance = BotInstance(slot_id, device_serial, self.base_settings, self.project_root)
+            bot_instance = BotInstance(
+                slot_id, device_serial, self.base_settings, self.project_root, self._executor
+            )
             self.bots[slot_id] = bot_instance
-            logging.info(f"[Bot {slot_id + 1}] Created bot instance for device {device_serial}")
+            logger.info("[Bot %s] Created bot instance for device %s", slot_id + 1, device_serial)
             return True
         except Exception as e:
-            logging.error(f"Failed to create bot in slot {slot_id}: {e}", exc_info=True)
+            logger.error("Failed to create bot in slot %s: %s", slot_id, e, exc_info=True)
             return False
     
     def start_bot(self, slot_id: int) -> bool:
@@ -228,7 +324,7 @@ class MultiBotManager:
             True if bot started successfully.
         """
         if slot_id not in self.bots:
-            logging.error(f"No bot in slot {slot_id}")
+            logger.error("No bot in slot %s", slot_id)
             return False
         
         return self.bots[slot_id].start()
@@ -261,41 +357,35 @@ class MultiBotManager:
         try:
             self.stop_bot(slot_id)
         except Exception as e:
-            logging.error(f"[Bot {slot_id + 1}] Error stopping bot during removal: {e}")
+            logger.error("[Bot %s] Error stopping bot during removal: %s", slot_id + 1, e)
         
-        # Wait for thread to finish (with shorter timeout to avoid blocking GUI)
-        if bot_instance.bot_thread and bot_instance.bot_thread.is_alive():
-            logging.info(f"[Bot {slot_id + 1}] Waiting for bot thread to finish...")
+        # Wait for the bot loop to finish (with shorter timeout to avoid blocking GUI)
+        if bot_instance.bot_future and not bot_instance.bot_future.done():
+            logger.info("[Bot %s] Waiting for bot thread to finish...", slot_id + 1)
             # Use shorter timeout since this runs in background thread
-            bot_instance.bot_thread.join(timeout=3.0)
-            
-            # If thread is still alive after timeout, log warning but continue
-            # Since it's a daemon thread, it will be terminated when main thread exits
-            if bot_instance.bot_thread.is_alive():
-                logging.warning(f"[Bot {slot_id + 1}] Bot thread did not finish within timeout (daemon thread will be terminated)")
+            try:
+                bot_instance.bot_future.result(timeout=3.0)
+            except FutureTimeoutError:
+                # Log warning but continue; the loop exits on its own once it
+                # sees the stop flag, freeing its worker thread
+                logger.warning("[Bot %s] Bot thread did not finish within timeout", slot_id + 1)
+            except Exception as e:
+                logger.warning("[Bot %s] Bot thread ended with error: %s", slot_id + 1, e)
         
         # Cleanup bot resources
         try:
             if bot_instance.bot:
-                # Ensure stop flag is set
-                if hasattr(bot_instance.bot, '_stop_flag'):
-                    bot_instance.bot._stop_flag = True
-                # Close ADB client if possible
-                if hasattr(bot_instance.bot, 'client'):
-                    try:
-                        # ADBClient doesn't have explicit close, but we can mark it as stopped
-                        pass
-                    except Exception as e:
-                        logging.debug(f"[Bot {slot_id + 1}] Error closing ADB client: {e}")
+                # Set stop flag and close the persistent ADB shell
+                bot_instance.bot.shutdown()
         except Exception as e:
-            logging.warning(f"[Bot {slot_id + 1}] Error during bot cleanup: {e}")
+            logger.warning("[Bot %s] Error during bot cleanup: %s", slot_id + 1, e)
         
         # Remove from dictionary
         try:
             del self.bots[slot_id]
-            logging.info(f"[Bot {slot_id + 1}] Removed bot from slot")
+            logger.info("[Bot %s] Removed bot from slot", slot_id + 1)
         except Exception as e:
-            logging.error(f"[Bot {slot_id + 1}] Error removing bot from dictionary: {e}")
+            logger.error("[Bot %s] Error removing bot from dictionary: %s", slot_id + 1, e)
     
     def stop_all(self) -> None:
         """Stop all running bots (non-blocking)."""
@@ -305,10 +395,38 @@ class MultiBotManager:
             try:
                 self.stop_bot(slot_id)
             except Exception as e:
-                logging.error(f"[Bot {slot_id + 1}] Error stopping: {e}")
+                logger.error("[Bot %s] Error stopping: %s", slot_id + 1, e)
         
         # Note: We don't wait for threads to finish here to avoid blocking GUI shutdown
-        # Daemon threads will be terminated when main thread exits
+    
+    def remove_all(self) -> None:
+        """
+        Stop and remove every bot, waiting for the removals in parallel.
+        
+        remove_bot blocks until the bot thread finishes and its ADB shell is
+        closed, so removing the slots one after another would add up those
+        waits.
+        """
+        slot_ids = list(self.bots.keys())
+        if not slot_ids:
+            return
+        # Signal every bot first so they all wind down at once
+        self.stop_all()
+        # A separate short-lived pool: the bot pool may be busy with the very
+        # loops these removals wait on
+        with ThreadPoolExecutor(max_workers=len(slot_ids), thread_name_prefix="BotRemove") as pool:
+            futures = {slot_id: pool.submit(self.remove_bot, slot_id) for slot_id in slot_ids}
+            for slot_id, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("[Bot %s] Error removing bot: %s", slot_id + 1, e)
+    
+    def close(self) -> None:
+        """Stop all bots and release the worker pool (non-blocking)."""
+        self.stop_all()
+        # Bots exit their loops on the stop flag; don't wait for them here
+        self._executor.shutdown(wait=False)
     
     def get_bot_status(self, slot_id: int) -> Optional[Dict[str, any]]:
         """
@@ -327,8 +445,12 @@ class MultiBotManager:
     
     def get_all_statuses(self) -> Dict[int, Dict[str, any]]:
         """Get status of all bot instances."""
+        if not self.bots:
+            return {}
+        # One `adb devices` for every slot instead of one probe per slot
+        connected_serials = DeviceManager.get_connected_serials()
         return {
-            slot_id: bot.get_status_info()
+            slot_id: bot.get_status_info(connected_serials)
             for slot_id, bot in self.bots.items()
         }
     
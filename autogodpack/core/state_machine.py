@@ -1,9 +1,14 @@
 """Screen state detection and state machine."""
 
 import logging
-from typing import Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+import cv2
+import numpy as np
+
 from ..adb.client import ADBClient
 from ..image.screenshot import ScreenshotCapture
 from ..image.matcher import TemplateMatcher
@@ -11,6 +16,61 @@ from ..config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Templates that identify each screen on their own, for the last-screen fast
+# path, in the full scan's priority order. battle_setup is left out: it depends
+# on the Expansions button being absent. So is the hourglass, which only counts
+# as battle_selection once every other screen has been ruled out.
+_SCREEN_HINT_TEMPLATES = {
+    "screen_8": ("screen_8/ok.png",),
+    "defeat_popup": ("screen_defeat_popup/back.png",),
+    "screen_7": ("screen_7/next.png",),
+    "defeat_screen": ("screen_defeat/defeat.png",),
+    "select_expansion": ("select_expansion/close_button/close_x.png",),
+    "battle_selection": ("screen_1_battle_selection/expansions.png",),
+    "battle_in_progress": (
+        "battle_in_progress/opponent.png",
+        "battle_in_progress/put_basic_pokemon.png",
+    ),
+    "screens_4_5_6": ("screen_4_5_6/tap_to_proceed.png",),
+    "result_screen": ("screen_3_victory/tap_to_proceed.png",),
+}
+# The full scan checks battle_setup (auto.png) right before this screen
+_AFTER_BATTLE_SETUP = "screens_4_5_6"
+# Button/text templates with distinctive shapes, matched in grayscale (a third
+# of the bytes per match); the expansion icons and the rest stay in color
+_GRAY_TEMPLATES = frozenset((
+    "screen_8/ok.png",
+    "screen_defeat_popup/back.png",
+    "screen_7/next.png",
+    "screen_defeat/defeat.png",
+    "screen_4_5_6/tap_to_proceed.png",
+    "screen_3_victory/tap_to_proceed.png",
+))
+# Run the full priority scan at least this often, so a stale hint can't stick
+_HINT_REVALIDATE_EVERY = 5
+
+# Fixed templates checked by the full scan (expansion templates are added per
+# StateMachine from the settings)
+_FULL_SCAN_TEMPLATES = (
+    "screen_8/ok.png",
+    "screen_defeat_popup/back.png",
+    "screen_7/next.png",
+    "screen_defeat/defeat.png",
+    "select_expansion/close_button/close_x.png",
+    "screen_1_battle_selection/expansions.png",
+    "battle_in_progress/opponent.png",
+    "battle_in_progress/put_basic_pokemon.png",
+    "screen_2_battle_setup/auto.png",
+    "screen_2_battle_setup/battle.png",
+    "screen_4_5_6/tap_to_proceed.png",
+    "screen_3_victory/tap_to_proceed.png",
+    "screen_1_battle_selection/hourglass.png",
+)
+
+# Shared by all bots' state machines: full scans from every bot spread over
+# the CPU cores instead of running serially on each bot thread
+_MATCH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="Match")
+
 
 class StateMachine:
     """Manages screen state detection and transitions."""
@@ -39,6 +99,116 @@ class StateMachine:
         self.settings = settings
         self.template_base_dir = template_base_dir
         self.battle_dir = template_base_dir / "battle"
+        # Every battle template decoded once, keyed by its path relative to
+        # battle_dir ("screen_8/ok.png"). A missing key means the file doesn't
+        # exist, so detection needs no per-frame exists() checks.
+        self._templates: Dict[str, np.ndarray] = self._load_templates()
+        # Grayscale copies of the _GRAY_TEMPLATES that exist
+        self._templates_gray: Dict[str, np.ndarray] = {
+            key: cv2.cvtColor(self._templates[key], cv2.COLOR_BGR2GRAY)
+            for key in _GRAY_TEMPLATES
+            if key in self._templates
+        }
+        # Matcher cache keys, stringified once instead of per match
+        self._template_strs: Dict[str, str] = {
+            key: str(self.battle_dir / key) for key in self._templates
+        }
+        self._template_strs_gray: Dict[str, str] = {
+            key: f"{self._template_strs[key]}#gray" for key in self._templates_gray
+        }
+        for key, template in self._templates.items():
+            self.matcher.warm_template(self._template_strs[key], template)
+        for key, template in self._templates_gray.items():
+            self.matcher.warm_template(self._template_strs_gray[key], template)
+        # Grayscale conversion of the last screen (kept with the screen itself)
+        self._gray_screen: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # Last detected screen, tried first on the next detection
+        self._last_screen: Optional[str] = None
+        self._hint_hits = 0
+        # Expansion templates present on disk, in detection order (settings
+        # are frozen, so this never changes)
+        self._expansion_keys: List[str] = self._resolve_expansion_keys()
+        # Every template the full scan may look at
+        self._full_scan_keys: List[str] = list(_FULL_SCAN_TEMPLATES) + self._expansion_keys
+
+    def _resolve_expansion_keys(self) -> List[str]:
+        """
+        Build the template keys of the configured expansions.
+
+        Returns:
+            Keys of the expansion templates that exist, series A first.
+        """
+        expansions = self.settings.expansions
+        keys: List[str] = []
+        for expansion in expansions.series_a + expansions.series_b:
+            if expansion in expansions.series_a:
+                key = f"select_expansion/series_a/{expansion}.png"
+            else:
+                key = f"select_expansion/series_b/{expansion}.png"
+            if key in self._templates and key not in keys:
+                keys.append(key)
+        return keys
+
+    def _load_templates(self) -> Dict[str, np.ndarray]:
+        """
+        Decode all PNG templates under battle_dir.
+
+        Returns:
+            Mapping of relative template path to BGR image array.
+        """
+        templates: Dict[str, np.ndarray] = {}
+        for root, _, files in os.walk(self.battle_dir):
+            for filename in files:
+                if not filename.lower().endswith(".png"):
+                    continue
+                path = Path(root) / filename
+                template = cv2.imread(str(path), cv2.IMREAD_COLOR)
+                if template is None:
+                    logger.warning(f"Failed to load template: {path}")
+                    continue
+                templates[path.relative_to(self.battle_dir).as_posix()] = template
+        return templates
+
+    def _find(self, screen: np.ndarray, key: str) -> Optional[tuple]:
+        """
+        Match a preloaded battle template.
+
+        Args:
+            screen: BGR image array of the screen.
+            key: Template path relative to battle_dir.
+
+        Returns:
+            (x, y) center coordinates, or None if not found or not present.
+        """
+        template = self._templates_gray.get(key)
+        if template is not None:
+            return self.matcher.find_template_image(
+                self._gray(screen), template, threshold=0.75,
+                cache_key=self._template_strs_gray[key],
+            )
+        template = self._templates.get(key)
+        if template is None:
+            return None
+        return self.matcher.find_template_image(
+            screen, template, threshold=0.75, cache_key=self._template_strs[key]
+        )
+
+    def _gray(self, screen: np.ndarray) -> np.ndarray:
+        """
+        Get the grayscale screen, converting only once per frame.
+
+        Args:
+            screen: BGR image array of the screen.
+
+        Returns:
+            Single-channel image of the screen.
+        """
+        cached = self._gray_screen
+        if cached is not None and cached[0] is screen:
+            return cached[1]
+        gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
+        self._gray_screen = (screen, gray)
+        return gray
 
     def detect_current_screen(self, verbose: bool = True) -> Optional[str]:
         """
@@ -57,126 +227,148 @@ class StateMachine:
             # Only log critical errors
             return None
 
+        # Steady state: the bot is usually still on the screen it was on last
+        # time, so try that screen's templates before the full scan
+        detected = None
+        if self._last_screen is not None and self._hint_hits < _HINT_REVALIDATE_EVERY:
+            detected = self._detect_from_hint(screen, self._last_screen)
+        if detected is not None:
+            self._hint_hits += 1
+        else:
+            detected = self._detect_full(screen)
+            self._hint_hits = 0
+        self._last_screen = detected
+        return detected
+
+    def _match_all(
+        self, screen: np.ndarray, keys: List[str]
+    ) -> Dict[str, Optional[tuple]]:
+        """
+        Match several preloaded templates concurrently on the shared pool.
+
+        Args:
+            screen: BGR image array of the screen.
+            keys: Template paths relative to battle_dir (missing ones skipped).
+
+        Returns:
+            Mapping of key to (x, y) center coordinates or None.
+        """
+        keys = [key for key in keys if key in self._templates]
+        # Build the grayscale screen and both pyramids first so the worker
+        # threads only read them
+        self.matcher.prepare_screen(screen)
+        if self._templates_gray:
+            self.matcher.prepare_screen(self._gray(screen))
+        results = _MATCH_POOL.map(lambda key: self._find(screen, key), keys)
+        return dict(zip(keys, results))
+
+    def _detect_from_hint(self, screen: np.ndarray, hint: str) -> Optional[str]:
+        """
+        Check the hinted screen and the screens that outrank it.
+
+        Screens are checked in the full scan's priority order, up to the hint,
+        so a higher-priority screen (including pop-ups drawn over the hinted
+        one) still wins. Select Expansion is recognized by its close button
+        only; the expansion icons are left to the full scan.
+
+        Args:
+            screen: BGR image array of the screen.
+            hint: Previously detected screen name.
+
+        Returns:
+            Screen name, or None if the hint didn't match (full scan needed).
+        """
+        if hint not in _SCREEN_HINT_TEMPLATES:
+            return None
+        for name, keys in _SCREEN_HINT_TEMPLATES.items():
+            if name == _AFTER_BATTLE_SETUP and self._find(screen, "screen_2_battle_setup/auto.png"):
+                # May be battle_setup, which needs the full set of checks
+                return None
+            if any(self._find(screen, key) for key in keys):
+                return name
+            if name == hint:
+                break
+        return None
+
+    def _detect_full(self, screen: np.ndarray) -> Optional[str]:
+        """
+        Detect the screen by checking every screen in priority order.
+
+        Args:
+            screen: BGR image array of the screen.
+
+        Returns:
+            Screen name or None if not recognized.
+        """
+        # Match every candidate template up front, in parallel (OpenCV
+        # releases the GIL), then apply the priority rules to the results
+        matches = self._match_all(screen, self._full_scan_keys)
+        found = matches.get
+
         # Check screens in priority order (most specific first)
+        templates = self._templates
         detected_templates = []
 
         # Screen 8: Pop-up OK (most specific - appears over other screens)
-        ok_path = self.battle_dir / "screen_8" / "ok.png"
-        if ok_path.exists():
-            ok_pos = self.matcher.find_template(
-                screen, str(ok_path), threshold=0.75, verbose=False
-            )
-            if ok_pos:
+        if "screen_8/ok.png" in templates:
+            if found("screen_8/ok.png"):
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "screen_8"
             detected_templates.append(("ok.png", False))
 
         # Screen Defeat Popup
-        back_path = self.battle_dir / "screen_defeat_popup" / "back.png"
-        if back_path.exists():
-            back_pos = self.matcher.find_template(
-                screen, str(back_path), threshold=0.75, verbose=False
-            )
-            if back_pos:
+        if "screen_defeat_popup/back.png" in templates:
+            if found("screen_defeat_popup/back.png"):
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "defeat_popup"
             detected_templates.append(("back.png", False))
 
         # Screen 7: Next button
-        next_path = self.battle_dir / "screen_7" / "next.png"
-        if next_path.exists():
-            next_pos = self.matcher.find_template(
-                screen, str(next_path), threshold=0.75, verbose=False
-            )
-            if next_pos:
+        if "screen_7/next.png" in templates:
+            if found("screen_7/next.png"):
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "screen_7"
             detected_templates.append(("next.png", False))
 
         # Screen Defeat
-        defeat_path = self.battle_dir / "screen_defeat" / "defeat.png"
-        if defeat_path.exists():
-            defeat_pos = self.matcher.find_template(
-                screen, str(defeat_path), threshold=0.75, verbose=False
-            )
-            if defeat_pos:
+        if "screen_defeat/defeat.png" in templates:
+            if found("screen_defeat/defeat.png"):
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "defeat_screen"
             detected_templates.append(("defeat.png", False))
 
         # Select Expansion Screen
-        close_x_path = self.battle_dir / "select_expansion" / "close_button" / "close_x.png"
-        has_close_button = False
-        if close_x_path.exists():
-            close_pos = self.matcher.find_template(
-                screen, str(close_x_path), threshold=0.75, verbose=False
-            )
-            if close_pos:
-                has_close_button = True
-
-        if has_close_button:
+        if found("select_expansion/close_button/close_x.png"):
             # Screen detection logged in battle_bot.py with bot prefix
             return "select_expansion"
 
-        # Check for expansions visible
-        for expansion in (
-            self.settings.expansions.series_a + self.settings.expansions.series_b
-        ):
-            exp_path = None
-            if expansion in self.settings.expansions.series_a:
-                exp_path = self.battle_dir / "select_expansion" / "series_a" / f"{expansion}.png"
-            else:
-                exp_path = self.battle_dir / "select_expansion" / "series_b" / f"{expansion}.png"
-
-            if exp_path.exists():
-                pos = self.matcher.find_template(
-                    screen, str(exp_path), threshold=0.75, verbose=False
-                )
-                if pos:
-                    # Check if also has Expansions button (battle_selection)
-                    expansions_path = (
-                        self.battle_dir / "screen_1_battle_selection" / "expansions.png"
-                    )
-                    has_expansions_button = False
-                    if expansions_path.exists():
-                        expansions_pos = self.matcher.find_template(
-                            screen, str(expansions_path), threshold=0.75, verbose=False
-                        )
-                        if expansions_pos:
-                            has_expansions_button = True
-
-                    if not has_expansions_button:
-                        # Screen detection logged in battle_bot.py with bot prefix
-                        return "select_expansion"
+        # Check for expansions visible (unless the Expansions button shows
+        # this is battle_selection)
+        if not found("screen_1_battle_selection/expansions.png"):
+            for exp_key in self._expansion_keys:
+                if found(exp_key):
+                    # Screen detection logged in battle_bot.py with bot prefix
+                    return "select_expansion"
 
         # Screen 1: Battle Selection (expansions button)
-        expansions_path = self.battle_dir / "screen_1_battle_selection" / "expansions.png"
         expansions_pos = None
-        if expansions_path.exists():
-            expansions_pos = self.matcher.find_template(
-                screen, str(expansions_path), threshold=0.75, verbose=False
-            )
+        if "screen_1_battle_selection/expansions.png" in templates:
+            expansions_pos = found("screen_1_battle_selection/expansions.png")
             if expansions_pos:
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "battle_selection"
             detected_templates.append(("expansions.png", False))
 
         # Battle In Progress
-        opponent_path = self.battle_dir / "battle_in_progress" / "opponent.png"
-        put_basic_path = self.battle_dir / "battle_in_progress" / "put_basic_pokemon.png"
         opponent_pos = None
         put_basic_pos = None
 
-        if opponent_path.exists():
-            opponent_pos = self.matcher.find_template(
-                screen, str(opponent_path), threshold=0.75, verbose=False
-            )
+        if "battle_in_progress/opponent.png" in templates:
+            opponent_pos = found("battle_in_progress/opponent.png")
             detected_templates.append(("opponent.png", opponent_pos is not None))
 
-        if put_basic_path.exists():
-            put_basic_pos = self.matcher.find_template(
-                screen, str(put_basic_path), threshold=0.75, verbose=False
-            )
+        if "battle_in_progress/put_basic_pokemon.png" in templates:
+            put_basic_pos = found("battle_in_progress/put_basic_pokemon.png")
             detected_templates.append(("put_basic_pokemon.png", put_basic_pos is not None))
 
         if opponent_pos or put_basic_pos:
@@ -184,21 +376,15 @@ class StateMachine:
             return "battle_in_progress"
 
         # Screen 2: Battle Setup
-        auto_path = self.battle_dir / "screen_2_battle_setup" / "auto.png"
-        battle_path = self.battle_dir / "screen_2_battle_setup" / "battle.png"
         auto_pos = None
         battle_pos = None
 
-        if auto_path.exists():
-            auto_pos = self.matcher.find_template(
-                screen, str(auto_path), threshold=0.75, verbose=False
-            )
+        if "screen_2_battle_setup/auto.png" in templates:
+            auto_pos = found("screen_2_battle_setup/auto.png")
             detected_templates.append(("auto.png", auto_pos is not None))
 
-        if battle_path.exists():
-            battle_pos = self.matcher.find_template(
-                screen, str(battle_path), threshold=0.75, verbose=False
-            )
+        if "screen_2_battle_setup/battle.png" in templates:
+            battle_pos = found("screen_2_battle_setup/battle.png")
             detected_templates.append(("battle.png", battle_pos is not None))
 
         # Only consider Screen 2 if auto.png found AND no Expansions button
@@ -207,34 +393,22 @@ class StateMachine:
             return "battle_setup"
 
         # Screens 4-5-6: Tap to Proceed
-        tap_4_5_6_path = self.battle_dir / "screen_4_5_6" / "tap_to_proceed.png"
-        if tap_4_5_6_path.exists():
-            tap_4_5_6_pos = self.matcher.find_template(
-                screen, str(tap_4_5_6_path), threshold=0.75, verbose=False
-            )
-            if tap_4_5_6_pos:
+        if "screen_4_5_6/tap_to_proceed.png" in templates:
+            if found("screen_4_5_6/tap_to_proceed.png"):
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "screens_4_5_6"
             detected_templates.append(("tap_to_proceed (4-5-6)", False))
 
         # Screen 3: Result Screen
-        tap_result_path = self.battle_dir / "screen_3_victory" / "tap_to_proceed.png"
-        if tap_result_path.exists():
-            tap_result_pos = self.matcher.find_template(
-                screen, str(tap_result_path), threshold=0.75, verbose=False
-            )
-            if tap_result_pos:
+        if "screen_3_victory/tap_to_proceed.png" in templates:
+            if found("screen_3_victory/tap_to_proceed.png"):
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "result_screen"
             detected_templates.append(("tap_to_proceed (result)", False))
 
         # Screen 1: Battle Selection (hourglass - secondary indicator)
-        hourglass_path = self.battle_dir / "screen_1_battle_selection" / "hourglass.png"
-        if hourglass_path.exists():
-            hourglass_pos = self.matcher.find_template(
-                screen, str(hourglass_path), threshold=0.75, verbose=False
-            )
-            if hourglass_pos:
+        if "screen_1_battle_selection/hourglass.png" in templates:
+            if found("screen_1_battle_selection/hourglass.png"):
                 # Screen detection logged in battle_bot.py with bot prefix
                 return "battle_selection"
             detected_templates.append(("hourglass.png", False))
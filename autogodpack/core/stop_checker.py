@@ -1,20 +1,34 @@
 """Stop flag checker for interrupting long-running operations."""
 
 import threading
+import time
+from contextvars import ContextVar
 from typing import Callable, Optional
 
 
 class StopChecker:
     """Manages stop flag checking for interruptible operations."""
 
-    def __init__(self, check_func: Callable[[], bool]):
+    def __init__(
+        self,
+        check_func: Optional[Callable[[], bool]] = None,
+        stop_event: Optional[threading.Event] = None,
+    ):
         """
         Initialize stop checker.
 
         Args:
             check_func: Function that returns True if stop is requested.
+            stop_event: Event set when stop is requested. Preferred over
+                check_func: sleeps wait on it and wake as soon as it is set.
+
+        Raises:
+            ValueError: If neither check_func nor stop_event is given.
         """
-        self.check_func = check_func
+        if check_func is None and stop_event is None:
+            raise ValueError("StopChecker needs check_func or stop_event")
+        self.stop_event = stop_event
+        self.check_func = stop_event.is_set if stop_event is not None else check_func
 
     def check(self) -> bool:
         """
@@ -31,46 +45,53 @@ class StopChecker:
 
         Args:
             duration: Total sleep duration in seconds.
-            check_interval: How often to check stop flag.
+            check_interval: How often to check stop flag (check_func only).
 
         Returns:
             True if interrupted by stop request, False if completed normally.
         """
+        if self.stop_event is not None:
+            # Returns as soon as stop is requested - no polling
+            return self.stop_event.wait(duration)
+
         remaining = duration
         while remaining > 0:
             if self.check():
                 return True  # Interrupted
             sleep_time = min(check_interval, remaining)
-            import time
             time.sleep(sleep_time)
             remaining -= sleep_time
         return False  # Completed normally
 
 
-# Global stop checker instance (set by BattleBot)
-_global_stop_checker: Optional[StopChecker] = None
+# Stop checker of the bot running in the current thread (set by BattleBot).
+# A ContextVar rather than a module global: every bot thread sees only its own
+# checker, so one bot's stop request never leaks into another bot's checks.
+_global_stop_checker: ContextVar[Optional[StopChecker]] = ContextVar(
+    "stop_checker", default=None
+)
 
 
-def set_global_stop_checker(checker: StopChecker) -> None:
-    """Set global stop checker instance."""
-    global _global_stop_checker
-    _global_stop_checker = checker
+def set_global_stop_checker(checker: Optional[StopChecker]) -> None:
+    """Set the stop checker for the current thread (None clears it)."""
+    _global_stop_checker.set(checker)
 
 
 def get_global_stop_checker() -> Optional[StopChecker]:
-    """Get global stop checker instance."""
-    return _global_stop_checker
+    """Get the stop checker of the current thread."""
+    return _global_stop_checker.get()
 
 
 def check_stop() -> bool:
     """
-    Check global stop flag.
+    Check the current thread's stop flag.
 
     Returns:
         True if stop requested, False otherwise.
     """
-    if _global_stop_checker:
-        return _global_stop_checker.check()
+    checker = _global_stop_checker.get()
+    if checker is not None:
+        return checker.check()
     return False
 
 
@@ -2,12 +2,23 @@
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+import json
 import threading
+import time
 import logging
 import traceback
 import sys
+from collections import deque
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Deque, Dict, List, Set, Tuple
+
+# Optional: faster JSON for the expansion files (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..config.loader import load_config
 from ..config.settings import Settings
@@ -16,17 +27,144 @@ from ..adb.client import ADBClient
 from ..utils.logging import setup_logging
 from ..core.bot import BattleBot
 from ..core.multi_bot_manager import MultiBotManager
+from ..state.models import ExpansionState
+from ..state.persistence import StatePersistence, write_file_atomic
 from .debug_window import DebugWindow
 from .error_handler import safe_call, log_to_file
 from ..image.screenshot import ScreenshotCapture
 
+# Expansion lists (matching battle_bot.py)
+EXPANSIONS_SERIES_A = ["GA", "MI", "STS", "TL", "SR", "CG", "EC", "EG", "WSS", "SS", "DPex"]
+EXPANSIONS_SERIES_B = ["CB", "MR"]
+
+# Bit of each expansion key in a bot's completion mask
+EXPANSION_INDEX: Dict[str, int] = {
+    key: i
+    for i, key in enumerate(
+        [f"A_{e}" for e in EXPANSIONS_SERIES_A] + [f"B_{e}" for e in EXPANSIONS_SERIES_B]
+    )
+}
+
+
+def expansion_mask(completed) -> int:
+    """
+    Build the completion mask of a set of expansion keys.
+
+    Args:
+        completed: Completed expansion keys ("A_GA", "B_CB", ...).
+
+    Returns:
+        Integer with the EXPANSION_INDEX bit of every known key set.
+    """
+    mask = 0
+    for key in completed:
+        bit = EXPANSION_INDEX.get(key)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+
+# Repository root (holds config.yaml, templates and state files)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Navy color theme - single shade of navy and gray
+NAVY_COLOR = '#1e3a5f'
+# Use the same gray shade as inside LabelFrames (system default for clam theme)
+GRAY_COLOR = '#f0f0f0'
+
+# ttk style options applied once at startup: (style name, configure options)
+_STYLE_CONFIG = (
+    # Notebook styling - gray background for content area
+    ('TNotebook', dict(background=GRAY_COLOR, borderwidth=0, relief='flat')),
+    # Valve-style tabs: selected tab expands upward with gray bg and navy text
+    # Unselected tabs: navy bg with gray text (no white)
+    ('TNotebook.Tab', dict(
+        background=NAVY_COLOR,
+        foreground=GRAY_COLOR,
+        borderwidth=0,
+        padding=[12, 8],
+        focuscolor='none',
+        relief='flat',
+        font=('Arial', 9),
+    )),
+    # Frame styling - all frames use gray background
+    ('TFrame', dict(background=GRAY_COLOR)),
+    ('TLabelFrame', dict(background=GRAY_COLOR, foreground=NAVY_COLOR, borderwidth=1)),
+    ('TLabelFrame.Label', dict(background=GRAY_COLOR, foreground=NAVY_COLOR, font=('Arial', 9, 'bold'))),
+    # Button styling - gray text on navy (no white)
+    ('TButton', dict(background=NAVY_COLOR, foreground=GRAY_COLOR, borderwidth=1, padding=5)),
+    # Icon button style for bot controls
+    ('Icon.TButton', dict(background=NAVY_COLOR, foreground=GRAY_COLOR, borderwidth=1, padding=3, font=('Arial', 10))),
+    # Label styling
+    ('TLabel', dict(background=GRAY_COLOR)),
+    ('TCheckbutton', dict(background=GRAY_COLOR)),
+    # Entry styling - use navy background with gray text (no white)
+    ('TEntry', dict(fieldbackground=NAVY_COLOR, foreground=GRAY_COLOR, borderwidth=1)),
+    # Scrollbar styling - ensure no white parts
+    ('TScrollbar', dict(
+        background=GRAY_COLOR,
+        troughcolor=GRAY_COLOR,
+        borderwidth=0,
+        darkcolor=GRAY_COLOR,
+        lightcolor=GRAY_COLOR,
+    )),
+)
+
+# State-dependent ttk style options: (style name, map options)
+_BUTTON_STATE_MAP = dict(
+    background=[('active', NAVY_COLOR), ('pressed', NAVY_COLOR)],
+    foreground=[('active', GRAY_COLOR), ('pressed', GRAY_COLOR)],
+)
+_STYLE_MAP = (
+    ('TNotebook.Tab', dict(
+        background=[('selected', GRAY_COLOR), ('active', NAVY_COLOR)],
+        foreground=[('selected', NAVY_COLOR), ('active', GRAY_COLOR)],
+        # Expand upward when selected - increase top padding
+        padding=[('selected', [12, 16, 8, 8]), ('!selected', [12, 8])],
+        # Use expand for additional upward push
+        expand=[('selected', [1, 1, 6, 0])],
+    )),
+    ('TButton', _BUTTON_STATE_MAP),
+    ('Icon.TButton', _BUTTON_STATE_MAP),
+    ('TScrollbar', dict(
+        background=[('active', GRAY_COLOR), ('pressed', GRAY_COLOR)],
+        troughcolor=[('active', GRAY_COLOR), ('pressed', GRAY_COLOR)],
+    )),
+)
+
+
+def bind_scroll_region(canvas: tk.Canvas, frame: tk.Widget) -> None:
+    """
+    Keep a canvas' scroll region fitted to an embedded frame.
+
+    Bursts of <Configure> events (e.g. while the frame is being filled) are
+    coalesced into a single bbox() recomputation at idle time.
+
+    Args:
+        canvas: Canvas the frame is embedded in.
+        frame: Frame whose size changes drive the scroll region.
+    """
+    pending = False
+
+    def update() -> None:
+        nonlocal pending
+        pending = False
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+    def request(event=None) -> None:
+        nonlocal pending
+        if not pending:
+            pending = True
+            canvas.after_idle(update)
+
+    frame.bind("<Configure>", request)
+
 
 class ExpansionManagerWindow:
     """Window for managing expansion completion status."""
     
-    # Expansion lists (matching battle_bot.py)
-    EXPANSIONS_SERIES_A = ["GA", "MI", "STS", "TL", "SR", "CG", "EC", "EG", "WSS", "SS", "DPex"]
-    EXPANSIONS_SERIES_B = ["CB", "MR"]
+    EXPANSIONS_SERIES_A = EXPANSIONS_SERIES_A
+    EXPANSIONS_SERIES_B = EXPANSIONS_SERIES_B
     
     def __init__(self, parent: tk.Tk, project_root: Path):
         """
@@ -47,6 +185,12 @@ class ExpansionManagerWindow:
         
         # Load current completed expansions
         self.completed_expansions = self._load_completed_expansions()
+        # Unsaved changes, and the after() id of the pending coalesced save
+        self._dirty = False
+        self._flush_job: Optional[str] = None
+        # Set as last read from or written to the file; a save that would
+        # write the same set again is skipped
+        self._saved_completed = frozenset(self.completed_expansions)
         
         # Create UI
         self._create_widgets()
@@ -54,18 +198,17 @@ class ExpansionManagerWindow:
         # Center window
         self.window.transient(parent)
         self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
         
     def _load_completed_expansions(self) -> set:
         """Load completed expansions from file."""
-        import json
         if self.expansions_file.exists():
             try:
-                with open(self.expansions_file, 'r') as f:
-                    content = f.read().strip()
-                    if not content:
-                        return set()
-                    data = json.loads(content)
-                    return set(data.get('completed', []))
+                content = self.expansions_file.read_bytes().strip()
+                if not content:
+                    return set()
+                data = orjson.loads(content) if orjson is not None else json.loads(content)
+                return set(data.get('completed', []))
             except Exception as e:
                 logging.warning(f"Error loading expansions: {e}")
                 return set()
@@ -73,15 +216,41 @@ class ExpansionManagerWindow:
     
     def _save_completed_expansions(self) -> None:
         """Save completed expansions to file."""
-        import json
+        if self.completed_expansions == self._saved_completed:
+            return
         try:
-            with open(self.expansions_file, 'w') as f:
-                json.dump({'completed': list(self.completed_expansions)}, f, indent=2)
+            data = {'completed': sorted(self.completed_expansions)}
+            if orjson is not None:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, separators=(',', ':')).encode()
+            write_file_atomic(self.expansions_file, payload)
+            self._saved_completed = frozenset(self.completed_expansions)
             logging.info("Expansion completion status saved")
         except Exception as e:
             logging.error(f"Error saving expansions: {e}")
             messagebox.showerror("Error", f"Failed to save expansions: {e}")
     
+    def _schedule_save(self) -> None:
+        """Mark state dirty and save once after a burst of changes settles."""
+        self._dirty = True
+        if self._flush_job is None:
+            self._flush_job = self.window.after(250, self._flush_save)
+    
+    def _flush_save(self) -> None:
+        """Write pending changes, if any."""
+        self._flush_job = None
+        if self._dirty:
+            self._dirty = False
+            self._save_completed_expansions()
+    
+    def _close(self) -> None:
+        """Save pending changes and close the window."""
+        if self._flush_job is not None:
+            self.window.after_cancel(self._flush_job)
+        self._flush_save()
+        self.window.destroy()
+    
     def _create_widgets(self) -> None:
         """Create UI widgets."""
         # Main frame
@@ -108,12 +277,6 @@ class ExpansionManagerWindow:
         scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side="left", fill="both", expand=True)
@@ -136,7 +299,7 @@ class ExpansionManagerWindow:
                 series_a_frame,
                 text=expansion,
                 variable=var,
-                command=lambda key=expansion_key, v=var: self._on_checkbox_change(key, v)
+                command=partial(self._on_checkbox_change, expansion_key, var)
             )
             checkbox.pack(anchor=tk.W, pady=2)
             self.checkboxes[expansion_key] = var
@@ -155,11 +318,16 @@ class ExpansionManagerWindow:
                 series_b_frame,
                 text=expansion,
                 variable=var,
-                command=lambda key=expansion_key, v=var: self._on_checkbox_change(key, v)
+                command=partial(self._on_checkbox_change, expansion_key, var)
             )
             checkbox.pack(anchor=tk.W, pady=2)
             self.checkboxes[expansion_key] = var
         
+        # Embed the frame once it is complete: its scroll region is then
+        # computed a single time for the initial layout
+        bind_scroll_region(canvas, scrollable_frame)
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
         buttons_frame.pack(fill=tk.X, pady=(10, 0))
@@ -185,7 +353,7 @@ class ExpansionManagerWindow:
         ttk.Button(
             buttons_frame,
             text="Close",
-            command=self.window.destroy
+            command=self._close
         ).pack(side=tk.RIGHT, padx=5)
     
     def _on_checkbox_change(self, expansion_key: str, var: tk.BooleanVar) -> None:
@@ -194,32 +362,61 @@ class ExpansionManagerWindow:
             self.completed_expansions.add(expansion_key)
         else:
             self.completed_expansions.discard(expansion_key)
-        self._save_completed_expansions()
+        self._schedule_save()
     
     def _select_all(self) -> None:
         """Select all expansions."""
-        for expansion_key, var in self.checkboxes.items():
-            var.set(True)
-            self.completed_expansions.add(expansion_key)
-        self._save_completed_expansions()
+        # The vars mirror completed_expansions, so only the unchecked ones
+        # need setting
+        keys = self.checkboxes.keys()
+        for expansion_key in keys - self.completed_expansions:
+            self.checkboxes[expansion_key].set(True)
+        self.completed_expansions |= keys
+        self._schedule_save()
     
     def _deselect_all(self) -> None:
         """Deselect all expansions."""
-        for expansion_key, var in self.checkboxes.items():
-            var.set(False)
-            self.completed_expansions.discard(expansion_key)
-        self._save_completed_expansions()
+        keys = self.checkboxes.keys()
+        for expansion_key in keys & self.completed_expansions:
+            self.checkboxes[expansion_key].set(False)
+        self.completed_expansions -= keys
+        self._schedule_save()
     
     def _reset_to_current(self) -> None:
         """Reset checkboxes to current file status."""
+        # Pending edits are discarded in favour of what is on disk
+        self._dirty = False
+        shown = self.completed_expansions  # the vars mirror this set
         self.completed_expansions = self._load_completed_expansions()
-        for expansion_key, var in self.checkboxes.items():
-            var.set(expansion_key in self.completed_expansions)
+        self._saved_completed = frozenset(self.completed_expansions)
+        # Only set the vars whose value flips
+        for expansion_key in shown.symmetric_difference(self.completed_expansions):
+            var = self.checkboxes.get(expansion_key)
+            if var is not None:
+                var.set(expansion_key in self.completed_expansions)
 
 
 class AutoGodPackGUI:
     """Main GUI application window."""
 
+    # Lines kept in the log widget (older ones are dropped)
+    MAX_LOG_LINES = 1000
+    # Device list polling (ms): starts at the minimum and doubles, up to the
+    # maximum, while the list is unchanged and no bot is running
+    DEVICE_REFRESH_MIN_MS = 2000
+    DEVICE_REFRESH_MAX_MS = 30000
+    # `adb devices` results younger than this (s) are reused; connecting or
+    # disconnecting through DeviceManager drops the cache
+    DEVICE_LIST_TTL = 1.5
+    # Delay between bot starts in start_all_bots (ms)
+    START_STAGGER_MS = 500
+    # Status and expansion polling (ms): normal, while the window is
+    # minimized, and for FAST_POLL_SECONDS after a bot is started or stopped
+    POLL_INTERVAL_MS = 2000
+    POLL_INTERVAL_HIDDEN_MS = 10000
+    POLL_INTERVAL_FAST_MS = 500
+    FAST_POLL_SECONDS = 10.0
+
     def __init__(self, root: tk.Tk):
         """
         Initialize GUI application.
@@ -239,106 +436,36 @@ class AutoGodPackGUI:
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
-        # Apply navy color theme - single shade of navy and gray
-        NAVY_COLOR = '#1e3a5f'
-        # Use the same gray shade as inside LabelFrames (system default for clam theme)
-        GRAY_COLOR = '#f0f0f0'
+        # Polling slows down while the window is minimized
+        self._window_visible = True
+        self._fast_poll_until = 0.0
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.root.bind("<Unmap>", self._on_root_map, add="+")
         
+        # Apply navy color theme - single shade of navy and gray
         style = ttk.Style()
         style.theme_use('clam')
         
         # Configure root window background to navy
         self.root.configure(bg=NAVY_COLOR)
         
-        # Notebook styling - gray background for content area
-        style.configure('TNotebook', background=GRAY_COLOR, borderwidth=0, relief='flat')
-        
-        # Valve-style tabs: selected tab expands upward with gray bg and navy text
-        # Unselected tabs: navy bg with gray text (no white)
-        style.configure('TNotebook.Tab', 
-                       background=NAVY_COLOR, 
-                       foreground=GRAY_COLOR, 
-                       borderwidth=0,
-                       padding=[12, 8],
-                       focuscolor='none',
-                       relief='flat',
-                       font=('Arial', 9))
-        style.map('TNotebook.Tab', 
-                 background=[('selected', GRAY_COLOR), ('active', NAVY_COLOR)], 
-                 foreground=[('selected', NAVY_COLOR), ('active', GRAY_COLOR)],
-                 # Expand upward when selected - increase top padding
-                 padding=[('selected', [12, 16, 8, 8]), ('!selected', [12, 8])],
-                 # Use expand for additional upward push
-                 expand=[('selected', [1, 1, 6, 0])])
-        
-        # Frame styling - all frames use gray background
-        style.configure('TFrame', background=GRAY_COLOR)
-        style.configure('TLabelFrame', background=GRAY_COLOR, foreground=NAVY_COLOR, borderwidth=1)
-        style.configure('TLabelFrame.Label', background=GRAY_COLOR, foreground=NAVY_COLOR, font=('Arial', 9, 'bold'))
-        
-        # Button styling - gray text on navy (no white)
-        style.configure('TButton', background=NAVY_COLOR, foreground=GRAY_COLOR, borderwidth=1, padding=5)
-        style.map('TButton', background=[('active', NAVY_COLOR), ('pressed', NAVY_COLOR)], foreground=[('active', GRAY_COLOR), ('pressed', GRAY_COLOR)])
-        
-        # Icon button style for bot controls
-        style.configure('Icon.TButton', background=NAVY_COLOR, foreground=GRAY_COLOR, borderwidth=1, padding=3, font=('Arial', 10))
-        style.map('Icon.TButton', background=[('active', NAVY_COLOR), ('pressed', NAVY_COLOR)], foreground=[('active', GRAY_COLOR), ('pressed', GRAY_COLOR)])
-        
-        # Label styling
-        style.configure('TLabel', background=GRAY_COLOR)
-        style.configure('TCheckbutton', background=GRAY_COLOR)
-        
-        # Entry styling - use navy background with gray text (no white)
-        style.configure('TEntry', fieldbackground=NAVY_COLOR, foreground=GRAY_COLOR, borderwidth=1)
-        
-        # Scrollbar styling - ensure no white parts
-        style.configure('TScrollbar', 
-                       background=GRAY_COLOR, 
-                       troughcolor=GRAY_COLOR, 
-                       borderwidth=0,
-                       darkcolor=GRAY_COLOR,
-                       lightcolor=GRAY_COLOR)
-        style.map('TScrollbar',
-                 background=[('active', GRAY_COLOR), ('pressed', GRAY_COLOR)],
-                 troughcolor=[('active', GRAY_COLOR), ('pressed', GRAY_COLOR)])
+        for style_name, options in _STYLE_CONFIG:
+            style.configure(style_name, **options)
+        for style_name, options in _STYLE_MAP:
+            style.map(style_name, **options)
         
         # Store colors for use in canvas
         self.navy_color = NAVY_COLOR
         self.gray_color = GRAY_COLOR
 
         # Get project root
-        self.project_root = Path(__file__).parent.parent.parent
+        self.project_root = _PROJECT_ROOT
 
-        # Load configuration
-        try:
-            # Try multiple possible config locations
-            config_paths = [
-                self.project_root / "config.yaml",
-                Path(__file__).parent.parent.parent / "config.yaml",
-                Path.cwd() / "config.yaml",
-            ]
-            
-            config_path = None
-            for path in config_paths:
-                if path.exists():
-                    config_path = path
-                    break
-            
-            if config_path:
-                self.settings = load_config(config_path)
-            else:
-                # Create default config
-                from ..config.settings import Settings
-                self.settings = Settings()
-                messagebox.showwarning(
-                    "Configuration Warning",
-                    "config.yaml not found. Using default settings.\n"
-                    "Please create config.yaml for full functionality."
-                )
-        except Exception as e:
-            messagebox.showerror("Configuration Error", f"Failed to load config: {e}")
-            from ..config.settings import Settings
-            self.settings = Settings()
+        # Configuration: defaults until config.yaml has been loaded in the
+        # background (see _load_settings), so the window opens without
+        # waiting on file I/O and YAML parsing
+        self.settings = Settings()
+        self._settings_ready = False
         
         # Setup logging to text widget
         self.setup_logging()
@@ -346,11 +473,27 @@ class AutoGodPackGUI:
         # Initialize multi-bot manager
         self.multi_bot_manager = MultiBotManager(self.settings, self.project_root)
         
+        # Expansion state file access, shared by every bot tab
+        self._persistence = StatePersistence(
+            self.settings.paths.get_state_path(self.project_root)
+        )
+        
         # Bot slot widgets storage
         self.bot_slots: Dict[int, Dict[str, any]] = {}
         
         # Expansion checkboxes storage (initialized early to avoid AttributeError)
-        self.expansion_checkboxes: Dict[int, Dict[str, tk.BooleanVar]] = {}
+        self.expansion_checkboxes: Dict[int, Dict[str, ttk.Checkbutton]] = {}
+        # Completion mask currently shown by each bot's checkboxes; the
+        # checkbutton state is only touched for bits that change
+        self.expansion_masks: Dict[int, int] = {}
+        # (mtime_ns, size) of the state file when the checkboxes were last
+        # refreshed from it; the refresh skips parsing while it is unchanged
+        self._state_file_sig: Optional[tuple] = None
+        # Per-slot expansion state with the file signature it was read at
+        self._expansion_cache: Dict[int, Tuple[tuple, ExpansionState]] = {}
+        # Slots with edits not yet written (see _schedule_expansion_save)
+        self._dirty_slots: Set[int] = set()
+        self._expansion_flush_job: Optional[str] = None
         
         # Legacy bot state (for backward compatibility)
         self.bot: Optional[BattleBot] = None
@@ -366,12 +509,99 @@ class AutoGodPackGUI:
         # Load saved device IPs
         self.saved_devices = self._load_saved_devices()
         
+        # Lines currently in the log widget (maintained by _append_log)
+        self._log_line_count = 0
+        
         # Create UI
         self.create_widgets()
 
         # Start device refresh timer
+        self._device_signature: Optional[tuple] = None
+        self._device_refresh_ms = self.DEVICE_REFRESH_MIN_MS
         self.refresh_devices()
-        self.root.after(2000, self.auto_refresh_devices)
+        self._device_refresh_job = self.root.after(self._device_refresh_ms, self.auto_refresh_devices)
+
+        # Load configuration
+        threading.Thread(target=self._load_settings, daemon=True).start()
+
+    def _load_settings(self) -> None:
+        """Load config.yaml off the GUI thread and hand it to _apply_settings."""
+        settings = None
+        error = None
+        try:
+            # Try multiple possible config locations
+            config_paths = [
+                self.project_root / "config.yaml",
+                Path.cwd() / "config.yaml",
+            ]
+            
+            config_path = None
+            for path in config_paths:
+                if path.exists():
+                    config_path = path
+                    break
+            
+            if config_path:
+                settings = load_config(config_path)
+        except Exception as e:
+            error = e
+        try:
+            self.root.after(0, self._apply_settings, settings, error)
+        except (tk.TclError, RuntimeError):
+            # Root window may have been destroyed
+            pass
+
+    def _apply_settings(self, settings: Optional[Settings], error: Optional[Exception]) -> None:
+        """
+        Switch the GUI to the loaded configuration (GUI thread).
+
+        Args:
+            settings: Loaded settings, or None to keep the defaults.
+            error: Exception raised while loading, if any.
+        """
+        if error is not None:
+            messagebox.showerror("Configuration Error", f"Failed to load config: {error}")
+        elif settings is None:
+            messagebox.showwarning(
+                "Configuration Warning",
+                "config.yaml not found. Using default settings.\n"
+                "Please create config.yaml for full functionality."
+            )
+        else:
+            # Edits made so far belong to the file they were read from
+            self._flush_expansion_state()
+            self.settings = settings
+            self.multi_bot_manager.base_settings = settings
+            self._persistence = StatePersistence(
+                settings.paths.get_state_path(self.project_root)
+            )
+            # Re-read expansion state from the configured file on the next refresh
+            self._state_file_sig = None
+            self._expansion_cache = {}
+        self._settings_ready = True
+
+    def _on_root_map(self, event: tk.Event) -> None:
+        """Track whether the main window is shown or minimized."""
+        # Child widgets' Map/Unmap events also reach the root's bindings
+        if event.widget is self.root:
+            self._window_visible = event.type == tk.EventType.Map
+
+    def _poll_interval_ms(self) -> int:
+        """
+        Get the delay before the next status/expansion poll.
+
+        Returns:
+            Delay in milliseconds.
+        """
+        if time.monotonic() < self._fast_poll_until:
+            return self.POLL_INTERVAL_FAST_MS
+        if not self._window_visible:
+            return self.POLL_INTERVAL_HIDDEN_MS
+        return self.POLL_INTERVAL_MS
+
+    def _request_fast_poll(self) -> None:
+        """Poll quickly for a while, e.g. while a bot is starting or stopping."""
+        self._fast_poll_until = time.monotonic() + self.FAST_POLL_SECONDS
 
     def setup_logging(self) -> None:
         """Setup logging to GUI text widget."""
@@ -385,6 +615,7 @@ class AutoGodPackGUI:
         root_logger = logging.getLogger()
         root_logger.addHandler(self.log_handler)
         root_logger.setLevel(logging.INFO)
+        self.log_handler.start()
 
     def create_widgets(self) -> None:
         """Create GUI widgets with tabbed interface."""
@@ -608,59 +839,38 @@ class AutoGodPackGUI:
         
         # Store expansion checkboxes per bot (already initialized in __init__)
         
-        # Create a tab for each bot
+        # Create an empty tab for each bot; its contents are built the first
+        # time it is selected (bound first so the initial selection counts)
+        self._expansion_tab_frames: List[ttk.Frame] = []
+        bot_notebook.bind("<<NotebookTabChanged>>", self._on_expansion_tab_selected)
         for slot_id in range(4):
             bot_tab = ttk.Frame(bot_notebook, padding="10")
             bot_notebook.add(bot_tab, text=f"Bot {slot_id + 1}")
-            self._create_bot_expansion_tab(bot_tab, slot_id)
+            self._expansion_tab_frames.append(bot_tab)
+    
+    def _on_expansion_tab_selected(self, event: tk.Event) -> None:
+        """Build a bot's expansion tab the first time it is shown."""
+        slot_id = event.widget.index("current")
+        if slot_id in self.expansion_checkboxes or slot_id >= len(self._expansion_tab_frames):
+            return
+        expansion_state = self._get_expansion_state(slot_id)
+        self._create_bot_expansion_tab(
+            self._expansion_tab_frames[slot_id], slot_id, expansion_state.completed
+        )
     
-    def _create_bot_expansion_tab(self, parent: ttk.Frame, slot_id: int) -> None:
+    def _create_bot_expansion_tab(self, parent: ttk.Frame, slot_id: int, completed_expansions: Set[str]) -> None:
         """Create expansion configuration tab for a specific bot."""
-        # Main content frame
+        # Main content frame (two rows of checkboxes fit in the tab, so no
+        # scrollable canvas is needed)
         content_frame = ttk.Frame(parent)
         content_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Scrollable frame for checkboxes
-        canvas_frame = ttk.Frame(content_frame)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
-        
-        canvas = tk.Canvas(canvas_frame, bg=self.gray_color, highlightthickness=0, highlightbackground=self.gray_color)
-        expansion_scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        def update_scrollregion(event=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        
-        scrollable_frame.bind("<Configure>", update_scrollregion)
-        
-        canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=expansion_scrollbar.set)
-        
-        # Update canvas window width when canvas resizes
-        def configure_canvas_width(event):
-            canvas_width = event.width
-            canvas.itemconfig(canvas_window, width=canvas_width)
-        canvas.bind('<Configure>', configure_canvas_width)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        expansion_scrollbar.pack(side="right", fill="y")
-        
-        # Load current completed expansions for this bot
-        from ..state.persistence import StatePersistence
-        state_file = self.settings.paths.get_state_path(self.project_root)
-        persistence = StatePersistence(state_file)
-        expansion_state = persistence.load_expansions(slot_id=slot_id)
-        completed_expansions = expansion_state.completed
-        
         # Store checkboxes for this bot
         self.expansion_checkboxes[slot_id] = {}
-        
-        # Expansion lists (matching battle_bot.py)
-        EXPANSIONS_SERIES_A = ["GA", "MI", "STS", "TL", "SR", "CG", "EC", "EG", "WSS", "SS", "DPex"]
-        EXPANSIONS_SERIES_B = ["CB", "MR"]
+        self.expansion_masks[slot_id] = 0
         
         # Series A
-        series_a_frame = ttk.LabelFrame(scrollable_frame, text="Series A", padding="8")
+        series_a_frame = ttk.LabelFrame(content_frame, text="Series A", padding="8")
         series_a_frame.pack(fill=tk.X, padx=5, pady=5)
         
         series_a_inner = ttk.Frame(series_a_frame)
@@ -669,18 +879,17 @@ class AutoGodPackGUI:
         # Create checkboxes using pack to fill horizontal space
         for expansion in EXPANSIONS_SERIES_A:
             expansion_key = f"A_{expansion}"
-            var = tk.BooleanVar(value=expansion_key in completed_expansions)
-            checkbox = ttk.Checkbutton(
-                series_a_inner,
-                text=expansion,
-                variable=var,
-                command=lambda key=expansion_key, v=var, sid=slot_id: self._on_expansion_checkbox_change(key, v, sid)
+            # No Tcl variable: the selected state is driven from the mask
+            checkbox = ttk.Checkbutton(series_a_inner, text=expansion, variable="")
+            checkbox.configure(
+                command=partial(self._on_expansion_checkbox_change, expansion_key, checkbox, slot_id)
             )
+            checkbox.state(["!alternate", "!selected"])
             checkbox.pack(side=tk.LEFT, padx=10, pady=2)
-            self.expansion_checkboxes[slot_id][expansion_key] = var
+            self.expansion_checkboxes[slot_id][expansion_key] = checkbox
         
         # Series B
-        series_b_frame = ttk.LabelFrame(scrollable_frame, text="Series B", padding="8")
+        series_b_frame = ttk.LabelFrame(content_frame, text="Series B", padding="8")
         series_b_frame.pack(fill=tk.X, padx=5, pady=5)
         
         series_b_inner = ttk.Frame(series_b_frame)
@@ -688,15 +897,16 @@ class AutoGodPackGUI:
         
         for expansion in EXPANSIONS_SERIES_B:
             expansion_key = f"B_{expansion}"
-            var = tk.BooleanVar(value=expansion_key in completed_expansions)
-            checkbox = ttk.Checkbutton(
-                series_b_inner,
-                text=expansion,
-                variable=var,
-                command=lambda key=expansion_key, v=var, sid=slot_id: self._on_expansion_checkbox_change(key, v, sid)
+            # No Tcl variable: the selected state is driven from the mask
+            checkbox = ttk.Checkbutton(series_b_inner, text=expansion, variable="")
+            checkbox.configure(
+                command=partial(self._on_expansion_checkbox_change, expansion_key, checkbox, slot_id)
             )
+            checkbox.state(["!alternate", "!selected"])
             checkbox.pack(side=tk.LEFT, padx=10, pady=2)
-            self.expansion_checkboxes[slot_id][expansion_key] = var
+            self.expansion_checkboxes[slot_id][expansion_key] = checkbox
+        
+        self._apply_expansion_mask(slot_id, expansion_mask(completed_expansions))
         
         # Buttons frame (compact)
         buttons_frame = ttk.Frame(parent)
@@ -791,69 +1001,169 @@ class AutoGodPackGUI:
         ).pack(pady=(8, 0))
     
     
-    def _on_expansion_checkbox_change(self, expansion_key: str, var: tk.BooleanVar, slot_id: int) -> None:
+    def _apply_expansion_mask(self, slot_id: int, mask: int) -> None:
+        """
+        Show a completion mask on a bot's checkboxes.
+
+        Args:
+            slot_id: Bot slot ID.
+            mask: Completion mask (see expansion_mask).
+        """
+        changed = self.expansion_masks.get(slot_id, 0) ^ mask
+        if changed:
+            for expansion_key, checkbox in self.expansion_checkboxes[slot_id].items():
+                bit = 1 << EXPANSION_INDEX[expansion_key]
+                if changed & bit:
+                    checkbox.state(["selected" if mask & bit else "!selected"])
+        self.expansion_masks[slot_id] = mask
+    
+    def _state_file_signature(self) -> tuple:
+        """
+        Identify the current version of the expansion state file.
+
+        Returns:
+            (st_mtime_ns, st_size), or () if the file doesn't exist.
+        """
+        try:
+            st = self._persistence.state_file.stat()
+        except FileNotFoundError:
+            return ()
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _get_expansion_state(self, slot_id: int) -> ExpansionState:
+        """
+        Get a bot's expansion state, re-reading the file only when it changed.
+
+        Args:
+            slot_id: Bot slot ID.
+
+        Returns:
+            Cached ExpansionState for the slot (callers may modify and save it).
+        """
+        cached = self._expansion_cache.get(slot_id)
+        if cached is not None and slot_id in self._dirty_slots:
+            # Unsaved edits win over whatever is on disk
+            return cached[1]
+        sig = self._state_file_signature()
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+        expansion_state = self._persistence.load_expansions(slot_id=slot_id)
+        self._expansion_cache[slot_id] = (sig, expansion_state)
+        return expansion_state
+    
+    def _schedule_expansion_save(self, slot_id: int) -> None:
+        """
+        Mark a bot's cached expansion state for saving.
+
+        Rapid toggles are coalesced: the state is written once, shortly
+        after the last change.
+
+        Args:
+            slot_id: Bot slot ID.
+        """
+        self._dirty_slots.add(slot_id)
+        if self._expansion_flush_job is None:
+            self._expansion_flush_job = self.root.after(150, self._flush_expansion_state)
+    
+    def _flush_expansion_state(self) -> None:
+        """Write every slot with pending edits in a single save."""
+        self._expansion_flush_job = None
+        if not self._dirty_slots:
+            return
+        dirty = self._dirty_slots
+        self._dirty_slots = set()
+        try:
+            multi_state = self._persistence.load_multi_bot_expansions()
+            for slot_id in dirty:
+                multi_state.set_bot_state(slot_id, self._expansion_cache[slot_id][1])
+            self._persistence.save_multi_bot_expansions(multi_state)
+        except Exception as e:
+            # The cached copies no longer match the file
+            for slot_id in dirty:
+                self._expansion_cache.pop(slot_id, None)
+            logging.error(f"Error saving expansion state: {e}")
+            return
+        sig = self._state_file_signature()
+        for slot_id in dirty:
+            self._expansion_cache[slot_id] = (sig, self._expansion_cache[slot_id][1])
+    
+    def _on_expansion_checkbox_change(self, expansion_key: str, checkbox: ttk.Checkbutton, slot_id: int) -> None:
         """Handle expansion checkbox change for a specific bot."""
-        from ..state.persistence import StatePersistence
-        from ..state.models import ExpansionState
+        expansion_state = self._get_expansion_state(slot_id)
         
-        state_file = self.settings.paths.get_state_path(self.project_root)
-        persistence = StatePersistence(state_file)
-        expansion_state = persistence.load_expansions(slot_id=slot_id)
-        
-        if var.get():
+        completed = checkbox.instate(["selected"])
+        bit = 1 << EXPANSION_INDEX[expansion_key]
+        if completed:
+            self.expansion_masks[slot_id] = self.expansion_masks.get(slot_id, 0) | bit
             expansion_state.add_completed(expansion_key)
         else:
+            self.expansion_masks[slot_id] = self.expansion_masks.get(slot_id, 0) & ~bit
             expansion_state.completed.discard(expansion_key)
         
-        persistence.save_expansions(expansion_state, slot_id=slot_id)
-        logging.info(f"Bot {slot_id + 1}: Expansion {expansion_key} {'marked as completed' if var.get() else 'enabled'}")
+        self._schedule_expansion_save(slot_id)
+        logging.info(f"Bot {slot_id + 1}: Expansion {expansion_key} {'marked as completed' if completed else 'enabled'}")
     
     def _select_all_expansions(self, slot_id: int) -> None:
         """Select all expansions for a specific bot."""
-        from ..state.persistence import StatePersistence
-        from ..state.models import ExpansionState
-        
-        state_file = self.settings.paths.get_state_path(self.project_root)
-        persistence = StatePersistence(state_file)
-        expansion_state = persistence.load_expansions(slot_id=slot_id)
+        expansion_state = self._get_expansion_state(slot_id)
         
         if slot_id in self.expansion_checkboxes:
-            for expansion_key, var in self.expansion_checkboxes[slot_id].items():
-                var.set(True)
-                expansion_state.add_completed(expansion_key)
-        
-        persistence.save_expansions(expansion_state, slot_id=slot_id)
+            # One bulk set update and one save; repainting through the mask
+            # changes widget state only, which never fires the checkbox
+            # commands, so no per-key callbacks run
+            keys = self.expansion_checkboxes[slot_id].keys()
+            self._apply_expansion_mask(slot_id, expansion_mask(keys))
+            expansion_state.completed.update(keys)
+        
+        self._schedule_expansion_save(slot_id)
         logging.info(f"Bot {slot_id + 1}: All expansions selected")
     
     def _deselect_all_expansions(self, slot_id: int) -> None:
         """Deselect all expansions for a specific bot."""
-        from ..state.persistence import StatePersistence
-        from ..state.models import ExpansionState
-        
-        state_file = self.settings.paths.get_state_path(self.project_root)
-        persistence = StatePersistence(state_file)
-        expansion_state = persistence.load_expansions(slot_id=slot_id)
+        expansion_state = self._get_expansion_state(slot_id)
         
         if slot_id in self.expansion_checkboxes:
-            for expansion_key, var in self.expansion_checkboxes[slot_id].items():
-                var.set(False)
-                expansion_state.completed.discard(expansion_key)
+            keys = self.expansion_checkboxes[slot_id].keys()
+            self._apply_expansion_mask(slot_id, 0)
+            expansion_state.completed.difference_update(keys)
         
-        persistence.save_expansions(expansion_state, slot_id=slot_id)
+        self._schedule_expansion_save(slot_id)
         logging.info(f"Bot {slot_id + 1}: All expansions deselected")
     
     def _reset_expansions_to_current(self, slot_id: int) -> None:
         """Reset checkboxes to current file status for a specific bot."""
-        from ..state.persistence import StatePersistence
-        
-        state_file = self.settings.paths.get_state_path(self.project_root)
-        persistence = StatePersistence(state_file)
-        expansion_state = persistence.load_expansions(slot_id=slot_id)
-        completed_expansions = expansion_state.completed
+        expansion_state = self._get_expansion_state(slot_id)
         
         if slot_id in self.expansion_checkboxes:
-            for expansion_key, var in self.expansion_checkboxes[slot_id].items():
-                var.set(expansion_key in completed_expansions)
+            self._apply_expansion_mask(slot_id, expansion_mask(expansion_state.completed))
+    
+    def _reload_expansion_checkboxes(self, sig: tuple) -> None:
+        """
+        Re-read the state file and repaint the built expansion tabs.
+
+        Slots with unsaved edits keep their cached state and checkboxes.
+
+        Args:
+            sig: State file signature the data is read at.
+        """
+        # One parse for all slots
+        multi_state = self._persistence.load_multi_bot_expansions()
+        for slot_id in range(4):
+            if slot_id in self._dirty_slots:
+                continue
+            expansion_state = multi_state.get_bot_state(slot_id)
+            self._expansion_cache[slot_id] = (sig, expansion_state)
+            if slot_id not in self.expansion_checkboxes:
+                continue
+            # Update checkboxes to match current state (only the ones whose
+            # bit changed touch Tk)
+            try:
+                self._apply_expansion_mask(
+                    slot_id, expansion_mask(expansion_state.completed)
+                )
+            except (tk.TclError, RuntimeError):
+                # Widget may have been destroyed
+                pass
     
     def update_expansion_checkboxes(self) -> None:
         """Update expansion checkboxes to reflect current state from file (auto-check when script completes)."""
@@ -863,46 +1173,21 @@ class AutoGodPackGUI:
         
         # Guard against calling before expansion_checkboxes is initialized
         if not hasattr(self, 'expansion_checkboxes') or not self.expansion_checkboxes:
-            # Schedule next update (every 2 seconds) only if not shutting down
+            # Schedule next update only if not shutting down
             if not (hasattr(self, '_shutting_down') and self._shutting_down):
                 try:
-                    self.root.after(2000, self.update_expansion_checkboxes)
+                    self.root.after(self._poll_interval_ms(), self.update_expansion_checkboxes)
                 except (tk.TclError, RuntimeError):
                     if hasattr(self, '_shutting_down'):
                         self._shutting_down = True
             return
         
         try:
-            from ..state.persistence import StatePersistence
-            
-            state_file = self.settings.paths.get_state_path(self.project_root)
-            persistence = StatePersistence(state_file)
-            
-            for slot_id in range(4):
-                if slot_id in self.expansion_checkboxes:
-                    try:
-                        expansion_state = persistence.load_expansions(slot_id=slot_id)
-                        completed_expansions = expansion_state.completed
-                        
-                        # Update checkboxes to match current state
-                        for expansion_key, var in self.expansion_checkboxes[slot_id].items():
-                            try:
-                                current_value = expansion_key in completed_expansions
-                                if var.get() != current_value:
-                                    var.set(current_value)
-                            except (tk.TclError, RuntimeError):
-                                # Widget may have been destroyed
-                                break
-                    except (KeyboardInterrupt, SystemExit):
-                        # Stop scheduling updates on interrupt
-                        if hasattr(self, '_shutting_down'):
-                            self._shutting_down = True
-                        return
-                    except Exception as e:
-                        # Log but continue - don't let one slot failure stop updates
-                        logging.debug(f"Error updating checkboxes for slot {slot_id}: {e}")
-                        continue
-        
+            # One stat per tick; the file is only parsed when it changed
+            sig = self._state_file_signature()
+            if sig != self._state_file_sig:
+                self._state_file_sig = sig
+                self._reload_expansion_checkboxes(sig)
         except (KeyboardInterrupt, SystemExit):
             # Stop scheduling updates on interrupt
             if hasattr(self, '_shutting_down'):
@@ -912,10 +1197,10 @@ class AutoGodPackGUI:
             # Log error but continue - don't crash GUI
             logging.debug(f"Error in update_expansion_checkboxes: {e}")
         
-        # Schedule next update (every 2 seconds) only if not shutting down
+        # Schedule next update only if not shutting down
         if not (hasattr(self, '_shutting_down') and self._shutting_down):
             try:
-                self.root.after(2000, self.update_expansion_checkboxes)
+                self.root.after(self._poll_interval_ms(), self.update_expansion_checkboxes)
             except (tk.TclError, RuntimeError):
                 # Root window may have been destroyed
                 if hasattr(self, '_shutting_down'):
@@ -933,10 +1218,13 @@ class AutoGodPackGUI:
         
         self._shutting_down = True
         
-        # Stop all bots (non-blocking)
+        # Write pending expansion edits now rather than after the debounce
+        self._flush_expansion_state()
+        
+        # Stop all bots and release their worker pool (non-blocking)
         try:
             if self.multi_bot_manager:
-                self.multi_bot_manager.stop_all()
+                self.multi_bot_manager.close()
         except Exception as e:
             logging.error(f"Error stopping bots on close: {e}")
         
@@ -970,39 +1258,81 @@ class AutoGodPackGUI:
             message: Log message.
             level: Log level.
         """
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"[{level}] {message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self._append_log(f"[{level}] {message}\n")
 
-    def refresh_devices(self) -> None:
-        """Refresh connected devices list."""
-        devices = DeviceManager.list_devices()
-        self.devices_listbox.delete(0, tk.END)
+    def _append_log(self, text: str) -> None:
+        """
+        Append text to the log widget, keeping only the last MAX_LOG_LINES lines.
 
-        current_device = self.settings.adb.serial if self.settings else None
-        found_current = False
+        Args:
+            text: Newline-terminated text to append.
+        """
+        log_text = self.log_text
+        # Only follow new output if the view is already at the bottom, so
+        # reading older lines isn't interrupted
+        follow = log_text.yview()[1] >= 1.0
+        log_text.config(state=tk.NORMAL)
+        log_text.insert(tk.END, text)
+        # A Text widget slows down as it grows; drop the oldest lines. The
+        # count is kept here rather than asking Tk for the end index.
+        self._log_line_count += text.count('\n')
+        excess = self._log_line_count - self.MAX_LOG_LINES
+        if excess > 0:
+            log_text.delete('1.0', f'{excess + 1}.0')
+            self._log_line_count = self.MAX_LOG_LINES
+        if follow:
+            log_text.see(tk.END)
+        log_text.config(state=tk.DISABLED)
 
-        for device in devices:
-            serial = device["serial"]
-            state = device["state"]
-            display_text = f"{serial} ({state})"
-            self.devices_listbox.insert(tk.END, display_text)
+    def refresh_devices(self) -> bool:
+        """
+        Refresh connected devices list.
 
-            if serial == current_device:
-                found_current = True
-                self.current_device_var.set(f"{serial} ({state})")
-                self.current_device_var.set(f"{serial} ({state})")
+        Returns:
+            True if the device list changed since the last refresh.
+        """
+        devices = DeviceManager.list_devices(ttl=self.DEVICE_LIST_TTL)
+        signature = tuple((device["serial"], device["state"]) for device in devices)
+        changed = signature != self._device_signature
+        self._device_signature = signature
+
+        if changed:
+            # Repopulate in one insert; an unchanged list is left alone (which
+            # also keeps the user's selection)
+            self.devices_listbox.delete(0, tk.END)
+            self.devices_listbox.insert(tk.END, *(f"{serial} ({state})" for serial, state in signature))
+
+        current_device = self.settings.adb.serial if self.settings else None
+        states = dict(signature)
+        if current_device in states:
+            current_text = f"{current_device} ({states[current_device]})"
+        elif current_device:
+            current_text = f"{current_device} (Not connected)"
+        else:
+            current_text = "Not connected"
+        if self.current_device_var.get() != current_text:
+            self.current_device_var.set(current_text)
 
-        if not found_current and current_device:
-            self.current_device_var.set(f"{current_device} (Not connected)")
-        elif not found_current:
-            self.current_device_var.set("Not connected")
+        return changed
 
     def auto_refresh_devices(self) -> None:
-        """Auto-refresh devices periodically."""
-        self.refresh_devices()
-        self.root.after(2000, self.auto_refresh_devices)
+        """Auto-refresh devices periodically, backing off while nothing changes."""
+        changed = self.refresh_devices()
+        if changed or self.multi_bot_manager.get_running_count():
+            self._device_refresh_ms = self.DEVICE_REFRESH_MIN_MS
+        else:
+            self._device_refresh_ms = min(self._device_refresh_ms * 2, self.DEVICE_REFRESH_MAX_MS)
+        delay = self._device_refresh_ms
+        if not self._window_visible:
+            delay = max(delay, self.POLL_INTERVAL_HIDDEN_MS)
+        self._device_refresh_job = self.root.after(delay, self.auto_refresh_devices)
+
+    def _reset_device_refresh(self) -> None:
+        """Return device polling to its fastest rate (e.g. on bot start/stop)."""
+        if self._device_refresh_ms > self.DEVICE_REFRESH_MIN_MS:
+            self.root.after_cancel(self._device_refresh_job)
+            self._device_refresh_ms = self.DEVICE_REFRESH_MIN_MS
+            self._device_refresh_job = self.root.after(self._device_refresh_ms, self.auto_refresh_devices)
 
     def connect_device(self) -> None:
         """Connect to device from entry."""
@@ -1012,8 +1342,8 @@ class AutoGodPackGUI:
             return
 
         if DeviceManager.connect_device(serial):
-            # Update config
-            self.settings.adb.serial = serial
+            # Update config (settings are frozen, so derive a new copy)
+            self.settings = replace(self.settings, adb=replace(self.settings.adb, serial=serial))
             # Update current device display
             self.current_device_var.set(f"{serial} (connected)")
             self.refresh_devices()
@@ -1030,7 +1360,7 @@ class AutoGodPackGUI:
             return
 
         device_text = self.devices_listbox.get(selection[0])
-        serial = device_text.split(" ")[0]  # Extract serial from display text
+        serial = device_text.partition(" ")[0]  # Extract serial from display text
 
         if DeviceManager.disconnect_device(serial):
             self.refresh_devices()
@@ -1044,9 +1374,9 @@ class AutoGodPackGUI:
         if slot_id not in self.bot_slots:
             return
         
-        widgets = self.bot_slots[slot_id]
         status_info = self.multi_bot_manager.get_bot_status(slot_id) if self.multi_bot_manager else None
         is_running = status_info.get("is_running", False) if status_info else False
+        self._reset_device_refresh()
         
         if is_running:
             # Stop the bot
@@ -1059,6 +1389,11 @@ class AutoGodPackGUI:
         """Start a bot in a specific slot."""
         if slot_id not in self.bot_slots:
             return
+        if not self._settings_ready:
+            # config.yaml is still loading; retry shortly
+            self.root.after(100, self.start_slot_bot, slot_id)
+            return
+        self._request_fast_poll()
         
         widgets = self.bot_slots[slot_id]
         device_serial = widgets["device_entry"].get().strip()
@@ -1068,52 +1403,47 @@ class AutoGodPackGUI:
             return
         
         # Update UI - switch to stop button
-        widgets["toggle_button"].config(text="■", state=tk.DISABLED)
-        self._create_tooltip(widgets["toggle_button"], "Stop Bot")
-        widgets["status_text"].config(text="Connecting...", foreground="blue")
-        widgets["status_dot"].config(foreground="orange")
+        self._set_slot_ui(
+            slot_id, status="Connecting...", status_fg="blue", dot_fg="orange",
+            running=True, button_state=tk.DISABLED,
+        )
+        
+        def show(status: str, running: bool) -> None:
+            # One Tk event per state change, applied on the main thread. A
+            # started bot is still probing its device; the status poll shows
+            # "Running" once the probe passes.
+            try:
+                self.root.after(0, partial(
+                    self._set_slot_ui, slot_id, status=status,
+                    status_fg="blue" if running else "red",
+                    dot_fg="orange" if running else "red",
+                    running=running,
+                ))
+            except (tk.TclError, RuntimeError):
+                # Window closed while the bot was starting
+                pass
         
         def start_in_thread():
             try:
                 # Create bot instance
                 if not self.multi_bot_manager.create_bot(slot_id, device_serial):
-                    self.root.after(0, lambda: widgets["status_text"].config(
-                        text="Creation Failed", foreground="red"
-                    ))
-                    self.root.after(0, lambda: widgets["toggle_button"].config(text="▶", state=tk.NORMAL))
-                    self.root.after(0, lambda: self._create_tooltip(widgets["toggle_button"], "Start Bot"))
-                    self.root.after(0, lambda: widgets["status_dot"].config(foreground="red"))
+                    show("Creation Failed", running=False)
                     return
                 
                 # Start bot
                 if self.multi_bot_manager.start_bot(slot_id):
-                    self.root.after(0, lambda: widgets["status_text"].config(
-                        text="Running", foreground="green"
-                    ))
-                    self.root.after(0, lambda: widgets["toggle_button"].config(text="■", state=tk.NORMAL))
-                    self.root.after(0, lambda: self._create_tooltip(widgets["toggle_button"], "Stop Bot"))
-                    self.root.after(0, lambda: widgets["status_dot"].config(foreground="green"))
-                    logging.info(f"Bot {slot_id + 1} started successfully on {device_serial}")
+                    show("Connecting...", running=True)
+                    logging.info(f"Bot {slot_id + 1} starting on {device_serial}")
                 else:
                     status_info = self.multi_bot_manager.get_bot_status(slot_id)
                     error_msg = status_info.get("error_message", "Unknown error") if status_info else "Failed to start"
                     status = status_info.get("status", "Failed") if status_info else "Failed"
-                    self.root.after(0, lambda: widgets["status_text"].config(
-                        text=status, foreground="red"
-                    ))
-                    self.root.after(0, lambda: widgets["toggle_button"].config(text="▶", state=tk.NORMAL))
-                    self.root.after(0, lambda: self._create_tooltip(widgets["toggle_button"], "Start Bot"))
-                    self.root.after(0, lambda: widgets["status_dot"].config(foreground="red"))
+                    show(status, running=False)
                     logging.error(f"Bot {slot_id + 1} failed to start: {error_msg}")
             except Exception as e:
                 error_msg = f"Error starting bot {slot_id + 1}: {e}"
                 logging.error(error_msg, exc_info=True)
-                self.root.after(0, lambda: widgets["status_text"].config(
-                    text="Error", foreground="red"
-                ))
-                self.root.after(0, lambda: widgets["toggle_button"].config(text="▶", state=tk.NORMAL))
-                self.root.after(0, lambda: self._create_tooltip(widgets["toggle_button"], "Start Bot"))
-                self.root.after(0, lambda: widgets["status_dot"].config(foreground="red"))
+                show("Error", running=False)
         
         threading.Thread(target=start_in_thread, daemon=True).start()
     
@@ -1122,12 +1452,12 @@ class AutoGodPackGUI:
         if slot_id not in self.bot_slots:
             return
         
-        widgets = self.bot_slots[slot_id]
+        self._request_fast_poll()
         # Update UI - switch to start button
-        widgets["toggle_button"].config(text="▶", state=tk.DISABLED)
-        self._create_tooltip(widgets["toggle_button"], "Start Bot")
-        widgets["status_text"].config(text="Stopping...", foreground="orange")
-        widgets["status_dot"].config(foreground="orange")
+        self._set_slot_ui(
+            slot_id, status="Stopping...", status_fg="orange", dot_fg="orange",
+            running=False, button_state=tk.DISABLED,
+        )
         
         # Run removal in background thread to avoid freezing GUI
         def remove_in_thread():
@@ -1148,36 +1478,59 @@ class AutoGodPackGUI:
         # Start removal in background thread
         threading.Thread(target=remove_in_thread, daemon=True).start()
     
+    def _set_slot_ui(
+        self,
+        slot_id: int,
+        *,
+        status: str,
+        status_fg: str,
+        dot_fg: str,
+        running: Optional[bool] = None,
+        button_state: str = tk.NORMAL,
+    ) -> None:
+        """
+        Show a bot slot's state in its status label, dot and toggle button.
+
+        Args:
+            slot_id: Slot to update (ignored if it has no widgets).
+            status: Status text.
+            status_fg: Status text colour.
+            dot_fg: Status dot colour.
+            running: Show the stop (True) or start (False) button; None
+                leaves the button as it is.
+            button_state: Toggle button state.
+        """
+        widgets = self.bot_slots.get(slot_id)
+        if widgets is None:
+            return
+        self._configure_widget(widgets["status_text"], text=status, foreground=status_fg)
+        self._configure_widget(widgets["status_dot"], foreground=dot_fg)
+        if running is not None:
+            self._configure_widget(widgets["toggle_button"], text="■" if running else "▶", state=button_state)
+            self._create_tooltip(widgets["toggle_button"], "Stop Bot" if running else "Start Bot")
+    
     def _update_slot_to_stopped(self, slot_id: int) -> None:
         """Helper to update slot UI to stopped state after successful stop."""
-        if slot_id in self.bot_slots:
-            widgets = self.bot_slots[slot_id]
-            widgets["status_text"].config(text="Stopped", foreground="gray")
-            widgets["status_dot"].config(foreground="gray")
-            widgets["toggle_button"].config(text="▶", state=tk.NORMAL)
-            self._create_tooltip(widgets["toggle_button"], "Start Bot")
+        self._set_slot_ui(slot_id, status="Stopped", status_fg="gray", dot_fg="gray", running=False)
+    
+    def _update_all_slots_to_stopped(self) -> None:
+        """Helper to show every slot as stopped after stop_all_bots."""
+        for slot_id in self.bot_slots:
+            self._update_slot_to_stopped(slot_id)
     
     def _update_slot_to_stopped_error(self, slot_id: int) -> None:
         """Helper to update slot UI after error during stop."""
         if slot_id in self.bot_slots:
-            widgets = self.bot_slots[slot_id]
-            widgets["status_text"].config(text="Error stopping", foreground="red")
-            widgets["status_dot"].config(foreground="red")
+            self._set_slot_ui(slot_id, status="Error stopping", status_fg="red", dot_fg="red")
             # After a delay, show as stopped anyway
             self.root.after(2000, lambda: self._update_slot_to_stopped(slot_id))
     
-    def _update_slot_to_stopped(self, slot_id: int) -> None:
-        """Helper to update slot UI to stopped state."""
-        if slot_id in self.bot_slots:
-            widgets = self.bot_slots[slot_id]
-            widgets["status_text"].config(text="Stopped", foreground="gray")
-            widgets["status_dot"].config(foreground="gray")
-            widgets["toggle_button"].config(text="▶", state=tk.NORMAL)
-            self._create_tooltip(widgets["toggle_button"], "Start Bot")
-    
-    
     def start_all_bots(self) -> None:
         """Start all configured bots (only bots with valid device IPs)."""
+        if not self._settings_ready:
+            # config.yaml is still loading; retry shortly
+            self.root.after(100, self.start_all_bots)
+            return
         # Collect bots to start
         bots_to_start = []
         for slot_id in range(4):
@@ -1195,46 +1548,32 @@ class AutoGodPackGUI:
                     if status_info and not status_info.get("is_running", False):
                         bots_to_start.append(slot_id)
         
-        # Start bots with staggered delays to avoid ADB conflicts
-        def start_bots_staggered():
-            import time
-            for i, slot_id in enumerate(bots_to_start):
-                # Add delay between starts to avoid ADB conflicts
-                if i > 0:
-                    time.sleep(0.5)  # 500ms delay between bot starts
-                self.start_slot_bot(slot_id)
-        
-        # Run in background thread to avoid blocking GUI
+        # Start bots with staggered delays to avoid ADB conflicts. Tk runs each
+        # start on the main thread; start_slot_bot does the slow part in its
+        # own worker thread.
         if bots_to_start:
-            threading.Thread(target=start_bots_staggered, daemon=True).start()
+            self._reset_device_refresh()
+            for i, slot_id in enumerate(bots_to_start):
+                self.root.after(i * self.START_STAGGER_MS, self.start_slot_bot, slot_id)
     
     def stop_all_bots(self) -> None:
         """Stop all running bots (completely removes and restarts all bot instances)."""
         # Run stop operations in background thread to avoid lag
         def stop_all_in_thread():
             try:
-                # Stop all bots
+                # Stop and remove all bots completely, in parallel
                 if self.multi_bot_manager:
-                    self.multi_bot_manager.stop_all()
+                    self.multi_bot_manager.remove_all()
                 
-                # Remove all bots completely
-                for slot_id in range(4):
-                    if slot_id in self.bot_slots:
-                        if self.multi_bot_manager and self.multi_bot_manager.has_bot(slot_id):
-                            try:
-                                self.multi_bot_manager.remove_bot(slot_id)
-                            except Exception as e:
-                                logging.error(f"Error removing bot {slot_id + 1}: {e}")
-                        
-                        # Update UI on main thread
-                        widgets = self.bot_slots[slot_id]
-                        self.root.after_idle(lambda sid=slot_id, w=widgets: self._update_slot_to_stopped(sid))
+                # Update UI on main thread, all slots in one event
+                self.root.after_idle(self._update_all_slots_to_stopped)
                 
                 logging.info("All bots stopped and removed")
             except Exception as e:
                 logging.error(f"Error stopping all bots: {e}", exc_info=True)
         
         # Start in background thread
+        self._reset_device_refresh()
         threading.Thread(target=stop_all_in_thread, daemon=True).start()
     
     def update_bot_statuses(self) -> None:
@@ -1247,10 +1586,12 @@ class AutoGodPackGUI:
             return
         
         try:
+            # One `adb devices` listing for every slot instead of a
+            # connection probe per slot
+            statuses = self.multi_bot_manager.get_all_statuses()
             for slot_id in range(4):
                 if slot_id in self.bot_slots:
-                    widgets = self.bot_slots[slot_id]
-                    status_info = self.multi_bot_manager.get_bot_status(slot_id)
+                    status_info = statuses.get(slot_id)
                     
                     if status_info:
                         is_running = status_info.get("is_running", False)
@@ -1258,35 +1599,17 @@ class AutoGodPackGUI:
                         # Only check connection if bot is running to avoid blocking
                         is_connected = status_info.get("is_connected", False) if is_running else False
                         
-                        # Update status text
-                        widgets["status_text"].config(
-                            text=status,
-                            foreground="green" if is_running else ("red" if "Error" in status or "Failed" in status else "blue")
+                        self._set_slot_ui(
+                            slot_id,
+                            status=status,
+                            status_fg="green" if is_running and "Connecting" not in status else ("red" if "Error" in status or "Failed" in status else "blue"),
+                            dot_fg="green" if is_connected else ("orange" if "Connecting" in status or "Stopping" in status else "red"),
+                            running=is_running,
                         )
-                        
-                        # Update status dot
-                        widgets["status_dot"].config(
-                            foreground="green" if is_connected else ("orange" if "Connecting" in status or "Stopping" in status else "red")
-                        )
-                        
-                        # Update toggle button
-                        if is_running:
-                            widgets["toggle_button"].config(text="■", state=tk.NORMAL)
-                            self._create_tooltip(widgets["toggle_button"], "Stop Bot")
-                        else:
-                            widgets["toggle_button"].config(text="▶", state=tk.NORMAL)
-                            self._create_tooltip(widgets["toggle_button"], "Start Bot")
                     else:
                         # No bot in slot - show as stopped
                         # Don't test connection here to avoid blocking - just show gray
-                        widgets["status_dot"].config(foreground="gray")
-                        widgets["status_text"].config(
-                            text="Stopped",
-                            foreground="gray"
-                        )
-                        # Ensure toggle button shows start state when no bot
-                        widgets["toggle_button"].config(text="▶", state=tk.NORMAL)
-                        self._create_tooltip(widgets["toggle_button"], "Start Bot")
+                        self._update_slot_to_stopped(slot_id)
         except (tk.TclError, RuntimeError, AttributeError):
             # Window may have been destroyed or widgets don't exist
             if hasattr(self, '_shutting_down'):
@@ -1299,7 +1622,7 @@ class AutoGodPackGUI:
         # Schedule next update only if not shutting down
         if not (hasattr(self, '_shutting_down') and self._shutting_down):
             try:
-                self.root.after(2000, self.update_bot_statuses)
+                self.root.after(self._poll_interval_ms(), self.update_bot_statuses)
             except (tk.TclError, RuntimeError):
                 # Window may have been destroyed
                 if hasattr(self, '_shutting_down'):
@@ -1310,6 +1633,11 @@ class AutoGodPackGUI:
     
     def start_bot(self) -> None:
         """Start the bot (legacy method for backward compatibility)."""
+        if not self._settings_ready:
+            # config.yaml is still loading; retry shortly
+            self.root.after(100, self.start_bot)
+            return
+        
         # Run bot start in a thread to prevent GUI blocking
         # But keep GUI updates in main thread
         def start_in_thread():
@@ -1577,7 +1905,6 @@ Bot Thread: {self.bot_thread is not None if self.bot_thread else None}
 
     def _load_saved_devices(self) -> Dict[int, str]:
         """Load saved device IPs from file."""
-        import json
         if self.devices_file.exists():
             try:
                 with open(self.devices_file, 'r', encoding='utf-8') as f:
@@ -1597,7 +1924,6 @@ Bot Thread: {self.bot_thread is not None if self.bot_thread else None}
         if slot_id not in self.bot_slots:
             return
         
-        import json
         widgets = self.bot_slots[slot_id]
         device_serial = widgets["device_entry"].get().strip()
         
@@ -1628,8 +1954,38 @@ Bot Thread: {self.bot_thread is not None if self.bot_thread else None}
         except Exception as e:
             logging.warning(f"Error saving device IP: {e}")
 
+    def _configure_widget(self, widget: tk.Widget, **options) -> None:
+        """
+        Apply widget options, skipping those already set to the same value.
+
+        Every config() is a Tcl round-trip, and the status poll re-applies the
+        same values on almost every tick. The last applied values are kept on
+        the widget, so all updates of a widget must go through here.
+
+        Args:
+            widget: Widget to configure.
+            **options: Options as passed to widget.config().
+        """
+        applied = widget.__dict__.setdefault("applied_options", {})
+        changed = {key: value for key, value in options.items() if applied.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            applied.update(changed)
+
     def _create_tooltip(self, widget: tk.Widget, text: str) -> None:
-        """Create a tooltip for a widget."""
+        """
+        Create a tooltip for a widget, or change the text of its tooltip.
+
+        The handlers are bound once per widget and read the current text, so
+        callers can set the text on every status poll without rebinding.
+        """
+        if getattr(widget, "tooltip_text", None) == text:
+            return
+        already_bound = hasattr(widget, "tooltip_text")
+        widget.tooltip_text = text
+        if already_bound:
+            return
+
         def on_enter(event):
             tooltip = tk.Toplevel()
             tooltip.wm_overrideredirect(True)
@@ -1637,7 +1993,7 @@ Bot Thread: {self.bot_thread is not None if self.bot_thread else None}
             
             label = tk.Label(
                 tooltip,
-                text=text,
+                text=widget.tooltip_text,
                 background=self.navy_color,
                 foreground=self.gray_color,
                 relief=tk.SOLID,
@@ -1732,6 +2088,9 @@ Bot Thread: {self.bot_thread is not None if self.bot_thread else None}
 class GUILogHandler(logging.Handler):
     """Custom log handler for GUI with batching to reduce load."""
 
+    # How often queued records are written to the log widget (ms)
+    DRAIN_INTERVAL_MS = 50
+
     def __init__(self, gui_app: AutoGodPackGUI):
         """
         Initialize GUI log handler.
@@ -1741,91 +2100,60 @@ class GUILogHandler(logging.Handler):
         """
         super().__init__()
         self.gui_app = gui_app
-        self.log_queue = []
-        self.batch_size = 10  # Batch logs before updating GUI
         self.max_queue_size = 500  # Limit queue size to prevent memory issues
-        self.update_scheduled = False
+        # Formatted lines waiting for the GUI thread. emit() runs on any
+        # thread (bot workers included) and only appends here; deque appends
+        # and pops are thread-safe, and maxlen drops the oldest lines.
+        self.log_queue: Deque[str] = deque(maxlen=self.max_queue_size)
+        self._dropped = False
+
+    def start(self) -> None:
+        """Start draining queued records into the log widget (GUI thread)."""
+        self.gui_app.root.after(self.DRAIN_INTERVAL_MS, self._flush_logs)
 
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emit log record to GUI (batched for performance).
+        Queue log record for the GUI (no Tk calls, safe from any thread).
 
         Args:
             record: Log record.
         """
         try:
             # Stop accepting logs if shutting down
-            if hasattr(self.gui_app, '_shutting_down') and self.gui_app._shutting_down:
+            if self.gui_app._shutting_down:
                 return
-                
-            msg = self.format(record)
-            level = record.levelname
-            
-            # Limit queue size to prevent memory issues during long runs
-            if len(self.log_queue) >= self.max_queue_size:
-                # Remove oldest entries (keep most recent)
-                self.log_queue = self.log_queue[-self.max_queue_size//2:]
-                # Add a warning that logs were dropped
-                self.log_queue.insert(0, ("[WARNING] Log queue full, some logs were dropped", "WARNING"))
-            
-            # Add to queue
-            self.log_queue.append((msg, level))
-            
-            # Schedule batch update if not already scheduled
-            if not self.update_scheduled:
-                self.update_scheduled = True
-                # Use after() with small delay instead of after_idle to prevent callback queue buildup
-                # This gives the GUI time to process other events between log batches
-                try:
-                    self.gui_app.root.after(50, self._flush_logs)
-                except (tk.TclError, RuntimeError, AttributeError):
-                    self.update_scheduled = False
+            if len(self.log_queue) == self.max_queue_size:
+                self._dropped = True
+            self.log_queue.append(f"[{record.levelname}] {self.format(record)}\n")
         except Exception:
             pass  # Ignore errors in logging
     
     def _flush_logs(self) -> None:
-        """Flush batched logs to GUI."""
+        """Write all queued records to the log widget in one insert."""
+        if self.gui_app._shutting_down:
+            self.log_queue.clear()
+            return
         try:
-            # Stop if shutting down
-            if hasattr(self.gui_app, '_shutting_down') and self.gui_app._shutting_down:
-                self.update_scheduled = False
-                self.log_queue.clear()
-                return
-            
-            if not self.log_queue:
-                self.update_scheduled = False
-                return
-            
-            # Process batch (limit to prevent GUI freeze)
-            batch = self.log_queue[:self.batch_size]
-            self.log_queue = self.log_queue[self.batch_size:]
-            
-            # Update GUI with batch
-            if batch:
-                self.gui_app.log_text.config(state=tk.NORMAL)
-                for msg, level in batch:
-                    self.gui_app.log_text.insert(tk.END, f"[{level}] {msg}\n")
-                self.gui_app.log_text.see(tk.END)
-                # Limit log size to prevent memory issues (keep last 1000 lines)
-                lines = int(self.gui_app.log_text.index('end-1c').split('.')[0])
-                if lines > 1000:
-                    self.gui_app.log_text.delete('1.0', f'{lines - 1000}.0')
-                self.gui_app.log_text.config(state=tk.DISABLED)
+            lines = []
+            if self._dropped:
+                self._dropped = False
+                lines.append("[WARNING] Log queue full, some logs were dropped\n")
+            queue = self.log_queue
+            while queue:
+                lines.append(queue.popleft())
             
-            # Schedule next batch if queue not empty and not shutting down
-            # Use after() with delay instead of after_idle to prevent callback queue buildup
-            if self.log_queue and not (hasattr(self.gui_app, '_shutting_down') and self.gui_app._shutting_down):
-                try:
-                    self.gui_app.root.after(50, self._flush_logs)
-                except (tk.TclError, RuntimeError, AttributeError):
-                    self.update_scheduled = False
-            else:
-                self.update_scheduled = False
+            if lines and hasattr(self.gui_app, "log_text"):
+                self.gui_app._append_log("".join(lines))
         except (tk.TclError, RuntimeError, AttributeError):
             # Window may have been destroyed
-            self.update_scheduled = False
+            return
         except Exception:
-            self.update_scheduled = False
+            pass
+        
+        try:
+            self.gui_app.root.after(self.DRAIN_INTERVAL_MS, self._flush_logs)
+        except (tk.TclError, RuntimeError):
+            pass
 
 
 def main() -> None:
@@ -1873,9 +2201,10 @@ def main() -> None:
         
         if app_instance:
             app_instance._shutting_down = True
+            app_instance._flush_expansion_state()
             try:
                 if app_instance.multi_bot_manager:
-                    app_instance.multi_bot_manager.stop_all()
+                    app_instance.multi_bot_manager.close()
             except Exception as e:
                 logging.error(f"Error stopping bots during shutdown: {e}")
         
@@ -2,16 +2,94 @@
 
 import os
 import logging
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
 from pathlib import Path
 
 import cv2
 import numpy as np
 
+# Optional: JIT-compiled NCC for the small refine window (pip install numba)
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from ..utils.exceptions import TemplateNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# OpenCV transparent API: matchTemplate on cv2.UMat runs through OpenCL when
+# a device is available, and falls back to the CPU path otherwise
+try:
+    _USE_OPENCL = bool(cv2.ocl.haveOpenCL())
+    if _USE_OPENCL:
+        cv2.ocl.setUseOpenCL(True)
+except AttributeError:
+    _USE_OPENCL = False
+
+# Coarse-to-fine matching: a first pass on a pyrDown'ed screen rejects frames
+# where the template clearly isn't present; otherwise the full-resolution match
+# only runs in a small window around the coarse hit. Large templates use the
+# quarter-size level, smaller ones the half-size level.
+# Downscaling blurs the score, so the coarse pass accepts candidates somewhat
+# below the threshold - more so the further down the pyramid.
+# (Sharing one FFT of the coarse screen across templates was tried: with the
+# per-frame DFT and integral images it costs more than matchTemplate itself.)
+_PYRAMID_MARGINS = {1: 0.1, 2: 0.15}
+# Smallest template side kept at a pyramid level (so 16px -> level 1, 32px -> 2)
+_PYRAMID_MIN_SIDE = 8
+# Extra pixels around the coarse hit searched by the refine pass
+_PYRAMID_PAD = 4
+# Screens whose pyramids are kept (one frame in BGR and grayscale)
+_SCREEN_PYRAMIDS = 2
+
+
+if numba is not None:
+    # Not parallel=True: the window is tiny, and matches may already run on
+    # several threads (numba's default workqueue layer can't be re-entered)
+    @numba.njit(fastmath=True, cache=True)
+    def _ncc_best(screen, tmpl_centered, tmpl_norm):
+        """
+        Best TM_CCOEFF_NORMED score of a mean-centered template in screen.
+
+        Only used for the refine window, where the handful of positions makes a
+        direct sum cheaper than cv2.matchTemplate's general (DFT) path. The
+        argmax is tracked in the kernel, so no result array crosses back into
+        Python.
+
+        Returns:
+            Tuple of (score, row, col) of the best position.
+        """
+        th, tw, channels = tmpl_centered.shape
+        n = th * tw
+        best = -2.0
+        best_r = 0
+        best_c = 0
+        for r in range(screen.shape[0] - th + 1):
+            for c in range(screen.shape[1] - tw + 1):
+                num = 0.0
+                var = 0.0
+                for ch in range(channels):
+                    s = 0.0
+                    s2 = 0.0
+                    st = 0.0
+                    for i in range(th):
+                        for j in range(tw):
+                            v = np.float32(screen[r + i, c + j, ch])
+                            s += v
+                            s2 += v * v
+                            st += v * tmpl_centered[i, j, ch]
+                    # The template is centered, so sum(T'*I') == sum(T'*I)
+                    num += st
+                    var += s2 - s * s / n
+                denom = np.sqrt(var * tmpl_norm)
+                score = num / denom if denom > 1e-6 else 0.0
+                if score > best:
+                    best = score
+                    best_r = r
+                    best_c = c
+        return best, best_r, best_c
+
 
 class TemplateMatcher:
     """Handles template matching on screenshots with caching for performance."""
@@ -26,13 +104,29 @@ class TemplateMatcher:
         """
         self.default_threshold = default_threshold
         self.verbose = verbose
-        # Cache templates in memory to avoid repeated disk I/O
+        # Cache templates in memory to avoid repeated disk I/O. Templates never
+        # change at runtime, so entries are kept for the matcher's lifetime.
         self._template_cache: Dict[str, np.ndarray] = {}
-        self._template_mtime_cache: Dict[str, float] = {}
+        # Templates already uploaded for OpenCL matching (see find_template_batch)
+        self._umat_cache: Dict[str, "cv2.UMat"] = {}
+        # Pyramid level and downscaled template for the coarse pass
+        # (level 0 / None = too small to downscale)
+        self._small_template_cache: Dict[str, Tuple[int, Optional[np.ndarray]]] = {}
+        # Pyramids ([full, 1/2, 1/4], built lazily) of the most recent screens,
+        # so the templates matched against one frame share the downscaling.
+        # Two are kept so a frame's BGR and grayscale versions don't evict
+        # each other. The frames themselves are kept (not their ids) so the
+        # identity check can't be fooled by a recycled object.
+        self._screen_pyramids: List[Tuple[np.ndarray, List[np.ndarray]]] = []
+        # Coarse-pass result buffers by (template, level); the screen size is
+        # fixed, so matchTemplate can write into the same array every frame
+        self._coarse_results: Dict[Tuple[str, int], np.ndarray] = {}
+        # Mean-centered template and its squared norm for the numba kernel
+        self._ncc_template_cache: Dict[str, Tuple[np.ndarray, float]] = {}
 
     def _load_template(self, template_path: str) -> Optional[np.ndarray]:
         """
-        Load template with caching. Checks file modification time to invalidate cache.
+        Load template with caching (decoded once, no per-call stat).
         
         Args:
             template_path: Path to template image file.
@@ -40,32 +134,198 @@ class TemplateMatcher:
         Returns:
             Template image array or None if failed.
         """
-        # Check if template is cached and still valid
-        if template_path in self._template_cache:
-            try:
-                current_mtime = os.path.getmtime(template_path)
-                if current_mtime == self._template_mtime_cache.get(template_path, 0):
-                    return self._template_cache[template_path]
-            except OSError:
-                # File might have been deleted, remove from cache
-                self._template_cache.pop(template_path, None)
-                self._template_mtime_cache.pop(template_path, None)
+        template = self._template_cache.get(template_path)
+        if template is not None:
+            return template
         
         # Load template from disk
         template = cv2.imread(template_path, cv2.IMREAD_COLOR)
         if template is None:
             return None
         
-        # Cache template
-        try:
-            mtime = os.path.getmtime(template_path)
-            self._template_cache[template_path] = template
-            self._template_mtime_cache[template_path] = mtime
-        except OSError:
-            pass  # Cache without mtime if can't get it
-        
+        self._template_cache[template_path] = template
         return template
 
+    def _small_template(
+        self, template_path: str, template: np.ndarray
+    ) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        Get the downscaled template used by the coarse pass.
+
+        Args:
+            template_path: Path to template image file (cache key).
+            template: Full-size template image.
+
+        Returns:
+            Tuple of (pyramid level, downscaled template). Level 0 and None
+            mean the template is too small to downscale.
+        """
+        cached = self._small_template_cache.get(template_path)
+        if cached is not None:
+            return cached
+
+        level = 0
+        small = template
+        while level < max(_PYRAMID_MARGINS) and min(small.shape[:2]) >= 2 * _PYRAMID_MIN_SIDE:
+            small = cv2.pyrDown(small)
+            level += 1
+        cached = self._small_template_cache[template_path] = (
+            (level, small) if level else (0, None)
+        )
+        return cached
+
+    def _screen_level(self, screen: np.ndarray, level: int) -> np.ndarray:
+        """
+        Get a pyramid level of the screen, downscaling only once per frame.
+
+        Args:
+            screen: BGR image array of the screen.
+            level: Number of pyrDown halvings.
+
+        Returns:
+            Downscaled screen.
+        """
+        for cached_screen, pyramid in self._screen_pyramids:
+            if cached_screen is screen:
+                break
+        else:
+            pyramid = [screen]
+            self._screen_pyramids = [(screen, pyramid)] + self._screen_pyramids[:_SCREEN_PYRAMIDS - 1]
+        while len(pyramid) <= level:
+            pyramid.append(cv2.pyrDown(pyramid[-1]))
+        return pyramid[level]
+
+    def prepare_screen(self, screen: np.ndarray) -> None:
+        """
+        Build every pyramid level of a screen ahead of matching.
+
+        Matching from several threads at once is only safe after this call
+        (for the same screen): the matches then only read the shared pyramid.
+
+        Args:
+            screen: BGR or grayscale image array of the screen.
+        """
+        self._screen_level(screen, max(_PYRAMID_MARGINS))
+
+    def _refine(
+        self, window: np.ndarray, template_path: str, template: np.ndarray
+    ) -> Tuple[float, Tuple[int, int]]:
+        """
+        Full-resolution match inside the small window around a coarse hit.
+
+        Uses the numba NCC kernel when available (same score as
+        TM_CCOEFF_NORMED), otherwise cv2.matchTemplate.
+
+        Args:
+            window: Screen region to search (at least the template's size).
+            template_path: Path to template image file (cache key).
+            template: Full-size template image.
+
+        Returns:
+            Tuple of (score, (x, y) top-left location within the window).
+        """
+        if numba is None or window.dtype != np.uint8 or window.ndim != 3:
+            result = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return max_val, max_loc
+
+        centered, norm = self._ncc_stats(template_path, template)
+        score, row, col = _ncc_best(window, centered, norm)
+        return score, (col, row)
+
+    def _ncc_stats(self, template_path: str, template: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Get the mean-centered template and its squared norm for the NCC kernel.
+
+        Args:
+            template_path: Path to template image file (cache key).
+            template: Full-size template image.
+
+        Returns:
+            Tuple of (centered float32 template, sum of squares).
+        """
+        stats = self._ncc_template_cache.get(template_path)
+        if stats is None:
+            centered = template.astype(np.float32)
+            centered -= centered.reshape(-1, centered.shape[2]).mean(axis=0)
+            stats = self._ncc_template_cache[template_path] = (
+                centered, float((centered * centered).sum())
+            )
+        return stats
+
+    def warm_template(self, cache_key: str, template: np.ndarray) -> None:
+        """
+        Precompute everything matching a template needs, ahead of the first frame.
+
+        Builds the downscaled coarse-pass template and, with numba, the NCC
+        statistics, so the first detection doesn't pay for them.
+
+        Args:
+            cache_key: Stable name for the template, as passed to find_template_image.
+            template: BGR template image array.
+        """
+        self._small_template(cache_key, template)
+        if numba is not None and template.dtype == np.uint8 and template.ndim == 3:
+            self._ncc_stats(cache_key, template)
+
+    def _match(
+        self,
+        screen: np.ndarray,
+        template_path: str,
+        template: np.ndarray,
+        threshold: float,
+    ) -> Tuple[float, Tuple[int, int]]:
+        """
+        Find the best match of a template, coarse-to-fine.
+
+        Args:
+            screen: BGR image array of the screen.
+            template_path: Path to template image file (cache key).
+            template: Full-size template image.
+            threshold: Matching threshold.
+
+        Returns:
+            Tuple of (score, (x, y) top-left location). When the coarse pass
+            rejects the frame, the score is the coarse one (below threshold).
+        """
+        level, small_template = self._small_template(template_path, template)
+        if small_template is None:
+            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return max_val, max_loc
+
+        small_screen = self._screen_level(screen, level)
+        result_shape = (
+            small_screen.shape[0] - small_template.shape[0] + 1,
+            small_screen.shape[1] - small_template.shape[1] + 1,
+        )
+        coarse = self._coarse_results.get((template_path, level))
+        if coarse is None or coarse.shape != result_shape:
+            coarse = self._coarse_results[(template_path, level)] = np.empty(
+                result_shape, dtype=np.float32
+            )
+        coarse = cv2.matchTemplate(
+            small_screen, small_template, cv2.TM_CCOEFF_NORMED, result=coarse
+        )
+        _, coarse_val, _, coarse_loc = cv2.minMaxLoc(coarse)
+        scale = 1 << level
+        if coarse_val < threshold - _PYRAMID_MARGINS[level]:
+            return coarse_val, (coarse_loc[0] * scale, coarse_loc[1] * scale)
+
+        # Refine at full resolution around the coarse hit only
+        h, w = template.shape[:2]
+        screen_h, screen_w = screen.shape[:2]
+        pad = _PYRAMID_PAD + scale
+        x0 = max(0, coarse_loc[0] * scale - pad)
+        y0 = max(0, coarse_loc[1] * scale - pad)
+        x1 = min(screen_w, x0 + w + 2 * pad)
+        y1 = min(screen_h, y0 + h + 2 * pad)
+        x0 = max(0, min(x0, x1 - w))
+        y0 = max(0, min(y0, y1 - h))
+
+        max_val, max_loc = self._refine(screen[y0:y1, x0:x1], template_path, template)
+        return max_val, (max_loc[0] + x0, max_loc[1] + y0)
+
     def find_template(
         self,
         screen: np.ndarray,
@@ -91,19 +351,17 @@ class TemplateMatcher:
         if verbose is None:
             verbose = self.verbose
 
-        if not os.path.exists(template_path):
-            logger.error(f"Template not found: {template_path}")
-            raise TemplateNotFoundError(f"Template file not found: {template_path}")
-
-        # Load template (with caching)
+        # Load template (with caching); the file is only checked on a cache miss
         template = self._load_template(template_path)
         if template is None:
+            if not os.path.exists(template_path):
+                logger.error(f"Template not found: {template_path}")
+                raise TemplateNotFoundError(f"Template file not found: {template_path}")
             logger.error(f"Failed to load template: {template_path}")
             raise TemplateNotFoundError(f"Failed to load template image: {template_path}")
 
-        # Perform template matching
-        result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        # Perform template matching (coarse-to-fine)
+        max_val, max_loc = self._match(screen, template_path, template, threshold)
 
         if max_val >= threshold:
             h, w = template.shape[:2]
@@ -119,6 +377,94 @@ class TemplateMatcher:
 
         return None
 
+    def find_template_image(
+        self,
+        screen: np.ndarray,
+        template: np.ndarray,
+        threshold: Optional[float] = None,
+        cache_key: Optional[str] = None,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find an already decoded template in screen image.
+
+        Args:
+            screen: BGR image array of the screen.
+            template: BGR template image array.
+            threshold: Matching threshold (uses default if None).
+            cache_key: Stable name for the template (e.g. its path). Enables
+                the coarse-to-fine match, whose downscaled template is cached
+                under this key; without it the full-size search is used.
+
+        Returns:
+            Tuple of (x, y) center coordinates if found, None otherwise.
+        """
+        if threshold is None:
+            threshold = self.default_threshold
+
+        if cache_key is not None:
+            max_val, max_loc = self._match(screen, cache_key, template, threshold)
+        else:
+            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+
+        if max_val >= threshold:
+            h, w = template.shape[:2]
+            return (max_loc[0] + w // 2, max_loc[1] + h // 2)
+        return None
+
+    def find_template_batch(
+        self,
+        screen: np.ndarray,
+        templates: Dict[str, str],
+        threshold: Optional[float] = None,
+    ) -> Dict[str, Optional[Tuple[int, int]]]:
+        """
+        Match several templates against one screen.
+
+        With OpenCL available the screen is uploaded to the device once and
+        templates stay resident there between calls; otherwise each template
+        goes through the CPU coarse-to-fine match.
+
+        Args:
+            screen: BGR image array of the screen.
+            templates: Mapping of name to template path.
+            threshold: Matching threshold (uses default if None).
+
+        Returns:
+            Mapping of name to (x, y) center coordinates, or None if not found.
+
+        Raises:
+            TemplateNotFoundError: If a template file is missing or unreadable.
+        """
+        if threshold is None:
+            threshold = self.default_threshold
+
+        source = cv2.UMat(screen) if _USE_OPENCL else screen
+        results: Dict[str, Optional[Tuple[int, int]]] = {}
+
+        for name, template_path in templates.items():
+            template = self._load_template(template_path)
+            if template is None:
+                logger.error(f"Failed to load template: {template_path}")
+                raise TemplateNotFoundError(f"Failed to load template image: {template_path}")
+
+            if _USE_OPENCL:
+                device_template = self._umat_cache.get(template_path)
+                if device_template is None:
+                    device_template = self._umat_cache[template_path] = cv2.UMat(template)
+                result = cv2.matchTemplate(source, device_template, cv2.TM_CCOEFF_NORMED)
+                _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            else:
+                max_val, max_loc = self._match(screen, template_path, template, threshold)
+
+            if max_val >= threshold:
+                h, w = template.shape[:2]
+                results[name] = (max_loc[0] + w // 2, max_loc[1] + h // 2)
+            else:
+                results[name] = None
+
+        return results
+
     def get_template_path(
         self, filename: str, base_dir: Path, screen_dir: Optional[Path] = None
     ) -> Path:
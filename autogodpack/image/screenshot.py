@@ -2,6 +2,7 @@
 
 import io
 import logging
+import struct
 from typing import Optional
 
 import cv2
@@ -9,31 +10,135 @@ import numpy as np
 from PIL import Image
 
 from ..adb.client import ADBClient
-from ..utils.exceptions import ScreenshotError
+from ..utils.exceptions import ADBError, ScreenshotError
 
 logger = logging.getLogger(__name__)
 
+# Raw `screencap` (no -p) output: u32 width, height, pixel format, then
+# (Android 9+) u32 color space, followed by width*height*4 pixel bytes
+_RAW_HEADER = struct.Struct("<III")
+_RAW_HEADER_SIZES = (12, 16)
+_RAW_FORMATS_4BPP = (1, 2)  # RGBA_8888, RGBX_8888
+
+
+def decode_raw_screencap(
+    data: bytes, out: Optional[np.ndarray] = None
+) -> Optional[np.ndarray]:
+    """
+    Decode raw `screencap` output into a BGR array, skipping PNG entirely.
+
+    Args:
+        data: Bytes written by `adb exec-out screencap` (without -p).
+        out: Optional uint8 (height, width, 3) array to decode into. Ignored
+            if its shape doesn't match the frame.
+
+    Returns:
+        BGR image array, or None if the data is not a supported raw frame.
+    """
+    if len(data) < _RAW_HEADER.size:
+        return None
+    width, height, pixel_format = _RAW_HEADER.unpack_from(data)
+    pixel_bytes = width * height * 4
+    header_size = len(data) - pixel_bytes
+    if (
+        width == 0
+        or height == 0
+        or header_size not in _RAW_HEADER_SIZES
+        or pixel_format not in _RAW_FORMATS_4BPP
+    ):
+        return None
+    rgba = np.frombuffer(data, np.uint8, count=pixel_bytes, offset=header_size)
+    if out is not None and out.shape == (height, width, 3):
+        return cv2.cvtColor(rgba.reshape(height, width, 4), cv2.COLOR_RGBA2BGR, dst=out)
+    return cv2.cvtColor(rgba.reshape(height, width, 4), cv2.COLOR_RGBA2BGR)
+
 
 class ScreenshotCapture:
     """Handles screenshot capture from Android device."""
 
-    def __init__(self, client: ADBClient):
+    def __init__(self, client: ADBClient, reuse_buffer: bool = False, raw: bool = True):
         """
         Initialize screenshot capture.
 
         Args:
             client: ADB client instance.
+            raw: Capture uncompressed `screencap` frames, falling back to PNG
+                (`screencap -p`) only if the device output can't be decoded.
+            reuse_buffer: Decode every BGR frame into one preallocated array
+                instead of a new ~6 MB array per capture. A frame returned by
+                capture_bgr() is then only valid until the next capture_bgr().
         """
         self.client = client
+        # Cleared the first time the device returns raw output we can't decode
+        self._raw_supported = raw
+        self.reuse_buffer = reuse_buffer
+        # Preallocated BGR frame (reuse_buffer only), sized on first capture
+        self._frame: Optional[np.ndarray] = None
+
+    def _frame_buffer(self, height: int, width: int) -> Optional[np.ndarray]:
+        """
+        Get the reusable BGR frame for a screen of the given size.
+
+        Returns:
+            The buffer, or None when buffer reuse is disabled.
+        """
+        if not self.reuse_buffer:
+            return None
+        if self._frame is None or self._frame.shape[:2] != (height, width):
+            # First capture, or the screen size changed (e.g. rotation)
+            self._frame = np.empty((height, width, 3), dtype=np.uint8)
+        return self._frame
+
+    def _to_frame(self, img: np.ndarray) -> np.ndarray:
+        """Return a fresh view of a decoded frame (see reuse_buffer)."""
+        # A new view per capture keeps identity-keyed per-frame caches (such
+        # as TemplateMatcher's downscaled screen) from seeing a stale frame
+        return img.view() if img is self._frame else img
+
+    def _capture_raw_bgr(self) -> Optional[np.ndarray]:
+        """Capture an uncompressed frame; None if unsupported or failed."""
+        try:
+            # Straight through the adb server socket - no adb process per frame
+            data = self.client.exec_out("screencap")
+        except ADBError as e:
+            logger.debug("Socket screencap failed, falling back to adb: %s", e)
+            result = self.client.execute(["exec-out", "screencap"], capture_output=True)
+            if result.returncode != 0:
+                return None
+            data = result.stdout
+        if not data:
+            return None
+        frame = None
+        if self.reuse_buffer and len(data) >= _RAW_HEADER.size:
+            width, height, _ = _RAW_HEADER.unpack_from(data)
+            frame = self._frame_buffer(height, width)
+        img = decode_raw_screencap(data, out=frame)
+        if img is None:
+            logger.info(
+                f"Raw screencap not supported (ADB_SERIAL={self.client.serial}), using PNG"
+            )
+            self._raw_supported = False
+        return img
 
     def capture_bgr(self) -> Optional[np.ndarray]:
         """
         Capture screenshot and return as BGR numpy array.
 
+        Uses raw `screencap` output when the device supports it, which
+        avoids PNG encoding on the device and decoding on the host.
+
         Returns:
             BGR image array, or None if capture failed.
         """
         try:
+            # Let fire-and-forget taps land before capturing
+            self.client.flush()
+
+            if self._raw_supported:
+                img = self._capture_raw_bgr()
+                if img is not None:
+                    return self._to_frame(img)
+
             result = self.client.execute(["exec-out", "screencap", "-p"], capture_output=True)
 
             if result.returncode != 0:
@@ -52,9 +157,12 @@ class ScreenshotCapture:
                 return None
 
             # Convert bytes to image
-            img = Image.open(io.BytesIO(result.stdout))
+            rgb = np.array(Image.open(io.BytesIO(result.stdout)))
             # Convert RGB to BGR for OpenCV
-            return cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+            frame = self._frame_buffer(*rgb.shape[:2])
+            if frame is not None:
+                return self._to_frame(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=frame))
+            return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
 
         except Exception as e:
             logger.error(f"Error processing screenshot: {e}")
@@ -64,10 +172,20 @@ class ScreenshotCapture:
         """
         Capture screenshot and return as RGB numpy array.
 
+        Uses raw `screencap` output when supported, like capture_bgr().
+
         Returns:
             RGB image array, or None if capture failed.
         """
         try:
+            # Let fire-and-forget taps land before capturing
+            self.client.flush()
+
+            if self._raw_supported:
+                img = self._capture_raw_bgr()
+                if img is not None:
+                    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
             result = self.client.execute(["exec-out", "screencap", "-p"], capture_output=True)
 
             if result.returncode != 0:
@@ -2,6 +2,9 @@
 
 import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +13,43 @@ from ..utils.exceptions import StateError
 
 logger = logging.getLogger(__name__)
 
+# os.replace onto a file another process has open fails on Windows; readers
+# only hold it briefly, so retry a few times before giving up
+_REPLACE_ATTEMPTS = 10
+_REPLACE_RETRY_DELAY = 0.05
+
+
+def write_file_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file through a temp file swapped in place, so readers never see
+    a partial file.
+
+    Args:
+        path: File to write.
+        data: New file contents.
+
+    Raises:
+        OSError: If the file cannot be written or replaced.
+    """
+    # Per-thread temp name: several bots may save the same file at once
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_file.write_bytes(data)
+        for attempt in range(_REPLACE_ATTEMPTS):
+            try:
+                os.replace(tmp_file, path)
+                return
+            except PermissionError:
+                if attempt == _REPLACE_ATTEMPTS - 1:
+                    raise
+                time.sleep(_REPLACE_RETRY_DELAY)
+    finally:
+        # Only still there if the write or replace failed
+        try:
+            tmp_file.unlink()
+        except FileNotFoundError:
+            pass
+
 
 class StatePersistence:
     """Handles persistence of bot state."""
@@ -142,8 +182,11 @@ class StatePersistence:
             # Ensure directory exists
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(multi_state.to_dict(), f, indent=2)
+            # Swap the file in whole: the GUI and other bots read it while
+            # bots save it, and a partial read would be treated as corrupt
+            # and reset
+            payload = json.dumps(multi_state.to_dict(), indent=2)
+            write_file_atomic(self.state_file, payload.encode("utf-8"))
 
             logger.debug(f"State saved to {self.state_file}")
 
@@ -1,4 +1,4 @@
-import subprocess, time, os, logging, json, threading
+import subprocess, time, os, logging, json, threading, functools
 from PIL import Image
 import io
 import cv2
@@ -35,6 +35,14 @@ def set_slot_id(slot_id):
     """Set slot_id in thread-local storage for current thread."""
     _thread_local.slot_id = slot_id
 
+def set_screenshot_backend(capture_func):
+    """
+    Set a screenshot function for the current thread (None restores the default).
+    
+    capture_func() must return a BGR image or None, like screenshot_bgr().
+    """
+    _thread_local.screenshot_backend = capture_func
+
 def get_bot_prefix():
     """Get bot prefix for logging (e.g., '[Bot 1]' or '' if no slot_id)."""
     slot_id = get_slot_id()
@@ -108,15 +116,47 @@ console.setLevel(logging.INFO)
 console.setFormatter(logging.Formatter("%(asctime)s [%(levelname)-8s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
 logging.getLogger().addHandler(console)
 
-def adb_cmd(args, capture_output=True):
+def adb_cmd(args, capture_output=True, discard_output=False):
     adb_serial = get_adb_serial()
     cmd = ["adb", "-s", adb_serial] + args
+    if discard_output:
+        # Only the return code is needed - don't allocate pipes
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     return subprocess.run(cmd,
         stdout=subprocess.PIPE if capture_output else None,
         stderr=subprocess.PIPE
     )
 
+# Saída raw do `screencap` (sem -p): u32 largura, altura, formato de pixel e
+# (Android 9+) u32 espaço de cor, seguidos de largura*altura*4 bytes RGBA
+_RAW_SCREENCAP_SUPPORTED = True
+
+def _screenshot_raw_bgr():
+    """Captura sem PNG (nem encode no device nem decode no host); None se não suportado."""
+    global _RAW_SCREENCAP_SUPPORTED
+    p = adb_cmd(["exec-out", "screencap"])
+    if p.returncode != 0 or not p.stdout or len(p.stdout) < 12:
+        return None
+    data = p.stdout
+    width, height, pixel_format = np.frombuffer(data, "<u4", count=3)
+    pixel_bytes = int(width) * int(height) * 4
+    header_size = len(data) - pixel_bytes
+    # Apenas RGBA_8888 / RGBX_8888 com cabeçalho de 12 ou 16 bytes
+    if width == 0 or height == 0 or header_size not in (12, 16) or pixel_format not in (1, 2):
+        logging.info(f"Raw screencap não suportado (device={get_adb_serial()}), usando PNG")
+        _RAW_SCREENCAP_SUPPORTED = False
+        return None
+    rgba = np.frombuffer(data, np.uint8, count=pixel_bytes, offset=header_size)
+    return cv2.cvtColor(rgba.reshape(int(height), int(width), 4), cv2.COLOR_RGBA2BGR)
+
 def screenshot_bgr():
+    backend = getattr(_thread_local, 'screenshot_backend', None)
+    if backend is not None:
+        return backend()
+    if _RAW_SCREENCAP_SUPPORTED:
+        img = _screenshot_raw_bgr()
+        if img is not None:
+            return img
     adb_serial = get_adb_serial()
     p = adb_cmd(["exec-out", "screencap", "-p"])
     if p.returncode != 0:
@@ -134,35 +174,31 @@ def screenshot_bgr():
         return None
 
 # Template cache for performance optimization
+# Templates never change while the bot runs, so entries are never invalidated
+# (no per-match stat of the template file)
 _template_cache = {}
-_template_mtime_cache = {}
+
+@functools.lru_cache(maxsize=None)
+def template_exists(template_path):
+    """
+    Verifica se um template existe, consultando o disco só na primeira vez.
+    Os templates não mudam durante a execução, então o resultado é cacheado
+    (evita um stat() por template a cada frame).
+    """
+    return os.path.exists(template_path)
 
 def _load_template_cached(template_path):
     """Load template with caching to reduce disk I/O."""
-    # Check if template is cached and still valid
-    if template_path in _template_cache:
-        try:
-            current_mtime = os.path.getmtime(template_path)
-            if current_mtime == _template_mtime_cache.get(template_path, 0):
-                return _template_cache[template_path]
-        except OSError:
-            # File might have been deleted, remove from cache
-            _template_cache.pop(template_path, None)
-            _template_mtime_cache.pop(template_path, None)
+    tpl = _template_cache.get(template_path)
+    if tpl is not None:
+        return tpl
     
     # Load template from disk
     tpl = cv2.imread(template_path, cv2.IMREAD_COLOR)
     if tpl is None:
         return None
     
-    # Cache template
-    try:
-        mtime = os.path.getmtime(template_path)
-        _template_cache[template_path] = tpl
-        _template_mtime_cache[template_path] = mtime
-    except OSError:
-        pass  # Cache without mtime if can't get it
-    
+    _template_cache[template_path] = tpl
     return tpl
 
 def find_template(screen, template_path, threshold=0.82, verbose=True):
@@ -202,14 +238,13 @@ def tap(x, y):
     y_int = int(y)
     # Removed debug logging - too verbose
     
-    result = adb_cmd(["shell", "input", "tap", str(x_int), str(y_int)], capture_output=True)
+    result = adb_cmd(["shell", "input", "tap", str(x_int), str(y_int)], discard_output=True)
     
     if result.returncode == 0:
         # Removed debug logging - too verbose
         time.sleep(0.3)
         return True
     else:
-        stderr = result.stderr.decode('utf-8', errors='ignore') if result.stderr else "Unknown error"
         # Only log errors, not debug info
         return False
 
@@ -232,7 +267,7 @@ def swipe(x1, y1, x2, y2, duration_ms=500):
     
     # Removed debug logging - too verbose
     
-    result = adb_cmd(["shell", "input", "swipe", str(x1_int), str(y1_int), str(x2_int), str(y2_int), str(duration_ms)], capture_output=True)
+    result = adb_cmd(["shell", "input", "swipe", str(x1_int), str(y1_int), str(x2_int), str(y2_int), str(duration_ms)], discard_output=True)
     
     if result.returncode == 0:
         # Removed debug logging - too verbose
@@ -295,12 +330,26 @@ def detect_current_battle_screen(verbose=True):
         # Only log critical errors
         return None
     
+    return detect_current_battle_screen_from_bgr(screen, verbose=verbose)
+
+def detect_current_battle_screen_from_bgr(screen, verbose=True):
+    """
+    Igual a detect_current_battle_screen, mas usa um screenshot já capturado
+    (evita um segundo screencap quando o chamador já tem o frame).
+    
+    Args:
+        screen: Imagem BGR já capturada
+        verbose: Se True, loga informações detalhadas sobre a detecção
+    
+    Returns:
+        str: Nome da tela detectada ou None se não reconhecida
+    """
     # Verifica cada tela em ordem de prioridade (da mais específica para a menos específica)
     detected_templates = []
     
     # Screen 8: Pop-up OK (mais específico - aparece sobre outras telas)
     ok_path = get_template_path("ok.png", SCREEN_8_DIR)
-    if os.path.exists(ok_path):
+    if template_exists(ok_path):
         ok_pos = find_template(screen, ok_path, threshold=0.75, verbose=False)
         if ok_pos:
             logging.info(f"{get_bot_prefix()}Page: Popup OK (Screen 8)")
@@ -309,7 +358,7 @@ def detect_current_battle_screen(verbose=True):
     
     # Screen Defeat Popup: Defeat popup with Back button
     back_path = get_template_path("back.png", SCREEN_DEFEAT_POPUP_DIR)
-    if os.path.exists(back_path):
+    if template_exists(back_path):
         back_pos = find_template(screen, back_path, threshold=0.75, verbose=False)
         if back_pos:
             logging.info(f"{get_bot_prefix()}Page: Defeat Popup")
@@ -318,7 +367,7 @@ def detect_current_battle_screen(verbose=True):
     
     # Screen 7: Next button
     next_path = get_template_path("next.png", SCREEN_7_DIR)
-    if os.path.exists(next_path):
+    if template_exists(next_path):
         next_pos = find_template(screen, next_path, threshold=0.75, verbose=False)
         if next_pos:
             logging.info(f"{get_bot_prefix()}Page: Summary (Screen 7)")
@@ -327,7 +376,7 @@ def detect_current_battle_screen(verbose=True):
     
     # Screen Defeat: Defeat screen
     defeat_path = get_template_path("defeat.png", SCREEN_DEFEAT_DIR)
-    if os.path.exists(defeat_path):
+    if template_exists(defeat_path):
         defeat_pos = find_template(screen, defeat_path, threshold=0.75, verbose=False)
         if defeat_pos:
             logging.info(f"{get_bot_prefix()}Page: Defeat")
@@ -341,7 +390,7 @@ def detect_current_battle_screen(verbose=True):
     # se está na tela de seleção de expansões (com botão X/close) antes de considerar battle_selection
     close_x_path = os.path.join(CLOSE_BUTTON_DIR, "close_x.png")
     has_close_button = False
-    if os.path.exists(close_x_path):
+    if template_exists(close_x_path):
         close_pos = find_template(screen, close_x_path, threshold=0.75, verbose=False)
         if close_pos:
             has_close_button = True
@@ -359,14 +408,14 @@ def detect_current_battle_screen(verbose=True):
         else:
             exp_path = os.path.join(SERIES_B_DIR, f"{expansion}.png")
         
-        if os.path.exists(exp_path):
+        if template_exists(exp_path):
             pos = find_template(screen, exp_path, threshold=0.75, verbose=False)
             if pos:
                 # Se encontrou expansão mas também tem botão Expansions, está em battle_selection
                 # Se não tem botão Expansions, está em select_expansion
                 expansions_path = get_template_path("expansions.png", SCREEN_1_BATTLE_SELECTION_DIR)
                 has_expansions_button = False
-                if os.path.exists(expansions_path):
+                if template_exists(expansions_path):
                     expansions_pos = find_template(screen, expansions_path, threshold=0.75, verbose=False)
                     if expansions_pos:
                         has_expansions_button = True
@@ -384,7 +433,7 @@ def detect_current_battle_screen(verbose=True):
     # IMPORTANTE: Verificar ANTES de battle_setup para evitar falsos positivos
     expansions_pos = None
     expansions_path = get_template_path("expansions.png", SCREEN_1_BATTLE_SELECTION_DIR)
-    if os.path.exists(expansions_path):
+    if template_exists(expansions_path):
         expansions_pos = find_template(screen, expansions_path, threshold=0.75, verbose=False)
         if expansions_pos:
             logging.info(f"{get_bot_prefix()}Page: Battle Selection")
@@ -398,11 +447,11 @@ def detect_current_battle_screen(verbose=True):
     opponent_pos = None
     put_basic_pos = None
     
-    if os.path.exists(opponent_path):
+    if template_exists(opponent_path):
         opponent_pos = find_template(screen, opponent_path, threshold=0.75, verbose=False)
         detected_templates.append(("opponent.png", opponent_pos is not None))
     
-    if os.path.exists(put_basic_path):
+    if template_exists(put_basic_path):
         put_basic_pos = find_template(screen, put_basic_path, threshold=0.75, verbose=False)
         detected_templates.append(("put_basic_pokemon.png", put_basic_pos is not None))
     
@@ -417,10 +466,10 @@ def detect_current_battle_screen(verbose=True):
     battle_path = get_template_path("battle.png", SCREEN_2_BATTLE_SETUP_DIR)
     auto_pos = None
     battle_pos = None
-    if os.path.exists(auto_path):
+    if template_exists(auto_path):
         auto_pos = find_template(screen, auto_path, threshold=0.75)
         detected_templates.append(("auto.png", auto_pos is not None))
-    if os.path.exists(battle_path):
+    if template_exists(battle_path):
         battle_pos = find_template(screen, battle_path, threshold=0.75)
         detected_templates.append(("battle.png", battle_pos is not None))
     
@@ -432,7 +481,7 @@ def detect_current_battle_screen(verbose=True):
     
     # Screens 4-5-6: Tap to Proceed
     tap_4_5_6_path = get_template_path("tap_to_proceed.png", SCREEN_4_5_6_DIR)
-    if os.path.exists(tap_4_5_6_path):
+    if template_exists(tap_4_5_6_path):
         tap_4_5_6_pos = find_template(screen, tap_4_5_6_path, threshold=0.75, verbose=False)
         if tap_4_5_6_pos:
             logging.info(f"{get_bot_prefix()}Page: Rewards (Screens 4-5-6)")
@@ -441,7 +490,7 @@ def detect_current_battle_screen(verbose=True):
     
     # Screen 3: Result Screen (victory/defeat) - Tap to Proceed
     tap_result_path = get_template_path("tap_to_proceed.png", SCREEN_3_VICTORY_DIR)
-    if os.path.exists(tap_result_path):
+    if template_exists(tap_result_path):
         tap_result_pos = find_template(screen, tap_result_path, threshold=0.75, verbose=False)
         if tap_result_pos:
             logging.info(f"{get_bot_prefix()}Page: Result Screen")
@@ -450,7 +499,7 @@ def detect_current_battle_screen(verbose=True):
     
     # Screen 1: Battle Selection (hourglass - secondary indicator)
     hourglass_path = get_template_path("hourglass.png", SCREEN_1_BATTLE_SELECTION_DIR)
-    if os.path.exists(hourglass_path):
+    if template_exists(hourglass_path):
         hourglass_pos = find_template(screen, hourglass_path, threshold=0.75, verbose=False)
         if hourglass_pos:
             logging.info(f"{get_bot_prefix()}Page: Battle Selection")
@@ -474,7 +523,7 @@ def find_hourglass(max_scrolls=3):
     """
     hourglass_path = get_template_path("hourglass.png", SCREEN_1_BATTLE_SELECTION_DIR)
     
-    if not os.path.exists(hourglass_path):
+    if not template_exists(hourglass_path):
         logging.error(f"Template hourglass.png not found at {hourglass_path}")
         logging.error("Please ensure hourglass.png exists in templates/battle/battle_selection/")
         return None
@@ -595,7 +644,7 @@ def handle_battle_setup_screen():
     
     # Look for Auto button (when OFF)
     auto_pos = None
-    if os.path.exists(auto_path):
+    if template_exists(auto_path):
         auto_pos = find_template(screen, auto_path, threshold=0.75, verbose=False)
     
     # If Auto is OFF, turn it ON
@@ -616,7 +665,7 @@ def handle_battle_setup_screen():
         # Removed debug logging
     
     # Verify Auto is ON before clicking Battle
-    if os.path.exists(auto_path):
+    if template_exists(auto_path):
         final_check_screen = screenshot_bgr()
         if final_check_screen is None:
             return False
@@ -641,7 +690,7 @@ def handle_battle_setup_screen():
     
     # Now that Auto is confirmed ON, find and click Battle button
     battle_path = get_template_path("battle.png", SCREEN_2_BATTLE_SETUP_DIR)
-    if not os.path.exists(battle_path):
+    if not template_exists(battle_path):
         # Only log critical errors
         return False
     
@@ -796,7 +845,7 @@ def detect_expansion_selection_screen(screen=None):
         else:
             exp_path = os.path.join(SERIES_B_DIR, f"{expansion}.png")
         
-        if os.path.exists(exp_path):
+        if template_exists(exp_path):
             pos = find_template(screen, exp_path, threshold=0.75, verbose=False)
             if pos:
                 found_expansions.append(expansion)
@@ -815,7 +864,7 @@ def tap_expansions_button():
     logging.info(f"{get_bot_prefix()}Clicking Expansions button...")
     expansions_path = get_template_path("expansions.png", SCREEN_1_BATTLE_SELECTION_DIR)
     
-    if not os.path.exists(expansions_path):
+    if not template_exists(expansions_path):
         logging.error(f"Template expansions.png not found at {expansions_path}")
         return False
     
@@ -845,7 +894,7 @@ def find_expansion_in_screen(expansion_name, series, max_scrolls=8):
     else:
         exp_path = os.path.join(SERIES_B_DIR, f"{expansion_name}.png")
     
-    if not os.path.exists(exp_path):
+    if not template_exists(exp_path):
         logging.error(f"Template {expansion_name}.png not found at {exp_path}")
         return None
     
@@ -899,7 +948,7 @@ def find_expansion_in_screen(expansion_name, series, max_scrolls=8):
         
         # Look for X (close) button
         close_x_path = os.path.join(CLOSE_BUTTON_DIR, "close_x.png")
-        if not os.path.exists(close_x_path):
+        if not template_exists(close_x_path):
             # Removed warning logging - too verbose
             break
         
@@ -922,7 +971,7 @@ def find_expansion_in_screen(expansion_name, series, max_scrolls=8):
         
         # Now click Expansions button to return
         expansions_path = get_template_path("expansions.png", SCREEN_1_BATTLE_SELECTION_DIR)
-        if not os.path.exists(expansions_path):
+        if not template_exists(expansions_path):
             # Removed warning logging - too verbose
             break
         
@@ -1045,7 +1094,7 @@ def navigate_back_to_expansion_selection():
     # Look for Expansions button on current screen
     expansions_path = get_template_path("expansions.png", SCREEN_1_BATTLE_SELECTION_DIR)
     
-    if not os.path.exists(expansions_path):
+    if not template_exists(expansions_path):
         # Only log critical errors
         return False
     
@@ -1210,7 +1259,7 @@ def switch_to_series(series_letter):
     # Template path para o botão de série
     series_template = os.path.join(SERIES_SWITCH_DIR, f"{series_letter.lower()}.png")
     
-    if not os.path.exists(series_template):
+    if not template_exists(series_template):
         logging.error(f"Template {series_letter.lower()}.png not found at {series_template}")
         return False
     
@@ -1553,12 +1602,12 @@ def wait_for_battle_completion(max_wait_time=None):
     auto_off_path = get_template_path("auto_off.png", BATTLE_IN_PROGRESS_DIR)
     put_basic_path = get_template_path("put_basic_pokemon.png", BATTLE_IN_PROGRESS_DIR)
     
-    if not os.path.exists(tap_to_proceed_path):
+    if not template_exists(tap_to_proceed_path):
         logging.error(f"Template tap_to_proceed.png not found at {tap_to_proceed_path}")
         logging.error("Please ensure tap_to_proceed.png exists in templates/battle/result/")
         return False
     
-    if not os.path.exists(opponent_path):
+    if not template_exists(opponent_path):
         logging.debug(f"Template opponent.png not found at {opponent_path}")
         logging.debug("Using alternative detection method (without Opponent)")
     
@@ -1603,7 +1652,8 @@ def wait_for_battle_completion(max_wait_time=None):
             return True
         
         # Detecta qual tela está sendo exibida PRIMEIRO (sem logs verbosos)
-        detected_screen = detect_current_battle_screen(verbose=False)
+        # Reusa o mesmo screenshot em vez de capturar outro
+        detected_screen = detect_current_battle_screen_from_bgr(screen, verbose=False)
         
         # Verifica se ainda estamos na tela de Battle Setup (o clique pode não ter funcionado)
         # IMPORTANTE: Só tenta clicar novamente se realmente estiver em battle_setup
@@ -1612,9 +1662,9 @@ def wait_for_battle_completion(max_wait_time=None):
         if detected_screen == "battle_setup":
             auto_setup_path = get_template_path("auto.png", SCREEN_2_BATTLE_SETUP_DIR)
             # Confirma que está realmente na tela de Battle Setup verificando auto.png
-            if os.path.exists(auto_setup_path):
+            if template_exists(auto_setup_path):
                 auto_setup_pos = find_template(screen, auto_setup_path, threshold=0.75, verbose=False)
-                if auto_setup_pos and os.path.exists(battle_path):
+                if auto_setup_pos and template_exists(battle_path):
                     battle_pos = find_template(screen, battle_path, threshold=0.75, verbose=False)
                     if battle_pos:
                         logging.warning(f"{get_bot_prefix()}Still on Battle Setup screen after {elapsed}s - click may not have worked")
@@ -1632,18 +1682,18 @@ def wait_for_battle_completion(max_wait_time=None):
         
         if detected_screen == "battle_in_progress":
             is_in_battle = True
-        elif os.path.exists(opponent_path):
+        elif template_exists(opponent_path):
             opponent_pos = find_template(screen, opponent_path, threshold=0.75, verbose=False)
             if opponent_pos:
                 is_in_battle = True
-        elif os.path.exists(put_basic_path):
+        elif template_exists(put_basic_path):
             put_basic_pos = find_template(screen, put_basic_path, threshold=0.75, verbose=False)
             if put_basic_pos:
                 is_in_battle = True
                 logging.debug(f"'Put Basic Pokémon' screen detected - waiting for Auto to place Pokémon...")
         
         # Check if Auto is OFF during battle
-        if is_in_battle and os.path.exists(auto_off_path):
+        if is_in_battle and template_exists(auto_off_path):
             auto_off_pos = find_template(screen, auto_off_path, threshold=0.75, verbose=False)
             if auto_off_pos:
                 logging.warning(f"{get_bot_prefix()}Auto is OFF during battle after {elapsed}s! Enabling Auto...")
@@ -1657,12 +1707,12 @@ def wait_for_battle_completion(max_wait_time=None):
             if detected_screen == "battle_in_progress":
                 battle_started = True
                 logging.info(f"{get_bot_prefix()}Battle started! Detected battle_in_progress after {elapsed}s")
-            elif os.path.exists(opponent_path):
+            elif template_exists(opponent_path):
                 opponent_pos = find_template(screen, opponent_path, threshold=0.75, verbose=False)
                 if opponent_pos:
                     battle_started = True
                     logging.info(f"{get_bot_prefix()}Battle started! Opponent found after {elapsed}s")
-            elif os.path.exists(put_basic_path):
+            elif template_exists(put_basic_path):
                 put_basic_pos = find_template(screen, put_basic_path, threshold=0.75, verbose=False)
                 if put_basic_pos:
                     battle_started = True
@@ -1708,7 +1758,7 @@ def handle_defeat_screen():
     # Procura pelo texto "Tap to Proceed" (usa o mesmo template da vitória)
     tap_to_proceed_path = get_template_path("tap_to_proceed.png", SCREEN_3_VICTORY_DIR)
     
-    if not os.path.exists(tap_to_proceed_path):
+    if not template_exists(tap_to_proceed_path):
         logging.error(f"{get_bot_prefix()}Template tap_to_proceed.png not found at {tap_to_proceed_path}")
         logging.error(f"{get_bot_prefix()}Please ensure tap_to_proceed.png exists in templates/battle/result/")
         return False
@@ -1733,7 +1783,7 @@ def handle_defeat_screen():
     
     # Check if defeat popup appeared with Back button after second tap
     back_path = get_template_path("back.png", SCREEN_DEFEAT_POPUP_DIR)
-    if os.path.exists(back_path):
+    if template_exists(back_path):
         screen_after_second = screenshot_bgr()
         if screen_after_second is not None:
             back_pos = find_template(screen_after_second, back_path, threshold=0.75, verbose=False)
@@ -1750,7 +1800,7 @@ def handle_defeat_screen():
     next_path = get_template_path("next.png", SCREEN_7_DIR)
     screen_after_second = screenshot_bgr()
     
-    if screen_after_second is not None and os.path.exists(next_path):
+    if screen_after_second is not None and template_exists(next_path):
         next_pos = find_template(screen_after_second, next_path, threshold=0.75, verbose=False)
         if next_pos:
             logging.info(f"{get_bot_prefix()}Already on Screen 7 after second 'Tap to Proceed'. Skipping third tap.")
@@ -1762,7 +1812,7 @@ def handle_defeat_screen():
                 logging.debug(f"{get_bot_prefix()}Third 'Tap to Proceed' not found. Checking if already on Screen 7...")
                 time.sleep(0.3)
                 check_screen = screenshot_bgr()
-                if check_screen is not None and os.path.exists(next_path):
+                if check_screen is not None and template_exists(next_path):
                     next_check = find_template(check_screen, next_path, threshold=0.75, verbose=False)
                     if next_check:
                         logging.info(f"{get_bot_prefix()}Already on Screen 7. Continuing...")
@@ -1774,7 +1824,7 @@ def handle_defeat_screen():
                 # Found and clicked third tap
                 time.sleep(0.3)
                 # Check if defeat popup appeared after third tap
-                if os.path.exists(back_path):
+                if template_exists(back_path):
                     screen_after_third = screenshot_bgr()
                     if screen_after_third is not None:
                         back_pos = find_template(screen_after_third, back_path, threshold=0.75, verbose=False)
@@ -1793,7 +1843,7 @@ def handle_defeat_screen():
         else:
             time.sleep(0.3)
             # Check if defeat popup appeared after third tap
-            if os.path.exists(back_path):
+            if template_exists(back_path):
                 screen_after_third = screenshot_bgr()
                 if screen_after_third is not None:
                     back_pos = find_template(screen_after_third, back_path, threshold=0.75, verbose=False)
@@ -1806,7 +1856,7 @@ def handle_defeat_screen():
                             logging.warning(f"{get_bot_prefix()}Failed to click Back button")
     
     # Look for "Next" button
-    if not os.path.exists(next_path):
+    if not template_exists(next_path):
         logging.error(f"{get_bot_prefix()}Template next.png not found at {next_path}")
         logging.error(f"{get_bot_prefix()}Please ensure next.png exists in templates/battle/summary/")
         return False
@@ -1839,7 +1889,7 @@ def handle_defeat_popup():
     
     back_path = get_template_path("back.png", SCREEN_DEFEAT_POPUP_DIR)
     
-    if not os.path.exists(back_path):
+    if not template_exists(back_path):
         logging.error(f"{get_bot_prefix()}Template back.png not found at {back_path}")
         logging.error(f"{get_bot_prefix()}Please ensure back.png exists in templates/battle/defeat_popup/")
         return False
@@ -1874,7 +1924,7 @@ def handle_result_screen():
     # Look for "Tap to Proceed" text
     tap_to_proceed_path = get_template_path("tap_to_proceed.png", SCREEN_3_VICTORY_DIR)
     
-    if not os.path.exists(tap_to_proceed_path):
+    if not template_exists(tap_to_proceed_path):
         logging.error(f"{get_bot_prefix()}Template tap_to_proceed.png not found at {tap_to_proceed_path}")
         logging.error(f"{get_bot_prefix()}Please ensure tap_to_proceed.png exists in templates/battle/result/")
         return False
@@ -1951,7 +2001,7 @@ def handle_screens_4_5_6():
     # Verifica se o template existe
     tap_to_proceed_path = get_template_path("tap_to_proceed.png", SCREEN_4_5_6_DIR)
     
-    if not os.path.exists(tap_to_proceed_path):
+    if not template_exists(tap_to_proceed_path):
         logging.error(f"Template tap_to_proceed.png not found at {tap_to_proceed_path}")
         logging.error("Please ensure tap_to_proceed.png exists in templates/battle/rewards/")
         return False
@@ -2009,7 +2059,7 @@ def handle_screen_7():
     # Procura pelo botão "Next"
     next_path = get_template_path("next.png", SCREEN_7_DIR)
     
-    if not os.path.exists(next_path):
+    if not template_exists(next_path):
         logging.error(f"{get_bot_prefix()}Template next.png not found at {next_path}")
         logging.error(f"{get_bot_prefix()}Please ensure next.png exists in templates/battle/summary/")
         return False
@@ -2038,7 +2088,7 @@ def handle_screen_8_quick():
     """
     ok_path = get_template_path("ok.png", SCREEN_8_DIR)
     
-    if not os.path.exists(ok_path):
+    if not template_exists(ok_path):
         return True
     
     # Verificação rápida (apenas 1 tentativa)
@@ -2075,7 +2125,7 @@ def handle_screen_8():
     # Procura pelo botão "OK"
     ok_path = get_template_path("ok.png", SCREEN_8_DIR)
     
-    if not os.path.exists(ok_path):
+    if not template_exists(ok_path):
         logging.debug(f"Template ok.png not found at {ok_path}")
         logging.debug(f"{get_bot_prefix()}Screen 8 may not appear. Continuing...")
         return True
@@ -2443,7 +2493,7 @@ def run_battle_cycle():
         logging.warning(f"{get_bot_prefix()}Screen not recognized. Trying to start from beginning...")
         # Check if hourglass template exists
         hourglass_path = get_template_path("hourglass.png", SCREEN_1_BATTLE_SELECTION_DIR)
-        if not os.path.exists(hourglass_path):
+        if not template_exists(hourglass_path):
             logging.error(f"Template hourglass.png not found at {hourglass_path}")
             logging.error("Please save hourglass.png in templates/battle/battle_selection/")
             return False